@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import os
+import time
+
+from bg_ai.agents.agent import Agent
+from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+from bg_ai.sim.sim_runner import SimConfig, SimRunner
+from bg_ai.stats.memory_store import InMemoryStatsStore
+
+
+NUM_MATCHES = 2_000
+MAX_TURNS = 50
+
+
+def _run(workers: int) -> float:
+    store = InMemoryStatsStore()
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    config = SimConfig(
+        game_config={"actors": ["A", "B"], "max_turns": MAX_TURNS},
+        num_matches=NUM_MATCHES,
+        seed=123,
+        max_ticks=10 * MAX_TURNS,
+        workers=workers,
+    )
+
+    t0 = time.perf_counter()
+    SimRunner().run_matches(
+        game=BuyPlayGame(),
+        config=config,
+        agents_by_id=agents,
+        stats_store=store,
+        stats_query=store,
+    )
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    worker_counts = [w for w in (1, 2, 4, 8, 16, 32) if w <= cpus] or [1]
+
+    print("=" * 60)
+    print(f"SIM PARALLEL SCALING — {NUM_MATCHES} BuyPlay matches x {MAX_TURNS} turns ({cpus} cpus)")
+    print("=" * 60)
+
+    base = None
+    for w in worker_counts:
+        elapsed = _run(w)
+        if base is None:
+            base = elapsed
+        speedup = base / elapsed if elapsed > 0 else float("inf")
+        print(f"workers={w:2d}  {elapsed:8.3f}s  speedup={speedup:5.2f}x  efficiency={speedup / w:5.1%}")
+
+
+if __name__ == "__main__":
+    main()
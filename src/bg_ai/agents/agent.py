@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 from bg_ai.policies.base import Policy
 
@@ -9,3 +10,4 @@ from bg_ai.policies.base import Policy
 class Agent:
     actor_id: str
     policy: Policy
+    decision_timeout_s: Optional[float] = None  # S37: overrides MatchConfig.decision_timeout_s
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from time import perf_counter_ns
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bg_ai.agents.agent import Agent
+from bg_ai.engine.checkpoint import Checkpoint
+from bg_ai.engine.match_runner import MatchConfig, MatchLoop
+from bg_ai.engine.timing import SECTION_DECIDE, TimingCollector
+from bg_ai.events.sink import EventSink
+from bg_ai.games.base import Game, MatchResult
+from bg_ai.policies.base import DecisionContext, Policy
+from bg_ai.stats.base import StatsQuery
+
+
+async def decide_async(policy: Policy, ctx: DecisionContext) -> Any:
+    """
+    Call policy.decide(ctx), awaiting the result if the policy is async.
+    """
+    action = policy.decide(ctx)
+    if inspect.isawaitable(action):
+        action = await action
+    return action
+
+
+def _settle(fut: "asyncio.Future[Any]", value: Any, error: Optional[BaseException]) -> None:
+    if fut.done():  # timed out and cancelled: result discarded
+        return
+    if error is not None:
+        fut.set_exception(error)
+    else:
+        fut.set_result(value)
+
+
+def _run_on_thread(fn: Any, arg: Any) -> "asyncio.Future[Any]":
+    # S37: one daemon thread per budgeted call (as _call_with_timeout), not the
+    # loop's shared executor: abandoned overrunning calls must not hold the
+    # workers later decisions would queue behind.
+    loop = asyncio.get_running_loop()
+    fut: "asyncio.Future[Any]" = loop.create_future()
+
+    def run() -> None:
+        value, error = None, None
+        try:
+            value = fn(arg)
+        except BaseException as exc:  # re-raised by the awaiting task
+            error = exc
+        try:
+            loop.call_soon_threadsafe(_settle, fut, value, error)
+        except RuntimeError:  # loop closed while this call overran
+            pass
+
+    threading.Thread(target=run, name="bg_ai-decide", daemon=True).start()
+    return fut
+
+
+async def _decide_off_loop(policy: Policy, ctx: DecisionContext) -> Any:
+    # S37: sync decide runs on its own thread so it cannot block the event
+    # loop; an awaitable it returns (sync wrapper around an async policy) is
+    # awaited here, under the same budget.
+    if inspect.iscoroutinefunction(policy.decide):
+        return await decide_async(policy, ctx)
+    action = await _run_on_thread(policy.decide, ctx)
+    if inspect.isawaitable(action):
+        action = await action
+    return action
+
+
+async def _decide_timed(loop: MatchLoop, ctx: DecisionContext) -> Any:
+    agent = loop.agent(ctx.actor_id)
+    policy = agent.policy
+    budget = loop.budget(agent)
+    if budget is None and loop.timings is None:
+        return await decide_async(policy, ctx)
+
+    # Wall-clock latency of the (possibly awaited) decision.
+    t0 = perf_counter_ns()
+    if budget is None:
+        action = await decide_async(policy, ctx)
+    else:
+        # S37: awaited work is cancelled on timeout; an overrunning worker
+        # thread is abandoned, its result discarded.
+        try:
+            action = await asyncio.wait_for(_decide_off_loop(policy, ctx), budget)
+        except asyncio.TimeoutError:
+            return loop.timeout_fallback(ctx, budget, perf_counter_ns() - t0)
+    if loop.timings is not None:
+        loop.timings.record(loop.game.game_id, SECTION_DECIDE, ctx.actor_id, perf_counter_ns() - t0)
+    return action
+
+
+class AsyncMatchRunner:
+    """
+    S35: asyncio version of MatchRunner.
+
+    - policies may define `async def decide(ctx)` (sync policies work too)
+    - all actors of a tick decide concurrently (they all see the same state)
+    - events are emitted after the tick's decisions are gathered, in actor
+      order, so each match's trace is identical to MatchRunner's
+    - run_matches() runs many matches concurrently on one event loop;
+      use one sink per match so each trace stays in idx order
+    - S36: timings record awaited wall-clock latency for SECTION_DECIDE
+    - S37: decision budgets use asyncio.wait_for (see MatchRunner)
+    """
+
+    async def run_match(
+            self,
+            game: Game,
+            sink: EventSink,
+            config: MatchConfig,
+            agents_by_id: Optional[Dict[str, Agent]] = None,
+            stats_query: Optional[StatsQuery] = None,
+            timings: Optional[TimingCollector] = None,
+            decision_timeouts: Optional[Dict[str, int]] = None,
+            resume_from: Optional[Checkpoint] = None,
+    ) -> Tuple[str, MatchResult]:
+        loop = MatchLoop(
+            game,
+            sink,
+            config,
+            agents_by_id=agents_by_id,
+            stats_query=stats_query,
+            timings=timings,
+            decision_timeouts=decision_timeouts,
+            resume_from=resume_from,
+        )
+
+        while True:
+            actor_ids = loop.begin_tick()
+            if actor_ids is None:
+                break
+
+            if len(actor_ids) == 1:
+                actor_id = actor_ids[0]
+                ctx = loop.request(actor_id)
+                loop.provide(actor_id, await _decide_timed(loop, ctx))
+            elif actor_ids:
+                contexts = [loop.context(actor_id) for actor_id in actor_ids]
+                actions = await asyncio.gather(*(_decide_timed(loop, ctx) for ctx in contexts))
+                for actor_id, action in zip(actor_ids, actions):
+                    loop.emit_requested(actor_id)
+                    loop.provide(actor_id, action)
+
+            loop.end_tick()
+
+        result = loop.finish()
+        return loop.match_id, result
+
+    async def run_matches(
+            self,
+            game: Game,
+            sinks: Sequence[EventSink],
+            configs: Sequence[MatchConfig],
+            agents_by_id: Optional[Dict[str, Agent]] = None,
+            stats_query: Optional[StatsQuery] = None,
+            timings: Optional[TimingCollector] = None,
+            decision_timeouts: Optional[Dict[str, int]] = None,
+    ) -> List[Tuple[str, MatchResult]]:
+        """
+        Run one match per (sink, config) concurrently; results are in config order.
+        """
+        if len(sinks) != len(configs):
+            raise ValueError(f"AsyncMatchRunner needs one sink per config ({len(sinks)} sinks, {len(configs)} configs)")
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self.run_match(
+                        game,
+                        sink,
+                        cfg,
+                        agents_by_id=agents_by_id,
+                        stats_query=stats_query,
+                        timings=timings,
+                        decision_timeouts=decision_timeouts,
+                    )
+                    for sink, cfg in zip(sinks, configs)
+                )
+            )
+        )
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from time import perf_counter_ns
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from bg_ai.agents.agent import Agent
+from bg_ai.engine.match_runner import MatchConfig, MatchLoop
+from bg_ai.engine.timing import SECTION_DECIDE, TimingCollector
+from bg_ai.events.sink import EventSink
+from bg_ai.games.base import Game, MatchResult
+from bg_ai.policies.base import DecisionContext, decide_batch
+from bg_ai.stats.base import StatsQuery
+
+
+class BatchMatchRunner:
+    """
+    S31: runs K independent matches of the same Game in lockstep.
+
+    Each tick, every still-running match is advanced by one tick. Decisions are
+    gathered per agent across matches and sent in one Policy.decide_batch call
+    (or a decide() loop for policies without it).
+
+    Each match gets its own sink and config; traces, results and RNG streams
+    are identical to running the same configs through MatchRunner one by one.
+    Decision rounds follow each match's own actor order, so turn-based games
+    batch naturally (round r = the r-th actor of every match this tick).
+
+    S36: with timings, each decide_batch call is one SECTION_DECIDE sample.
+
+    S37: agents with a decision budget are decided one context at a time
+    (MatchLoop.decide), so each decision gets its own budget and fallback.
+    """
+
+    def run_matches(
+            self,
+            game: Game,
+            sinks: Sequence[EventSink],
+            configs: Sequence[MatchConfig],
+            agents_by_id: Optional[Dict[str, Agent]] = None,
+            stats_query: Optional[StatsQuery] = None,
+            timings: Optional[TimingCollector] = None,
+            decision_timeouts: Optional[Dict[str, int]] = None,
+    ) -> List[Tuple[str, MatchResult]]:
+        if len(sinks) != len(configs):
+            raise ValueError(f"BatchMatchRunner needs one sink per config ({len(sinks)} sinks, {len(configs)} configs)")
+
+        loops = [
+            MatchLoop(
+                game,
+                sink,
+                cfg,
+                agents_by_id=agents_by_id,
+                stats_query=stats_query,
+                timings=timings,
+                decision_timeouts=decision_timeouts,
+            )
+            for sink, cfg in zip(sinks, configs)
+        ]
+        results: List[Optional[MatchResult]] = [None] * len(loops)
+
+        active = list(range(len(loops)))
+        while active:
+            # Start the tick everywhere; finished matches drop out.
+            ticking: List[Tuple[int, List[str]]] = []
+            for i in active:
+                actor_ids = loops[i].begin_tick()
+                if actor_ids is None:
+                    results[i] = loops[i].finish()
+                else:
+                    ticking.append((i, actor_ids))
+
+            rounds = max((len(actor_ids) for _, actor_ids in ticking), default=0)
+            for r in range(rounds):
+                # actor_id -> [(match index, ctx)] for this decision round
+                pending: Dict[str, List[Tuple[int, DecisionContext]]] = {}
+                for i, actor_ids in ticking:
+                    if r < len(actor_ids):
+                        actor_id = actor_ids[r]
+                        pending.setdefault(actor_id, []).append((i, loops[i].request(actor_id)))
+
+                for actor_id, items in pending.items():
+                    agent = loops[items[0][0]].agent(actor_id)
+                    if any(loops[i].budget(agent) is not None for i, _ in items):
+                        for i, ctx in items:
+                            loops[i].provide(actor_id, loops[i].decide(ctx))
+                        continue
+
+                    policy = agent.policy
+                    t0 = perf_counter_ns() if timings is not None else 0
+                    actions = decide_batch(policy, [ctx for _, ctx in items])
+                    if timings is not None:
+                        timings.record(game.game_id, SECTION_DECIDE, actor_id, perf_counter_ns() - t0)
+                    for (i, _ctx), action in zip(items, actions):
+                        loops[i].provide(actor_id, action)
+
+            for i, _actor_ids in ticking:
+                loops[i].end_tick()
+
+            active = [i for i, _ in ticking]
+
+        return [(loop.match_id, result) for loop, result in zip(loops, results)]  # type: ignore[misc]
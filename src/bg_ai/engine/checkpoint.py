@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import base64
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from bg_ai.engine.rng import DEFAULT_RNG_BACKEND
+from bg_ai.events.model import Event
+
+
+def encode_snapshot(snapshot: Any) -> Dict[str, Any]:
+    """
+    S38: wrap a game snapshot for a JSON event payload (bytes are base64-encoded).
+    """
+    if isinstance(snapshot, (bytes, bytearray)):
+        return {"state_b64": base64.b64encode(bytes(snapshot)).decode("ascii")}
+    return {"state": snapshot}
+
+
+def decode_snapshot(payload: Dict[str, Any]) -> Any:
+    if "state_b64" in payload:
+        return base64.b64decode(payload["state_b64"])
+    return payload["state"]
+
+
+def require_snapshots(game: Any) -> None:
+    if not (callable(getattr(game, "snapshot_state", None)) and callable(getattr(game, "restore_state", None))):
+        raise TypeError(f"{type(game).__name__} does not implement snapshot_state/restore_state")
+
+
+@dataclass(frozen=True, slots=True)
+class Checkpoint:
+    """
+    S38: where to resume a match: the latest state_snapshot of a match log.
+
+    RNG streams are forked per tick from the match seed, so (seed, backend, tick)
+    is the full RNG position. idx is the snapshot event's idx; the resumed match
+    continues at idx + 1, so the log truncated after the snapshot plus the
+    resumed events equals the uninterrupted log.
+    """
+    match_id: str
+    idx: int
+    tick: int
+    seed: int
+    rng_backend: str
+    state: Any  # the game's snapshot_state() value
+
+    @classmethod
+    def latest(cls, events: Iterable[Event], match_id: Optional[str] = None) -> "Checkpoint":
+        """
+        Checkpoint from the last state_snapshot in events (events after it are ignored).
+
+        For logs holding several matches (SimRunner / JsonlFileSink), pass
+        match_id; without it, snapshots of more than one match are an error.
+        """
+        last = None
+        for ev in events:
+            if ev.type != "state_snapshot" or (match_id is not None and ev.match_id != match_id):
+                continue
+            if match_id is None and last is not None and ev.match_id != last.match_id:
+                raise ValueError(
+                    f"Cannot resume: state_snapshot events of several matches "
+                    f"({last.match_id!r}, {ev.match_id!r}); pass match_id"
+                )
+            last = ev
+        if last is None:
+            which = "" if match_id is None else f" for match_id={match_id!r}"
+            raise ValueError(f"Cannot resume: no state_snapshot event{which}")
+        return cls.from_event(last)
+
+    @classmethod
+    def from_event(cls, ev: Event) -> "Checkpoint":
+        """
+        Checkpoint from one state_snapshot event.
+        """
+        p = ev.payload
+        return cls(
+            match_id=ev.match_id,
+            idx=ev.idx,
+            tick=int(p["tick"]),
+            seed=int(p["rng_seed"]),
+            rng_backend=str(p.get("rng_backend", DEFAULT_RNG_BACKEND)),
+            state=decode_snapshot(p),
+        )
@@ -1,18 +1,58 @@
 from __future__ import annotations
 
 import secrets
+import threading
+from time import perf_counter_ns
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from bg_ai.agents.agent import Agent
+from bg_ai.engine.checkpoint import Checkpoint, encode_snapshot, require_snapshots
 from bg_ai.engine.ids import new_match_id
-from bg_ai.engine.rng import RNG
+from bg_ai.engine.rng import DEFAULT_RNG_BACKEND, RNG, RNG_BACKENDS
+from bg_ai.engine.timing import SECTION_DECIDE, SECTION_DECISION_TIMEOUT, TimingCollector, instrument
 from bg_ai.events.model import Event
-from bg_ai.events.sink import EventSink
+from bg_ai.events.sink import EventSink, filter_types
 from bg_ai.games.base import Game, MatchResult
 from bg_ai.policies.base import DecisionContext
 from bg_ai.games.action_enum import ActionEnum
 from bg_ai.stats.base import NullStatsQuery, StatsQuery
+from bg_ai.stats.snapshot import pinned
+
+
+# S29: trace levels (which engine event types get built and emitted).
+# Every level keeps seed_set, so any level that also keeps decision_provided replays.
+TRACE_FULL = "full"
+TRACE_DECISIONS = "decisions"
+TRACE_RESULTS_ONLY = "results_only"
+
+TRACE_LEVELS: Dict[str, FrozenSet[str]] = {
+    TRACE_FULL: frozenset(
+        {
+            "seed_set",
+            "match_start",
+            "tick_start",
+            "decision_requested",
+            "decision_timeout",
+            "decision_provided",
+            "actions_applied",
+            "domain_event",
+            "tick_end",
+            "state_snapshot",
+            "match_end",
+        }
+    ),
+    TRACE_DECISIONS: frozenset(
+        {"seed_set", "match_start", "decision_timeout", "decision_provided", "state_snapshot", "match_end"}
+    ),
+    # S38: snapshots are only emitted when MatchConfig.snapshot_every is set, at any level.
+    TRACE_RESULTS_ONLY: frozenset({"seed_set", "match_start", "state_snapshot", "match_end"}),
+}
+
+# S37: what a policy that overruns its decision budget plays instead.
+TIMEOUT_FALLBACK_FIRST_LEGAL = "first_legal"
+TIMEOUT_FALLBACK_RANDOM = "random"  # uniform over legal actions, from a fresh fork of the policy's RNG scope
+TIMEOUT_FALLBACKS = (TIMEOUT_FALLBACK_FIRST_LEGAL, TIMEOUT_FALLBACK_RANDOM)
 
 
 @dataclass(frozen=True, slots=True)
@@ -20,157 +60,527 @@ class MatchConfig:
     game_config: Dict[str, Any]
     seed: Optional[int] = None
     max_ticks: int = 10_000  # safety guard
+    trace_level: str = TRACE_FULL
+    rng_backend: str = DEFAULT_RNG_BACKEND  # S32; recorded in seed_set when not the default
+    # S37: per-decision wall-clock budget (Agent.decision_timeout_s overrides); None = unlimited
+    decision_timeout_s: Optional[float] = None
+    timeout_fallback: str = TIMEOUT_FALLBACK_FIRST_LEGAL
+    # S38: emit state_snapshot every N ticks (needs Game.snapshot_state/restore_state); None = off
+    snapshot_every: Optional[int] = None
+    # S51: read stats_query.snapshot() once at match start; every decision of the match sees it
+    pin_stats: bool = False
+
+    def __post_init__(self) -> None:
+        if self.trace_level not in TRACE_LEVELS:
+            raise ValueError(
+                f"Unknown trace_level {self.trace_level!r}; expected one of {sorted(TRACE_LEVELS)}"
+            )
+        if self.rng_backend not in RNG_BACKENDS:
+            raise ValueError(
+                f"Unknown rng_backend {self.rng_backend!r}; expected one of {list(RNG_BACKENDS)}"
+            )
+        if self.decision_timeout_s is not None and self.decision_timeout_s <= 0:
+            raise ValueError("MatchConfig.decision_timeout_s must be > 0 (or None)")
+        if self.timeout_fallback not in TIMEOUT_FALLBACKS:
+            raise ValueError(
+                f"Unknown timeout_fallback {self.timeout_fallback!r}; expected one of {list(TIMEOUT_FALLBACKS)}"
+            )
+        if self.snapshot_every is not None and self.snapshot_every <= 0:
+            raise ValueError("MatchConfig.snapshot_every must be > 0 (or None)")
 
 
-class MatchRunner:
+def _call_with_timeout(fn: Any, arg: Any, timeout_s: float) -> Tuple[bool, Any]:
     """
-    Runs a match tick-by-tick and emits canonical engine events.
+    S37: run fn(arg) on a daemon thread and wait up to timeout_s.
 
-    S6 adds:
-    - agent/policy decision wiring
-    - decision_requested / decision_provided events
-    - actions_applied events
+    Returns (True, value) when it finished in time, (False, None) otherwise.
+    Python threads cannot be killed: an overrunning call keeps running in the
+    background and its result is discarded. Exceptions are re-raised here.
     """
+    box: Dict[str, Any] = {}
 
-    def run_match(
-            self,
-            game: Game,
-            sink: EventSink,
-            config: MatchConfig,
-            agents_by_id: Optional[Dict[str, Agent]] = None,
-            stats_query: Optional[StatsQuery] = None,
-    ) -> Tuple[str, MatchResult]:
-        match_id = new_match_id()
+    def run() -> None:
+        try:
+            box["value"] = fn(arg)
+        except BaseException as exc:  # re-raised in the calling thread
+            box["error"] = exc
 
-        seed = config.seed if config.seed is not None else secrets.randbits(64)
-        rng = RNG.from_seed(int(seed))
+    worker = threading.Thread(target=run, name="bg_ai-decide", daemon=True)
+    worker.start()
+    worker.join(timeout_s)
+    if worker.is_alive():
+        return False, None
+    if "error" in box:
+        raise box["error"]
+    return True, box["value"]
 
-        idx = 0
-        tick = 0
 
-        sink.emit(Event(match_id=match_id, idx=idx, tick=0, type="seed_set", payload={"seed": int(seed)}))
-        idx += 1
+class MatchLoop:
+    """
+    S31: one match's tick loop as explicit steps.
 
-        sink.emit(Event(match_id=match_id, idx=idx, tick=0, type="match_start", payload={"game_id": game.game_id}))
-        idx += 1
+    MatchRunner drives it sequentially; other runners (e.g. BatchMatchRunner)
+    drive several loops side by side. Event order, idx numbering and RNG scopes
+    are defined here once, so every runner produces identical traces.
 
-        state = game.initial_state(rng.fork("game:init"), dict(config.game_config))
+    Per tick:
+        actor_ids = loop.begin_tick()     # None once the game is terminal
+        for actor_id in actor_ids:
+            ctx = loop.request(actor_id)
+            loop.provide(actor_id, action)
+        loop.end_tick()
+    then:
+        result = loop.finish()
 
-        if stats_query is None:
-            stats_query = NullStatsQuery()
+    The constructor emits seed_set/match_start and builds the initial state.
 
-        while True:
-            if game.is_terminal(state):
-                break
-            if tick >= config.max_ticks:
-                raise RuntimeError(f"max_ticks reached ({config.max_ticks}); possible infinite match loop")
-
-            sink.emit(Event(match_id=match_id, idx=idx, tick=tick, type="tick_start", payload={"tick": tick}))
-            idx += 1
-
-            actor_ids = game.current_actor_ids(state)
-            actions_by_actor: Dict[str, Any] = {}
+    S38: with resume_from (a Checkpoint) it instead restores the snapshot and
+    continues that match's ids: same match_id, tick, RNG streams and idx.
+    """
 
-            # If the game requests actions, we must have agents for those actors.
-            if actor_ids:
-                if not agents_by_id:
-                    raise RuntimeError("Game requested actions but no agents_by_id were provided.")
+    __slots__ = (
+        "game",
+        "sink",
+        "config",
+        "agents_by_id",
+        "stats_query",
+        "timings",
+        "decision_timeouts",
+        "match_id",
+        "seed",
+        "rng_backend",
+        "rng",
+        "state",
+        "idx",
+        "tick",
+        "_actor_ids",
+        "_actions_by_actor",
+        "_timed_out",
+        "_next_snapshot",
+        "_t_tick_start",
+        "_t_tick_end",
+        "_t_requested",
+        "_t_timeout",
+        "_t_provided",
+        "_t_applied",
+        "_t_domain",
+        "_t_end",
+        "_t_snapshot",
+    )
+
+    def __init__(
+            self,
+            game: Game,
+            sink: EventSink,
+            config: MatchConfig,
+            agents_by_id: Optional[Dict[str, Agent]] = None,
+            stats_query: Optional[StatsQuery] = None,
+            timings: Optional[TimingCollector] = None,
+            decision_timeouts: Optional[Dict[str, int]] = None,
+            resume_from: Optional[Checkpoint] = None,
+    ) -> None:
+        self.config = config
+        self.agents_by_id = agents_by_id
+        self.stats_query = stats_query if stats_query is not None else NullStatsQuery()
+        if config.pin_stats:
+            self.stats_query = pinned(self.stats_query) or self.stats_query
+        self.timings = timings
+        # S37: actor_id -> number of decisions that overran their budget (caller-owned, may span matches)
+        self.decision_timeouts = decision_timeouts if decision_timeouts is not None else {}
+
+        if resume_from is None:
+            self.match_id = new_match_id()
+            self.seed = int(config.seed if config.seed is not None else secrets.randbits(64))
+            self.rng_backend = config.rng_backend
+        else:
+            self.match_id = resume_from.match_id
+            self.seed = resume_from.seed
+            self.rng_backend = resume_from.rng_backend
+        rng = RNG.from_seed(self.seed, self.rng_backend)
+
+        # Resolve trace level + sink interest once per run (plain bools in the hot loop).
+        traced = filter_types(TRACE_LEVELS[config.trace_level], sink)
+
+        if timings is None:
+            self.game, self.sink, self.rng = game, sink, rng
+        else:
+            # S36: timed proxies only exist when instrumentation is on.
+            self.game, self.sink, self.rng = instrument(game, sink, rng, timings)
+        self._t_tick_start = "tick_start" in traced
+        self._t_tick_end = "tick_end" in traced
+        self._t_requested = "decision_requested" in traced
+        self._t_timeout = "decision_timeout" in traced
+        self._t_provided = "decision_provided" in traced
+        self._t_applied = "actions_applied" in traced
+        self._t_domain = "domain_event" in traced
+        self._t_end = "match_end" in traced
+        self._t_snapshot = "state_snapshot" in traced
+
+        self._actor_ids: List[str] = []
+        self._actions_by_actor: Dict[str, Any] = {}
+        self._timed_out: Dict[str, float] = {}
+
+        every = config.snapshot_every
+        if every is not None or resume_from is not None:
+            require_snapshots(game)
+
+        if resume_from is not None:
+            # O(1) restart: no seed_set/match_start, no replay of earlier ticks.
+            self.idx = resume_from.idx + 1
+            self.tick = resume_from.tick
+            self.state = game.restore_state(resume_from.state)
+            self._next_snapshot = -1 if every is None else (self.tick // every + 1) * every
+            return
+
+        self.idx = 0
+        self.tick = 0
+        self._next_snapshot = -1 if every is None else every
+
+        if "seed_set" in traced:
+            seed_payload: Dict[str, Any] = {"seed": self.seed}
+            if config.rng_backend != DEFAULT_RNG_BACKEND:
+                # Only non-default backends are recorded, so default logs stay byte-identical.
+                seed_payload["rng_backend"] = config.rng_backend
+            self.sink.emit(Event(match_id=self.match_id, idx=self.idx, tick=0, type="seed_set", payload=seed_payload))
+        self.idx += 1
+
+        if "match_start" in traced:
+            self.sink.emit(
+                Event(match_id=self.match_id, idx=self.idx, tick=0, type="match_start", payload={"game_id": game.game_id})
+            )
+        self.idx += 1
+
+        self.state = self.game.initial_state(self.rng.fork("game:init"), dict(config.game_config))
+
+    def begin_tick(self) -> Optional[List[str]]:
+        """
+        Start the next tick and return the actors that must decide (possibly empty).
+        Returns None when the game is terminal.
+        """
+        if self.game.is_terminal(self.state):
+            return None
+        if self.tick >= self.config.max_ticks:
+            raise RuntimeError(f"max_ticks reached ({self.config.max_ticks}); possible infinite match loop")
+
+        if self.tick == self._next_snapshot:
+            self._next_snapshot += self.config.snapshot_every
+            self.emit_snapshot()
+
+        if self._t_tick_start:
+            self.sink.emit(
+                Event(match_id=self.match_id, idx=self.idx, tick=self.tick, type="tick_start", payload={"tick": self.tick})
+            )
+        self.idx += 1
+
+        actor_ids = self.game.current_actor_ids(self.state)
+
+        # If the game requests actions, we must have agents for those actors.
+        if actor_ids and not self.agents_by_id:
+            raise RuntimeError("Game requested actions but no agents_by_id were provided.")
+
+        self._actor_ids = actor_ids
+        self._actions_by_actor = {}
+        self._timed_out = {}
+        return actor_ids
+
+    def emit_snapshot(self) -> None:
+        """
+        S38: emit state_snapshot for the state at the start of this tick.
+        """
+        if self._t_snapshot:
+            payload: Dict[str, Any] = {"tick": self.tick, "rng_seed": self.seed, "rng_backend": self.rng_backend}
+            payload.update(encode_snapshot(self.game.snapshot_state(self.state)))
+            self.sink.emit(
+                Event(match_id=self.match_id, idx=self.idx, tick=self.tick, type="state_snapshot", payload=payload)
+            )
+        self.idx += 1
+
+    def agent(self, actor_id: str) -> Agent:
+        agents_by_id = self.agents_by_id or {}
+        if actor_id not in agents_by_id:
+            raise RuntimeError(f"Missing agent for actor_id={actor_id!r}")
+        return agents_by_id[actor_id]
+
+    def request(self, actor_id: str) -> DecisionContext:
+        """
+        Emit decision_requested for actor_id and build its DecisionContext.
+        """
+        ctx = self.context(actor_id)
+        self.emit_requested(actor_id)
+        return ctx
+
+    def context(self, actor_id: str) -> DecisionContext:
+        """
+        Build actor_id's DecisionContext without emitting anything.
+
+        S35: runners that decide concurrently build all contexts first, then
+        emit emit_requested()/provide() pairs in actor order, which gives the
+        same trace as request()/provide().
+        """
+        self.agent(actor_id)
+
+        legal = self.game.legal_actions(self.state, actor_id)
+        if legal is None:
+            raise RuntimeError("This game returned legal_actions=None; MVP expects a list.")
+
+        return DecisionContext(
+            match_id=self.match_id,
+            tick=self.tick,
+            actor_id=actor_id,
+            state=self.state,
+            # S34: shared tuples are passed through as-is; lists are copied.
+            legal_actions=legal if type(legal) is tuple else list(legal),
+            rng=self.rng.fork(f"policy:{actor_id}:{self.tick}"),
+            game_id=self.game.game_id,
+            stats=self.stats_query,
+        )
 
-                for actor_id in actor_ids:
-                    if actor_id not in agents_by_id:
-                        raise RuntimeError(f"Missing agent for actor_id={actor_id!r}")
+    def decide(self, ctx: DecisionContext) -> Any:
+        """
+        Call the acting agent's policy (timed when a TimingCollector is active).
+
+        S37: with a decision budget the policy runs on a worker thread; if it
+        overruns, the configured fallback action is returned instead.
+        """
+        agent = self.agent(ctx.actor_id)
+        policy = agent.policy
+        budget = self.budget(agent)
+        timings = self.timings
+        if budget is None:
+            if timings is None:
+                return policy.decide(ctx)
+            t0 = perf_counter_ns()
+            action = policy.decide(ctx)
+            timings.record(self.game.game_id, SECTION_DECIDE, ctx.actor_id, perf_counter_ns() - t0)
+            return action
+
+        t0 = perf_counter_ns()
+        done, action = _call_with_timeout(policy.decide, ctx, budget)
+        if not done:
+            return self.timeout_fallback(ctx, budget, perf_counter_ns() - t0)
+        if timings is not None:
+            timings.record(self.game.game_id, SECTION_DECIDE, ctx.actor_id, perf_counter_ns() - t0)
+        return action
+
+    def budget(self, agent: Agent) -> Optional[float]:
+        """
+        S37: the agent's decision budget in seconds (Agent overrides MatchConfig).
+        """
+        if agent.decision_timeout_s is not None:
+            return agent.decision_timeout_s
+        return self.config.decision_timeout_s
+
+    def timeout_fallback(self, ctx: DecisionContext, budget: float, elapsed_ns: int) -> Any:
+        """
+        S37: record a blown budget for ctx.actor_id and return its fallback action.
+
+        The fallback only depends on the legal actions and the match seed (the
+        random fallback uses a fresh fork of the policy's RNG scope, untouched by
+        the abandoned call), and provide() logs it in decision_provided, so
+        replays reproduce it without re-running the policy.
+        """
+        legal = ctx.legal_actions
+        if not legal:
+            raise RuntimeError(f"Decision timeout for actor_id={ctx.actor_id!r} with no legal actions to fall back to")
+
+        if self.config.timeout_fallback == TIMEOUT_FALLBACK_RANDOM:
+            action = self.rng.fork(f"policy:{ctx.actor_id}:{ctx.tick}").choice(legal)
+        else:
+            action = legal[0]
+
+        self._timed_out[ctx.actor_id] = budget
+        self.decision_timeouts[ctx.actor_id] = self.decision_timeouts.get(ctx.actor_id, 0) + 1
+        if self.timings is not None:
+            self.timings.record(self.game.game_id, SECTION_DECISION_TIMEOUT, ctx.actor_id, elapsed_ns)
+        return action
+
+    def emit_requested(self, actor_id: str) -> None:
+        if self._t_requested:
+            self.sink.emit(
+                Event(
+                    match_id=self.match_id,
+                    idx=self.idx,
+                    tick=self.tick,
+                    type="decision_requested",
+                    payload={"actor_id": actor_id},
+                )
+            )
+        self.idx += 1
 
-                    legal = game.legal_actions(state, actor_id)
-                    if legal is None:
-                        raise RuntimeError("This game returned legal_actions=None; MVP expects a list.")
+    def provide(self, actor_id: str, action: Any) -> None:
+        """
+        Record actor_id's action for this tick and emit decision_provided.
 
-                    sink.emit(
-                        Event(
-                            match_id=match_id,
-                            idx=idx,
-                            tick=tick,
-                            type="decision_requested",
-                            payload={"actor_id": actor_id},
-                        )
-                    )
-                    idx += 1
-
-                    agent = agents_by_id[actor_id]
-                    ctx = DecisionContext(
-                        match_id=match_id,
-                        tick=tick,
-                        actor_id=actor_id,
-                        state=state,
-                        legal_actions=list(legal),
-                        rng=rng.fork(f"policy:{actor_id}:{tick}"),
-                        game_id=game.game_id,
-                        stats=stats_query,
+        S37: a fallback chosen by timeout_fallback() is preceded by decision_timeout.
+        """
+        if actor_id in self._timed_out:
+            if self._t_timeout:
+                self.sink.emit(
+                    Event(
+                        match_id=self.match_id,
+                        idx=self.idx,
+                        tick=self.tick,
+                        type="decision_timeout",
+                        payload={
+                            "actor_id": actor_id,
+                            "timeout_s": self._timed_out[actor_id],
+                            "fallback": self.config.timeout_fallback,
+                        },
                     )
-                    action = agent.policy.decide(ctx)
-                    # Events must stay JSON-serializable.
-                    # If the action is an ActionEnum, we store its wire value.
-                    action_wire = action.to_wire() if isinstance(action, ActionEnum) else action
+                )
+            self.idx += 1
+
+        if self._t_provided:
+            # Events must stay JSON-serializable.
+            # If the action is an ActionEnum, we store its wire value.
+            action_wire = action.to_wire() if isinstance(action, ActionEnum) else action
+
+            self.sink.emit(
+                Event(
+                    match_id=self.match_id,
+                    idx=self.idx,
+                    tick=self.tick,
+                    type="decision_provided",
+                    payload={"actor_id": actor_id, "action": action_wire},
+                )
+            )
+        self.idx += 1
 
-                    sink.emit(
-                        Event(
-                            match_id=match_id,
-                            idx=idx,
-                            tick=tick,
-                            type="decision_provided",
-                            payload={"actor_id": actor_id, "action": action_wire},
-                        )
-                    )
-                    idx += 1
+        self._actions_by_actor[actor_id] = action
 
-                    actions_by_actor[actor_id] = action
+    def end_tick(self) -> None:
+        """
+        Apply this tick's actions (if any actor was asked) and close the tick.
+        """
+        if self._actor_ids:
+            actions_by_actor = self._actions_by_actor
 
-                # Apply actions for this tick
-                state, domain_payloads = game.apply_actions(state, actions_by_actor, rng.fork(f"game:apply:{tick}"))
+            # Apply actions for this tick
+            self.state, domain_payloads = self.game.apply_actions(
+                self.state, actions_by_actor, self.rng.fork(f"game:apply:{self.tick}")
+            )
 
+            if self._t_applied:
                 # For action logging, keep payload JSON-safe (wire strings for enums)
                 actions_wire_by_actor = {
                     k: (v.to_wire() if isinstance(v, ActionEnum) else v) for k, v in actions_by_actor.items()
                 }
 
-                sink.emit(
+                self.sink.emit(
                     Event(
-                        match_id=match_id,
-                        idx=idx,
-                        tick=tick,
+                        match_id=self.match_id,
+                        idx=self.idx,
+                        tick=self.tick,
                         type="actions_applied",
                         payload={"actions": actions_wire_by_actor},
                     )
                 )
-                idx += 1
+            self.idx += 1
 
-                # Optional: game-domain events (payloads are game-defined dicts)
+            # Optional: game-domain events (payloads are game-defined dicts)
+            if self._t_domain:
                 for payload in domain_payloads:
-                    sink.emit(
+                    self.sink.emit(
                         Event(
-                            match_id=match_id,
-                            idx=idx,
-                            tick=tick,
+                            match_id=self.match_id,
+                            idx=self.idx,
+                            tick=self.tick,
                             type="domain_event",
                             payload=dict(payload),
                         )
                     )
-                    idx += 1
+                    self.idx += 1
+            else:
+                self.idx += len(domain_payloads)
 
-            sink.emit(Event(match_id=match_id, idx=idx, tick=tick, type="tick_end", payload={"tick": tick}))
-            idx += 1
+        if self._t_tick_end:
+            self.sink.emit(
+                Event(match_id=self.match_id, idx=self.idx, tick=self.tick, type="tick_end", payload={"tick": self.tick})
+            )
+        self.idx += 1
+
+        self.tick += 1
+
+    def finish(self) -> MatchResult:
+        """
+        Compute the result and emit match_end.
+        """
+        result = self.game.result(self.state)
+        if self._t_end:
+            self.sink.emit(
+                Event(
+                    match_id=self.match_id,
+                    idx=self.idx,
+                    tick=self.tick,
+                    type="match_end",
+                    payload={"outcome": result.outcome, "result": result.details},
+                )
+            )
+        self.idx += 1
+        return result
 
-            tick += 1
 
-        result = game.result(state)
-        sink.emit(
-            Event(
-                match_id=match_id,
-                idx=idx,
-                tick=tick,
-                type="match_end",
-                payload={"outcome": result.outcome, "result": result.details},
-            )
+class MatchRunner:
+    """
+    Runs a match tick-by-tick and emits canonical engine events.
+
+    S6 adds:
+    - agent/policy decision wiring
+    - decision_requested / decision_provided events
+    - actions_applied events
+
+    S29 adds config.trace_level:
+    - event types outside the level are never constructed (no payload dicts)
+    - idx still advances for skipped events, so idx values always match the
+      full trace of the same match (filtered logs stay diffable against full ones)
+
+    S30: the trace level is further narrowed by the sink's declared `interest`
+    (see bg_ai.events.sink.EventSink); the same idx rule applies.
+
+    S31: the loop itself lives in MatchLoop (shared with BatchMatchRunner).
+
+    S36: pass timings=TimingCollector() to collect per-section latencies
+    (decide, legal_actions, apply_actions, rng_fork, sink_emit).
+
+    S37: config.decision_timeout_s / Agent.decision_timeout_s bound each
+    decision; overruns play config.timeout_fallback, emit decision_timeout and
+    are counted per actor in decision_timeouts (if given).
+
+    S38: config.snapshot_every=N emits state_snapshot at the start of every
+    N-th tick; resume_from=Checkpoint.latest(events) continues that match from
+    its last snapshot (config.seed/rng_backend are taken from the checkpoint).
+    """
+
+    def run_match(
+            self,
+            game: Game,
+            sink: EventSink,
+            config: MatchConfig,
+            agents_by_id: Optional[Dict[str, Agent]] = None,
+            stats_query: Optional[StatsQuery] = None,
+            timings: Optional[TimingCollector] = None,
+            decision_timeouts: Optional[Dict[str, int]] = None,
+            resume_from: Optional[Checkpoint] = None,
+    ) -> Tuple[str, MatchResult]:
+        loop = MatchLoop(
+            game,
+            sink,
+            config,
+            agents_by_id=agents_by_id,
+            stats_query=stats_query,
+            timings=timings,
+            decision_timeouts=decision_timeouts,
+            resume_from=resume_from,
         )
-        idx += 1
 
-        return match_id, result
+        while True:
+            actor_ids = loop.begin_tick()
+            if actor_ids is None:
+                break
+            for actor_id in actor_ids:
+                ctx = loop.request(actor_id)
+                loop.provide(actor_id, loop.decide(ctx))
+            loop.end_tick()
+
+        result = loop.finish()
+        return loop.match_id, result
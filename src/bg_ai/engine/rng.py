@@ -2,11 +2,20 @@ from __future__ import annotations
 
 import hashlib
 import random
-from dataclasses import dataclass
-from typing import Iterable, Sequence, TypeVar
+from typing import Iterable, Optional, Sequence, TypeVar
 
 T = TypeVar("T")
 
+# S32: RNG backends. The backend is recorded in seed_set (when not the default)
+# so replays rebuild the same streams.
+RNG_BACKEND_SHA256_MT = "sha256_mt"  # original: SHA-256 fork derivation + Mersenne Twister
+RNG_BACKEND_SPLITMIX64 = "splitmix64"  # keyed BLAKE2b fork derivation + SplitMix64 counter generator
+DEFAULT_RNG_BACKEND = RNG_BACKEND_SHA256_MT
+RNG_BACKENDS = (RNG_BACKEND_SHA256_MT, RNG_BACKEND_SPLITMIX64)
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
 
 def _derive_seed(parent_seed: int, scope: str) -> int:
     """
@@ -21,53 +30,151 @@ def _derive_seed(parent_seed: int, scope: str) -> int:
     return int.from_bytes(digest[:8], "big", signed=False)
 
 
-@dataclass
+def _derive_seed_keyed(parent_seed: int, scope: str) -> int:
+    """
+    splitmix64 backend: derive a child seed with BLAKE2b keyed by the parent seed.
+    Much cheaper than building a SHA-256 message + Mersenne Twister state.
+    """
+    key = (parent_seed & _MASK64).to_bytes(8, "little")
+    digest = hashlib.blake2b(scope.encode("utf-8"), digest_size=8, key=key).digest()
+    return int.from_bytes(digest, "little", signed=False)
+
+
+class _SplitMix64Random(random.Random):
+    """
+    Counter-based SplitMix64 generator behind the stdlib Random API.
+
+    Output n is mix(seed + n * gamma), so construction is O(1) (no 2.5 KB
+    Mersenne Twister seeding). randint/choice/shuffle/sample come from
+    random.Random on top of random() and getrandbits().
+    """
+
+    def __init__(self, seed: int) -> None:
+        self.gauss_next = None
+        self._state = seed & _MASK64
+
+    def seed(self, a: object = None, version: int = 2) -> None:
+        self._state = (a if isinstance(a, int) else 0) & _MASK64
+        self.gauss_next = None
+
+    def getstate(self) -> tuple:
+        return (self._state, self.gauss_next)
+
+    def setstate(self, state: tuple) -> None:
+        self._state, self.gauss_next = state
+
+    def _next64(self) -> int:
+        self._state = z = (self._state + _GOLDEN_GAMMA) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
+
+    def random(self) -> float:
+        # 53 random bits -> [0, 1)
+        return (self._next64() >> 11) * (1.0 / 9007199254740992.0)
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        out = 0
+        filled = 0
+        while filled < k:
+            out |= self._next64() << filled
+            filled += 64
+        return out & ((1 << k) - 1)
+
+
+def _make_generator(seed: int, backend: str) -> random.Random:
+    if backend == RNG_BACKEND_SHA256_MT:
+        return random.Random(seed)
+    if backend == RNG_BACKEND_SPLITMIX64:
+        return _SplitMix64Random(seed)
+    raise ValueError(f"Unknown RNG backend {backend!r}; expected one of {list(RNG_BACKENDS)}")
+
+
 class RNG:
     """
     Deterministic RNG with scoped forks.
 
     - Root RNG is created from a seed.
     - fork(scope) returns a new RNG whose sequence is stable for that scope.
+    - S32: backend selects fork derivation + generator; forks inherit it.
+    - S33: forks are lazy. fork() only records (parent seed, scope); the child
+      seed is derived on first access to .seed (or a nested fork) and the
+      generator is built on the first draw. Seeds and draw sequences are the
+      same as eager forking; forks that are never drawn from cost one small object.
     """
-    seed: int
-    _r: random.Random
+
+    __slots__ = ("_seed", "_r", "_parent_seed", "_scope", "backend")
+
+    def __init__(self, seed: int, _r: Optional[random.Random] = None, backend: str = DEFAULT_RNG_BACKEND) -> None:
+        self._seed: Optional[int] = seed
+        self._r = _r
+        self._parent_seed = 0
+        self._scope: Optional[str] = None
+        self.backend = backend
 
     @classmethod
-    def from_seed(cls, seed: int) -> "RNG":
+    def from_seed(cls, seed: int, backend: str = DEFAULT_RNG_BACKEND) -> "RNG":
         if not isinstance(seed, int):
             raise TypeError(f"seed must be int, got {type(seed).__name__}")
-        return cls(seed=seed, _r=random.Random(seed))
+        return cls(seed=seed, _r=_make_generator(seed, backend), backend=backend)
+
+    @property
+    def seed(self) -> int:
+        seed = self._seed
+        if seed is None:
+            if self.backend == RNG_BACKEND_SHA256_MT:
+                seed = _derive_seed(self._parent_seed, self._scope)  # type: ignore[arg-type]
+            else:
+                seed = _derive_seed_keyed(self._parent_seed, self._scope)  # type: ignore[arg-type]
+            self._seed = seed
+        return seed
 
     def fork(self, scope: str) -> "RNG":
         if not isinstance(scope, str) or not scope:
             raise ValueError("scope must be a non-empty string")
-        child_seed = _derive_seed(self.seed, scope)
-        return RNG.from_seed(child_seed)
+        child = RNG.__new__(RNG)
+        child._seed = None
+        child._r = None
+        child._parent_seed = self.seed
+        child._scope = scope
+        child.backend = self.backend
+        return child
+
+    def _gen(self) -> random.Random:
+        r = self._r
+        if r is None:
+            r = self._r = _make_generator(self.seed, self.backend)
+        return r
+
+    def __repr__(self) -> str:
+        return f"RNG(seed={self.seed}, backend={self.backend!r})"
 
     # ---- Common helpers (wrap stdlib Random) ----
 
     def random(self) -> float:
-        return self._r.random()
+        return self._gen().random()
 
     def randint(self, a: int, b: int) -> int:
-        return self._r.randint(a, b)
+        return self._gen().randint(a, b)
 
     def choice(self, seq: Sequence[T]) -> T:
         if not seq:
             raise ValueError("choice() cannot be called on an empty sequence")
-        return self._r.choice(seq)
+        return self._gen().choice(seq)
 
     def shuffle(self, x: list[T]) -> None:
-        self._r.shuffle(x)
+        self._gen().shuffle(x)
 
     def sample(self, population: Sequence[T], k: int) -> list[T]:
-        return self._r.sample(population, k)
+        return self._gen().sample(population, k)
 
     def uniform(self, a: float, b: float) -> float:
-        return self._r.uniform(a, b)
+        return self._gen().uniform(a, b)
 
     def randrange(self, *args: int) -> int:
-        return self._r.randrange(*args)
+        return self._gen().randrange(*args)
 
     def getrandbits(self, k: int) -> int:
-        return self._r.getrandbits(k)
+        return self._gen().getrandbits(k)
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import Any, Dict, List, Optional, Tuple
+
+from bg_ai.engine.rng import RNG
+from bg_ai.events.model import Event
+
+# S36: instrumented sections of the match loop.
+SECTION_DECIDE = "decide"
+SECTION_LEGAL_ACTIONS = "legal_actions"
+SECTION_APPLY_ACTIONS = "apply_actions"
+# Forks are lazy (S33): rng_fork samples the child seed derivation and the
+# generator build when they actually run (first .seed / first draw), not fork().
+SECTION_RNG_FORK = "rng_fork"
+SECTION_SINK_EMIT = "sink_emit"
+# S37: one sample per decision that overran its budget (ns waited before falling back)
+SECTION_DECISION_TIMEOUT = "decision_timeout"
+
+# Sections that are not attributed to one agent use this actor key.
+ANY_ACTOR = "*"
+
+
+@dataclass
+class Histogram:
+    """
+    Latency histogram with power-of-two buckets (bucket k holds ns with bit_length k).
+    """
+    count: int = 0
+    total_ns: int = 0
+    min_ns: Optional[int] = None
+    max_ns: int = 0
+    buckets: Dict[int, int] = field(default_factory=dict)
+
+    def add(self, ns: int) -> None:
+        self.count += 1
+        self.total_ns += ns
+        if self.min_ns is None or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        k = ns.bit_length()
+        self.buckets[k] = self.buckets.get(k, 0) + 1
+
+    def merge(self, other: "Histogram") -> None:
+        self.count += other.count
+        self.total_ns += other.total_ns
+        if other.min_ns is not None and (self.min_ns is None or other.min_ns < self.min_ns):
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        for k, n in other.buckets.items():
+            self.buckets[k] = self.buckets.get(k, 0) + n
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": (self.total_ns / self.count) if self.count else 0.0,
+            "min_ns": self.min_ns or 0,
+            "max_ns": self.max_ns,
+            # upper bound (exclusive) of each bucket in ns -> count
+            "buckets": {str(1 << k): n for k, n in sorted(self.buckets.items())},
+        }
+
+
+class TimingCollector:
+    """
+    S36: opt-in perf_counter_ns accumulator for the match loop.
+
+    Samples are keyed by (game_id, section, actor_id); sections that are not
+    per-agent use ANY_ACTOR. Pass one to MatchRunner.run_match(timings=...)
+    or enable SimConfig/SeriesConfig.collect_timings. When no collector is
+    given, the loop runs uninstrumented.
+    """
+
+    def __init__(self) -> None:
+        self._hists: Dict[Tuple[str, str, str], Histogram] = {}
+
+    def record(self, game_id: str, section: str, actor_id: str, ns: int) -> None:
+        key = (game_id, section, actor_id)
+        hist = self._hists.get(key)
+        if hist is None:
+            hist = self._hists[key] = Histogram()
+        hist.add(ns)
+
+    def merge(self, other: "TimingCollector") -> None:
+        for key, hist in other._hists.items():
+            mine = self._hists.get(key)
+            if mine is None:
+                mine = self._hists[key] = Histogram()
+            mine.merge(hist)
+
+    def histogram(self, game_id: str, section: str, actor_id: str = ANY_ACTOR) -> Histogram:
+        return self._hists.get((game_id, section, actor_id)) or Histogram()
+
+    def report(self) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """
+        JSON-safe nested report: game_id -> section -> actor_id -> histogram dict.
+        """
+        out: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        for (game_id, section, actor_id), hist in sorted(self._hists.items()):
+            out.setdefault(game_id, {}).setdefault(section, {})[actor_id] = hist.to_dict()
+        return out
+
+    def format_report(self) -> List[str]:
+        """
+        One human-readable line per (game, section, actor), slowest total first.
+        """
+        rows = sorted(self._hists.items(), key=lambda kv: kv[1].total_ns, reverse=True)
+        return [
+            f"{game_id} {section:<14} {actor_id:<8} n={h.count:<8d} "
+            f"total={h.total_ns / 1e6:10.3f}ms mean={h.total_ns / max(h.count, 1):10.1f}ns max={h.max_ns}ns"
+            for (game_id, section, actor_id), h in rows
+        ]
+
+
+class _TimedSink:
+    """Times sink.emit; used only when a collector is active."""
+
+    __slots__ = ("_sink", "_timings", "_game_id")
+
+    def __init__(self, sink: Any, timings: TimingCollector, game_id: str) -> None:
+        self._sink = sink
+        self._timings = timings
+        self._game_id = game_id
+
+    def emit(self, event: Event) -> None:
+        t0 = perf_counter_ns()
+        self._sink.emit(event)
+        self._timings.record(self._game_id, SECTION_SINK_EMIT, ANY_ACTOR, perf_counter_ns() - t0)
+
+
+class _TimedGame:
+    """Times legal_actions (per actor) and apply_actions; everything else passes through."""
+
+    def __init__(self, game: Any, timings: TimingCollector) -> None:
+        self._game = game
+        self._timings = timings
+        self.game_id = game.game_id
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._game, name)
+
+    def legal_actions(self, state: Any, actor_id: str) -> Any:
+        t0 = perf_counter_ns()
+        legal = self._game.legal_actions(state, actor_id)
+        self._timings.record(self.game_id, SECTION_LEGAL_ACTIONS, actor_id, perf_counter_ns() - t0)
+        return legal
+
+    def apply_actions(self, state: Any, actions_by_actor: Dict[str, Any], rng: Any) -> Any:
+        t0 = perf_counter_ns()
+        out = self._game.apply_actions(state, actions_by_actor, rng)
+        self._timings.record(self.game_id, SECTION_APPLY_ACTIONS, ANY_ACTOR, perf_counter_ns() - t0)
+        return out
+
+
+class _TimedFork(RNG):
+    """
+    A fork of the match's root RNG whose deferred work is timed: one rng_fork
+    sample when the seed is derived without a draw, one when the generator is
+    built (including the derivation, if still pending). Forks of a fork are
+    plain RNGs; their cost lands in the caller's section.
+    """
+
+    __slots__ = ("_timings", "_game_id")
+
+    @property
+    def seed(self) -> int:
+        seed = self._seed
+        if seed is None:
+            t0 = perf_counter_ns()
+            seed = RNG.seed.fget(self)  # type: ignore[attr-defined]
+            self._timings.record(self._game_id, SECTION_RNG_FORK, ANY_ACTOR, perf_counter_ns() - t0)
+        return seed
+
+    def _gen(self) -> Any:
+        r = self._r
+        if r is None:
+            t0 = perf_counter_ns()
+            RNG.seed.fget(self)  # type: ignore[attr-defined]  # derive here: no second sample from .seed
+            r = RNG._gen(self)
+            self._timings.record(self._game_id, SECTION_RNG_FORK, ANY_ACTOR, perf_counter_ns() - t0)
+        return r
+
+
+class _TimedRNG:
+    """Hands out _TimedFork children of the match's root RNG."""
+
+    __slots__ = ("_rng", "_timings", "_game_id")
+
+    def __init__(self, rng: Any, timings: TimingCollector, game_id: str) -> None:
+        self._rng = rng
+        self._timings = timings
+        self._game_id = game_id
+
+    def fork(self, scope: str) -> Any:
+        child = self._rng.fork(scope)
+        timed = _TimedFork.__new__(_TimedFork)
+        timed._seed = child._seed
+        timed._r = child._r
+        timed._parent_seed = child._parent_seed
+        timed._scope = child._scope
+        timed.backend = child.backend
+        timed._timings = self._timings
+        timed._game_id = self._game_id
+        return timed
+
+
+def instrument(game: Any, sink: Any, rng: Any, timings: TimingCollector) -> Tuple[Any, Any, Any]:
+    """
+    Wrap a match's game, sink and root RNG in timed proxies.
+    """
+    game_id = game.game_id
+    return _TimedGame(game, timings), _TimedSink(sink, timings, game_id), _TimedRNG(rng, timings, game_id)
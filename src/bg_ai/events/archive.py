@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import json
+import mmap
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .codecs_binary import BinaryEventEncoder, iter_binary_events
+from .codecs_jsonl import PathLike
+from .model import Event
+
+
+# S45: append-only event archive.
+#
+# `<path>` is a concatenation of segments; each segment is one match's (or one
+# series') events as a self-contained codecs_binary stream, so it decodes on
+# its own. `<path>.idx` is an append-only JSONL index with one line per
+# segment. The data is written before its index line: after a crash, index
+# lines pointing past the end of the data are ignored and unindexed tail bytes
+# are truncated on the next append.
+
+KIND_MATCH = "match"
+KIND_SERIES = "series"
+
+_FLUSH_TYPES = frozenset({"match_end", "series_end"})
+
+
+def archive_index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".idx")
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveSegment:
+    id: str  # match_id, or series_id for series-level events
+    kind: str
+    offset: int
+    length: int
+    events: int
+    first_idx: int
+    match_ids: Tuple[str, ...] = ()  # series segments: matches of the series
+
+
+def _load_index(path: Path, data_size: int) -> Tuple[List[ArchiveSegment], bool]:
+    """
+    Valid segments of the index, and whether the index had a torn/dangling tail.
+    """
+    ip = archive_index_path(path)
+    if not ip.exists():
+        return [], False
+    segments: List[ArchiveSegment] = []
+    lines = [line for line in ip.read_text(encoding="utf-8").splitlines() if line.strip()]
+    for line in lines:
+        try:
+            d = json.loads(line)
+        except json.JSONDecodeError:
+            break  # torn last line
+        seg = ArchiveSegment(
+            id=str(d["id"]),
+            kind=str(d["kind"]),
+            offset=int(d["offset"]),
+            length=int(d["length"]),
+            events=int(d["events"]),
+            first_idx=int(d["first_idx"]),
+            match_ids=tuple(str(m) for m in d.get("match_ids", ())),
+        )
+        if seg.offset + seg.length > data_size:
+            break
+        segments.append(seg)
+    return segments, len(segments) != len(lines)
+
+
+class EventArchiveWriter:
+    """
+    S45: appends events to an archive; also usable as an EventSink.
+
+    emit() buffers the current match and writes it as one segment at
+    match_end / series_end (or when another match_id shows up); append()
+    writes a batch of events directly. close() (or the context manager)
+    writes what is still buffered.
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = Path(path).expanduser().resolve()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+
+        segments, torn = _load_index(self.path, self.path.stat().st_size)
+        end = segments[-1].offset + segments[-1].length if segments else 0
+
+        self._f = self.path.open("r+b")
+        self._f.truncate(end)  # drop bytes of a segment whose index line never made it
+        self._f.seek(end)
+        self._offset = end
+
+        ip = archive_index_path(self.path)
+        if torn:
+            ip.write_text("".join(self._index_line(s) for s in segments), encoding="utf-8")
+        self._index = ip.open("a", encoding="utf-8")
+
+        self._pending: List[Event] = []
+
+    @staticmethod
+    def _index_line(seg: ArchiveSegment) -> str:
+        d: Dict[str, Any] = {
+            "id": seg.id,
+            "kind": seg.kind,
+            "offset": seg.offset,
+            "length": seg.length,
+            "events": seg.events,
+            "first_idx": seg.first_idx,
+        }
+        if seg.match_ids:
+            d["match_ids"] = list(seg.match_ids)
+        return json.dumps(d, separators=(",", ":")) + "\n"
+
+    def _write_segment(self, events: List[Event]) -> None:
+        enc = BinaryEventEncoder()
+        data = b"".join(enc.encode(e) for e in events)
+
+        series = events[0].type.startswith("series_")
+        seg = ArchiveSegment(
+            id=events[0].match_id,
+            kind=KIND_SERIES if series else KIND_MATCH,
+            offset=self._offset,
+            length=len(data),
+            events=len(events),
+            first_idx=events[0].idx,
+            match_ids=(
+                tuple(str(e.payload["match_id"]) for e in events if e.type == "series_match_completed")
+                if series else ()
+            ),
+        )
+        self._f.write(data)
+        self._f.flush()
+        self._offset += len(data)
+        self._index.write(self._index_line(seg))
+        self._index.flush()
+
+    def append(self, events: Iterable[Event]) -> None:
+        """
+        Write events as segments (one per contiguous run of a match_id).
+        """
+        self._flush_pending()
+        run: List[Event] = []
+        for e in events:
+            if run and e.match_id != run[-1].match_id:
+                self._write_segment(run)
+                run = []
+            run.append(e)
+        if run:
+            self._write_segment(run)
+
+    def emit(self, event: Event) -> None:
+        if self._pending and event.match_id != self._pending[-1].match_id:
+            self._flush_pending()
+        self._pending.append(event)
+        if event.type in _FLUSH_TYPES:
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        if self._pending:
+            self._write_segment(self._pending)
+            self._pending = []
+
+    def close(self) -> None:
+        self._flush_pending()
+        self._f.close()
+        self._index.close()
+
+    def __enter__(self) -> "EventArchiveWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class EventArchiveReader:
+    """
+    S45: memory-mapped, read-only view of an archive.
+
+    Opening reads only the index. raw(id) returns zero-copy memoryviews of
+    that match's segments; events(id) copies just those segments (one memcpy
+    each, cheaper than decoding through a memoryview in Python) and decodes
+    them, e.g.
+
+        Replayer().replay(game, reader.events(match_id), config)
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = Path(path).expanduser().resolve()
+        size = self.path.stat().st_size
+        self._segments, _ = _load_index(self.path, size)
+        self._by_id: Dict[str, List[ArchiveSegment]] = {}
+        for seg in self._segments:
+            self._by_id.setdefault(seg.id, []).append(seg)
+
+        self._file = self.path.open("rb")
+        self._mm: Optional[mmap.mmap] = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        )
+        self._view = memoryview(self._mm) if self._mm is not None else memoryview(b"")
+
+    @property
+    def segments(self) -> List[ArchiveSegment]:
+        return list(self._segments)
+
+    def ids(self, kind: Optional[str] = None) -> List[str]:
+        """
+        Archived match ids (kind=KIND_MATCH), series ids (KIND_SERIES) or both, in file order.
+        """
+        return list(dict.fromkeys(s.id for s in self._segments if kind is None or s.kind == kind))
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._by_id
+
+    def series_match_ids(self, series_id: str) -> List[str]:
+        return [m for seg in self._by_id.get(series_id, ()) for m in seg.match_ids]
+
+    def raw(self, id: str) -> List[memoryview]:
+        """
+        Zero-copy views of id's segments (each a complete binary event stream).
+        Release them (view.release()) when done to let close() unmap right away.
+        """
+        segs = self._by_id.get(id)
+        if not segs:
+            raise KeyError(f"{id!r} is not in archive {self.path.name}")
+        return [self._view[s.offset:s.offset + s.length] for s in segs]
+
+    def iter_events(self, id: str) -> Iterator[Event]:
+        for view in self.raw(id):
+            yield from iter_binary_events(view.tobytes())
+
+    def events(self, id: str) -> List[Event]:
+        return list(self.iter_events(id))
+
+    def close(self) -> None:
+        """
+        Release the reader. Views from raw() that the caller still holds stay
+        valid: the mapping is then unmapped once the last of them is released
+        (or garbage-collected) instead of here.
+        """
+        try:
+            self._view.release()
+            if self._mm is not None:
+                try:
+                    self._mm.close()
+                except BufferError:  # raw() views still exported
+                    pass
+                self._mm = None
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> "EventArchiveReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
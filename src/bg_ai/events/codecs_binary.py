@@ -0,0 +1,345 @@
+"""
+S40: compact binary event log.
+
+File layout:
+
+    MAGIC (4 bytes) | VERSION (1 byte) | varint len + utf-8 match_id | records...
+
+The header match_id is the file's first match (string id 0); later matches
+are switched to with a MATCH record. Every record is `varint length + body`
+and the body starts with a tag byte:
+
+    STRING  utf-8 bytes           defines the next string id
+    MATCH   varint sid            events that follow belong to this match_id
+    EVENT   varint idx, zigzag tick, varint type sid, flags,
+            [varint schema_version], [varint timestamp_ms], payload value
+
+Payload values are tagged: null/false/true, zigzag int, float64, interned
+string (sid), list, and dict (key sid + value pairs). Every string (event
+types, payload keys, actor ids, action wire values, ...) is written once and
+then referenced by id, so a decision_provided record is ~10 bytes.
+
+Decoded event bodies are cached by their encoded bytes, so repeated
+decisions decode with one dict lookup + payload copy.
+"""
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .codecs_jsonl import PathLike, export_events_jsonl, import_events_jsonl
+from .model import Event
+
+MAGIC = b"BGEV"
+VERSION = 1
+
+_TAG_STRING = 0
+_TAG_MATCH = 1
+_TAG_EVENT = 2
+
+_FLAG_SCHEMA = 1  # schema_version != 1 follows
+_FLAG_TIMESTAMP = 2  # timestamp_ms follows
+
+_V_NULL = 0
+_V_FALSE = 1
+_V_TRUE = 2
+_V_INT = 3
+_V_FLOAT = 4
+_V_STR = 5
+_V_LIST = 6
+_V_DICT = 7
+
+_F64 = struct.Struct("<d")
+
+# Decoder cache bound (distinct event bodies kept per file).
+_CACHE_LIMIT = 4096
+
+
+def _put_varint(out: bytearray, n: int) -> None:
+    if n < 0:
+        raise ValueError(f"varint must be >= 0, got {n}")
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _zigzag(n: int) -> int:
+    return (n << 1) if n >= 0 else ((-n << 1) - 1)
+
+
+def _unzigzag(z: int) -> int:
+    return (z >> 1) if not (z & 1) else -((z + 1) >> 1)
+
+
+def _copy_json(v: Any) -> Any:
+    if type(v) is dict:
+        return {k: _copy_json(x) for k, x in v.items()}
+    if type(v) is list:
+        return [_copy_json(x) for x in v]
+    return v
+
+
+def _get_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    b = buf[pos]
+    if b < 0x80:
+        return b, pos + 1
+    n = b & 0x7F
+    shift = 7
+    pos += 1
+    while True:
+        b = buf[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+class BinaryEventEncoder:
+    """
+    Incremental encoder: feed events in file order, write the returned bytes.
+    """
+
+    def __init__(self) -> None:
+        self._sids: Dict[str, int] = {}
+        self._match_sid: Optional[int] = None
+        self._started = False
+
+    def _sid(self, s: str, out: bytearray) -> int:
+        sid = self._sids.get(s)
+        if sid is None:
+            sid = self._sids[s] = len(self._sids)
+            data = s.encode("utf-8")
+            _put_varint(out, len(data) + 1)
+            out.append(_TAG_STRING)
+            out += data
+        return sid
+
+    def _value(self, v: Any, body: bytearray, out: bytearray) -> None:
+        if v is None:
+            body.append(_V_NULL)
+        elif v is True:
+            body.append(_V_TRUE)
+        elif v is False:
+            body.append(_V_FALSE)
+        elif isinstance(v, str):
+            body.append(_V_STR)
+            _put_varint(body, self._sid(v, out))
+        elif isinstance(v, int):
+            body.append(_V_INT)
+            _put_varint(body, _zigzag(int(v)))
+        elif isinstance(v, float):
+            body.append(_V_FLOAT)
+            body += _F64.pack(v)
+        elif isinstance(v, dict):
+            body.append(_V_DICT)
+            _put_varint(body, len(v))
+            for k, item in v.items():
+                if not isinstance(k, str):
+                    raise TypeError(f"Binary codec needs string payload keys, got {k!r}")
+                _put_varint(body, self._sid(k, out))
+                self._value(item, body, out)
+        elif isinstance(v, (list, tuple)):
+            body.append(_V_LIST)
+            _put_varint(body, len(v))
+            for item in v:
+                self._value(item, body, out)
+        else:
+            raise TypeError(f"Binary codec cannot encode payload value of type {type(v).__name__}")
+
+    def encode(self, ev: Event) -> bytes:
+        out = bytearray()
+        if not self._started:
+            # Header: the first match_id becomes string id 0.
+            self._started = True
+            out += MAGIC
+            out.append(VERSION)
+            data = ev.match_id.encode("utf-8")
+            _put_varint(out, len(data))
+            out += data
+            self._sids[ev.match_id] = 0
+            self._match_sid = 0
+
+        match_sid = self._sid(ev.match_id, out)
+        if match_sid != self._match_sid:
+            self._match_sid = match_sid
+            rec = bytearray((_TAG_MATCH,))
+            _put_varint(rec, match_sid)
+            _put_varint(out, len(rec))
+            out += rec
+
+        body = bytearray((_TAG_EVENT,))
+        _put_varint(body, ev.idx)
+        _put_varint(body, _zigzag(ev.tick))
+        _put_varint(body, self._sid(ev.type, out))
+        flags = (_FLAG_SCHEMA if ev.schema_version != 1 else 0) | (_FLAG_TIMESTAMP if ev.timestamp_ms is not None else 0)
+        body.append(flags)
+        if flags & _FLAG_SCHEMA:
+            _put_varint(body, ev.schema_version)
+        if flags & _FLAG_TIMESTAMP:
+            _put_varint(body, _zigzag(ev.timestamp_ms))  # type: ignore[arg-type]
+        self._value(ev.payload, body, out)
+
+        _put_varint(out, len(body))
+        out += body
+        return bytes(out)
+
+
+def iter_binary_events(data: bytes) -> Iterator[Event]:
+    """
+    Decode a whole binary log held in memory.
+    """
+    if data[:4] != MAGIC:
+        raise ValueError("Not a bg_ai binary event log (bad magic)")
+    if data[4] != VERSION:
+        raise ValueError(f"Unsupported binary event log version {data[4]}")
+
+    n, pos = _get_varint(data, 5)
+    strings: List[str] = [data[pos:pos + n].decode("utf-8")]
+    pos += n
+    match_id = strings[0]
+
+    # Encoded (type, flags, payload) bytes -> decoded parts; callers get fresh payload copies.
+    body_cache: Dict[bytes, Tuple[str, int, Optional[int], Dict[str, Any], bool]] = {}
+    get_varint = _get_varint
+    end = len(data)
+
+    def value(p: int) -> Tuple[Any, int]:
+        tag = data[p]
+        p += 1
+        if tag == _V_STR:
+            sid, p = get_varint(data, p)
+            return strings[sid], p
+        if tag == _V_INT:
+            z, p = get_varint(data, p)
+            return _unzigzag(z), p
+        if tag == _V_NULL:
+            return None, p
+        if tag == _V_TRUE:
+            return True, p
+        if tag == _V_FALSE:
+            return False, p
+        if tag == _V_FLOAT:
+            return _F64.unpack_from(data, p)[0], p + 8
+        if tag == _V_DICT:
+            count, p = get_varint(data, p)
+            d: Dict[str, Any] = {}
+            for _ in range(count):
+                sid, p = get_varint(data, p)
+                d[strings[sid]], p = value(p)
+            return d, p
+        if tag == _V_LIST:
+            count, p = get_varint(data, p)
+            items: List[Any] = []
+            for _ in range(count):
+                item, p = value(p)
+                items.append(item)
+            return items, p
+        raise ValueError(f"Corrupt binary event log: unknown value tag {tag}")
+
+    while pos < end:
+        length = data[pos]
+        if length < 0x80:
+            pos += 1
+        else:
+            length, pos = get_varint(data, pos)
+        stop = pos + length
+        tag = data[pos]
+
+        if tag == _TAG_EVENT:
+            # Single-byte varints are the common case; inline them.
+            p = pos + 1
+            idx = data[p]
+            if idx < 0x80:
+                p += 1
+            else:
+                idx, p = get_varint(data, p)
+            z = data[p]
+            if z < 0x80:
+                p += 1
+            else:
+                z, p = get_varint(data, p)
+            tick = (z >> 1) if not (z & 1) else -((z + 1) >> 1)
+
+            # Everything after idx/tick (type, flags, payload) repeats a lot.
+            key = data[p:stop]
+            cached = body_cache.get(key)
+            if cached is not None:
+                ev_type, schema, ts, template, flat = cached
+                payload = dict(template) if flat else _copy_json(template)
+            else:
+                type_sid, p = get_varint(data, p)
+                ev_type = strings[type_sid]
+                flags = data[p]
+                p += 1
+                schema = 1
+                ts = None
+                if flags & _FLAG_SCHEMA:
+                    schema, p = get_varint(data, p)
+                if flags & _FLAG_TIMESTAMP:
+                    zt, p = get_varint(data, p)
+                    ts = _unzigzag(zt)
+                payload, _ = value(p)
+                if len(body_cache) < _CACHE_LIMIT:
+                    flat = all(not isinstance(v, (dict, list)) for v in payload.values())
+                    body_cache[key] = (ev_type, schema, ts, _copy_json(payload), flat)
+
+            yield Event(
+                match_id=match_id,
+                idx=idx,
+                tick=tick,
+                type=ev_type,
+                payload=payload,
+                schema_version=schema,
+                timestamp_ms=ts,
+            )
+        elif tag == _TAG_STRING:
+            strings.append(data[pos + 1:stop].decode("utf-8"))
+        elif tag == _TAG_MATCH:
+            sid, _ = get_varint(data, pos + 1)
+            match_id = strings[sid]
+        else:
+            raise ValueError(f"Corrupt binary event log: unknown record tag {tag}")
+
+        pos = stop
+
+
+def export_events_binary(path: PathLike, events: Iterable[Event]) -> Path:
+    """
+    Export events to the binary format. Returns the resolved Path written to.
+    """
+    p = Path(path).expanduser().resolve()
+    p.parent.mkdir(parents=True, exist_ok=True)
+
+    enc = BinaryEventEncoder()
+    with p.open("wb") as f:
+        for ev in events:
+            f.write(enc.encode(ev))
+
+    return p
+
+
+def import_events_binary(path: PathLike) -> List[Event]:
+    """
+    Import events written by export_events_binary (empty file = no events).
+    """
+    data = Path(path).expanduser().resolve().read_bytes()
+    if not data:
+        return []
+    return list(iter_binary_events(data))
+
+
+def jsonl_to_binary(src: PathLike, dst: PathLike) -> Path:
+    """
+    Convert a JSONL log to the binary format (lossless for JSON-safe payloads).
+    """
+    return export_events_binary(dst, import_events_jsonl(src))
+
+
+def binary_to_jsonl(src: PathLike, dst: PathLike) -> Path:
+    """
+    Convert a binary log back to JSONL; jsonl -> binary -> jsonl is byte-identical.
+    """
+    return export_events_jsonl(dst, import_events_binary(src))
@@ -1,48 +1,171 @@
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
-from typing import Iterable, List, Union
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 
+from .compression import BlockWriter, codec_for, open_decompressed, read_block_index, read_blocks
 from .model import Event
 
 
 PathLike = Union[str, Path]
 
 
-def export_events_jsonl(path: PathLike, events: Iterable[Event]) -> Path:
+def event_to_json(ev: Event) -> str:
+    """
+    One event as a compact JSON line body (no trailing newline).
+    """
+    return json.dumps(ev.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+
+def export_events_jsonl(path: PathLike, events: Iterable[Event], *, block_bytes: int = 1 << 20) -> Path:
     """
     Export events to JSONL (one JSON object per line).
     Returns the resolved Path written to.
+
+    S41: a .gz/.xz/.bz2 suffix writes a block-compressed log (blocks of
+    ~block_bytes uncompressed) plus a `<name>.idx.json` block index.
     """
     p = Path(path).expanduser().resolve()
     p.parent.mkdir(parents=True, exist_ok=True)
 
+    codec = codec_for(p)
+    if codec is not None:
+        writer = BlockWriter(p, codec, block_bytes)
+        try:
+            for ev in events:
+                writer.write((event_to_json(ev) + "\n").encode("utf-8"), ev.match_id, ev.idx)
+        finally:
+            writer.close()
+        return p
+
     with p.open("w", encoding="utf-8", newline="\n") as f:
         for ev in events:
-            f.write(json.dumps(ev.to_dict(), ensure_ascii=False, separators=(",", ":")))
+            f.write(event_to_json(ev))
             f.write("\n")
 
     return p
 
 
+def _parse_lines(lines: Iterable[str], p: Path) -> List[Event]:
+    events: List[Event] = []
+    for line_no, line in enumerate(lines, start=1):
+        s = line.strip()
+        if not s:
+            continue
+        try:
+            obj = json.loads(s)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_no} in {p}: {e}") from e
+        events.append(Event.from_dict(obj))
+    return events
+
+
 def import_events_jsonl(path: PathLike) -> List[Event]:
     """
     Import events from JSONL (one JSON object per line).
     Skips empty/whitespace lines.
+
+    S41: .gz/.xz/.bz2 logs are decompressed transparently (no index needed).
     """
     p = Path(path).expanduser().resolve()
-    events: List[Event] = []
 
-    with p.open("r", encoding="utf-8") as f:
+    with _open_text(p) as f:
+        return _parse_lines(f, p)
+
+
+def _open_text(p: Path) -> TextIO:
+    codec = codec_for(p)
+    if codec is not None:
+        return io.TextIOWrapper(open_decompressed(p, codec), encoding="utf-8")
+    return p.open("r", encoding="utf-8")
+
+
+def _needles(values: Optional[Collection[str]]) -> Optional[Tuple[str, ...]]:
+    """
+    Quoted JSON forms of values for the raw-line pre-check, or None when a value
+    could be escaped differently by other writers (then only the parsed check runs).
+    """
+    if values is None:
+        return None
+    needles = []
+    for v in values:
+        quoted = json.dumps(v)
+        if quoted != f'"{v}"':
+            return None
+        needles.append(quoted)
+    return tuple(needles)
+
+
+def iter_events(
+    path: PathLike,
+    *,
+    types: Optional[Collection[str]] = None,
+    match_ids: Optional[Collection[str]] = None,
+    tick_range: Optional[Tuple[int, int]] = None,
+) -> Iterator[Event]:
+    """
+    S42: lazily yield the events of a JSONL log (plain or .gz/.xz/.bz2), in file order.
+
+    Filters (all optional, combined with AND):
+    - types / match_ids: allowed event types / match ids
+    - tick_range: (start, stop), half-open like range()
+
+    Lines are first checked for the quoted type/match_id as a substring, so
+    non-matching lines usually skip json.loads; matching lines are filtered on
+    the parsed dict before an Event is built. Memory use is one line at a time.
+    """
+    p = Path(path).expanduser().resolve()
+    type_set = None if types is None else frozenset(types)
+    match_set = None if match_ids is None else frozenset(match_ids)
+    type_needles = _needles(type_set)
+    match_needles = _needles(match_set)
+    lo, hi = tick_range if tick_range is not None else (None, None)
+
+    with _open_text(p) as f:
         for line_no, line in enumerate(f, start=1):
+            if type_needles is not None and not any(n in line for n in type_needles):
+                continue
+            if match_needles is not None and not any(n in line for n in match_needles):
+                continue
             s = line.strip()
             if not s:
                 continue
             try:
-                obj = json.loads(s)
+                obj: Dict[str, Any] = json.loads(s)
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON on line {line_no} in {p}: {e}") from e
-            events.append(Event.from_dict(obj))
 
+            if type_set is not None and obj.get("type") not in type_set:
+                continue
+            if match_set is not None and obj.get("match_id") not in match_set:
+                continue
+            if lo is not None:
+                tick = int(obj.get("tick", 0))
+                if tick < lo or tick >= hi:
+                    continue
+            yield Event.from_dict(obj)
+
+
+def import_match_jsonl(path: PathLike, match_id: str) -> List[Event]:
+    """
+    S41: events of one match.
+
+    Compressed logs only decompress the blocks their index lists for match_id;
+    plain logs are scanned.
+    """
+    p = Path(path).expanduser().resolve()
+
+    codec = codec_for(p)
+    if codec is None:
+        return list(iter_events(p, match_ids=(match_id,)))
+
+    entries = [e for e in read_block_index(p) if match_id in e.match_ids]
+    events: List[Event] = []
+    for block in read_blocks(p, codec, entries):
+        # Split on b"\n" only: str.splitlines() also breaks on U+2028/U+2029/\x85, which
+        # event_to_json (ensure_ascii=False) leaves unescaped inside strings.
+        lines = (line.decode("utf-8") for line in block.split(b"\n"))
+        events.extend(e for e in _parse_lines(lines, p) if e.match_id == match_id)
     return events
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from itertools import compress
+from operator import and_
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .model import Event
+
+
+# S44: payload shapes stored without a dict. Anything else goes to the side table.
+_SHAPE_SIDE = 0  # payload in side table
+_SHAPE_EMPTY = 1  # {}
+_SHAPE_ACTOR = 2  # {"actor_id": actor}
+_SHAPE_ACTION = 3  # {"actor_id": actor, "action": action}
+_SHAPE_TICK = 4  # {"tick": tick} (tick_start / tick_end)
+
+_NONE = -1
+
+# Columns usable in group_count(by=...).
+GROUP_COLUMNS = ("match", "tick", "type", "actor", "action")
+
+
+class _Interner:
+    __slots__ = ("values", "codes")
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def code(self, s: str) -> int:
+        c = self.codes.get(s)
+        if c is None:
+            c = self.codes[s] = len(self.values)
+            self.values.append(s)
+        return c
+
+
+class ColumnarEventStore:
+    """
+    S44: column-oriented event table for analytics over many matches.
+
+    One row per event, stored in typed stdlib arrays (8 bytes for idx/tick,
+    4 per code column, 1 for the shape):
+    - match ordinal, idx, tick
+    - interned codes for type, actor_id and action (-1 = none)
+    - payloads of the common engine shapes ({}, {"actor_id"}, {"actor_id",
+      "action"}, {"tick"}) are rebuilt from the columns; any other payload
+      (and non-default schema_version / timestamp_ms) lives in a side table
+
+    Counting queries (group_count, count_by_type) run over the code columns
+    with C-level Counter/zip and only decode the (small) result. Rows convert
+    back to Event on demand. numpy is optional: columns() exposes zero-copy
+    ndarray views when it is installed.
+    """
+
+    def __init__(self) -> None:
+        self._match = array("i")
+        self._idx = array("q")
+        self._tick = array("q")
+        self._type = array("i")
+        self._actor = array("i")
+        self._action = array("i")
+        self._shape = array("b")
+        self._side_row = array("i")
+
+        self._matches = _Interner()
+        self._types = _Interner()
+        self._actors = _Interner()
+        self._actions = _Interner()
+        # (payload, schema_version, timestamp_ms)
+        self._side: List[Tuple[Dict[str, Any], int, Optional[int]]] = []
+
+    def __len__(self) -> int:
+        return len(self._idx)
+
+    @property
+    def match_ids(self) -> List[str]:
+        """Match ids in ingest order (row match ordinal = position here)."""
+        return list(self._matches.values)
+
+    @property
+    def side_table_size(self) -> int:
+        return len(self._side)
+
+    def ingest(self, events: Iterable[Event]) -> int:
+        """
+        Append events (e.g. InMemoryEventSink.events() or iter_events(path)); returns rows added.
+        """
+        n0 = len(self)
+        match_code = self._matches.code
+        type_code = self._types.code
+        actor_code = self._actors.code
+        action_code = self._actions.code
+        side = self._side
+
+        for ev in events:
+            payload = ev.payload
+            actor = action = _NONE
+            shape = _SHAPE_SIDE
+            if ev.schema_version == 1 and ev.timestamp_ms is None:
+                n = len(payload)
+                if n == 0:
+                    shape = _SHAPE_EMPTY
+                elif n == 1:
+                    a = payload.get("actor_id")
+                    if type(a) is str:
+                        actor, shape = actor_code(a), _SHAPE_ACTOR
+                    elif payload.get("tick") == ev.tick and type(payload.get("tick")) is int:
+                        shape = _SHAPE_TICK
+                elif n == 2:
+                    a = payload.get("actor_id")
+                    act = payload.get("action")
+                    if type(a) is str and type(act) is str:
+                        actor, action, shape = actor_code(a), action_code(act), _SHAPE_ACTION
+
+            if shape == _SHAPE_SIDE:
+                self._side_row.append(len(side))
+                side.append((dict(payload), ev.schema_version, ev.timestamp_ms))
+                # Side payloads still expose actor_id for group-bys when present.
+                a = payload.get("actor_id")
+                if type(a) is str:
+                    actor = actor_code(a)
+            else:
+                self._side_row.append(_NONE)
+
+            self._match.append(match_code(ev.match_id))
+            self._idx.append(ev.idx)
+            self._tick.append(ev.tick)
+            self._type.append(type_code(ev.type))
+            self._actor.append(actor)
+            self._action.append(action)
+            self._shape.append(shape)
+
+        return len(self) - n0
+
+    # --- queries -----------------------------------------------------------
+
+    def _column(self, name: str) -> Sequence[int]:
+        if name not in GROUP_COLUMNS:
+            raise ValueError(f"Unknown column {name!r}; expected one of {list(GROUP_COLUMNS)}")
+        return {
+            "match": self._match,
+            "tick": self._tick,
+            "type": self._type,
+            "actor": self._actor,
+            "action": self._action,
+        }[name]
+
+    def _decode(self, name: str, code: int) -> Any:
+        if name == "tick":
+            return code
+        if code == _NONE:
+            return None
+        table = {"match": self._matches, "type": self._types, "actor": self._actors, "action": self._actions}[name]
+        return table.values[code]
+
+    def _mask(self, type: Optional[str], match_id: Optional[str]) -> Optional[List[bool]]:
+        masks = []
+        if type is not None:
+            code = self._types.codes.get(type, -2)
+            masks.append(list(map(code.__eq__, self._type)))
+        if match_id is not None:
+            code = self._matches.codes.get(match_id, -2)
+            masks.append(list(map(code.__eq__, self._match)))
+        if not masks:
+            return None
+        if len(masks) == 1:
+            return masks[0]
+        return list(map(and_, *masks))
+
+    def group_count(
+        self,
+        by: Sequence[str],
+        *,
+        type: Optional[str] = None,
+        match_id: Optional[str] = None,
+    ) -> Dict[Tuple[Any, ...], int]:
+        """
+        Row counts grouped by columns (see GROUP_COLUMNS), optionally restricted
+        to one event type and/or match. Keys are decoded values in `by` order.
+
+            store.group_count(("actor", "tick", "action"), type="decision_provided")
+        """
+        cols = [self._column(name) for name in by]
+        mask = self._mask(type, match_id)
+        if mask is not None:
+            cols = [list(compress(c, mask)) for c in cols]
+        counts = Counter(zip(*cols))
+        return {
+            tuple(self._decode(name, code) for name, code in zip(by, key)): n
+            for key, n in counts.items()
+        }
+
+    def count_by_type(self) -> Dict[str, int]:
+        return {self._types.values[c]: n for c, n in Counter(self._type).items()}
+
+    def action_counts(self, actor_id: str, *, type: str = "decision_provided") -> Dict[str, int]:
+        """
+        Same numbers as InMemoryStatsStore.action_counts for the ingested events.
+        """
+        return {
+            action: n
+            for (actor, action), n in self.group_count(("actor", "action"), type=type).items()
+            if actor == actor_id and action is not None
+        }
+
+    # --- rows -> events -----------------------------------------------------
+
+    def event(self, row: int) -> Event:
+        shape = self._shape[row]
+        tick = self._tick[row]
+        schema, ts = 1, None
+        if shape == _SHAPE_SIDE:
+            payload, schema, ts = self._side[self._side_row[row]]
+            payload = dict(payload)
+        elif shape == _SHAPE_EMPTY:
+            payload = {}
+        elif shape == _SHAPE_ACTOR:
+            payload = {"actor_id": self._actors.values[self._actor[row]]}
+        elif shape == _SHAPE_ACTION:
+            payload = {
+                "actor_id": self._actors.values[self._actor[row]],
+                "action": self._actions.values[self._action[row]],
+            }
+        else:
+            payload = {"tick": tick}
+
+        return Event(
+            match_id=self._matches.values[self._match[row]],
+            idx=self._idx[row],
+            tick=tick,
+            type=self._types.values[self._type[row]],
+            payload=payload,
+            schema_version=schema,
+            timestamp_ms=ts,
+        )
+
+    def iter_events(self, match_id: Optional[str] = None) -> Iterator[Event]:
+        """
+        Rows back as Events, in ingest order (optionally one match only).
+        """
+        if match_id is None:
+            rows: Iterable[int] = range(len(self))
+        else:
+            code = self._matches.codes.get(match_id, -2)
+            rows = (i for i, c in enumerate(self._match) if c == code)
+        for i in rows:
+            yield self.event(i)
+
+    def columns(self) -> Dict[str, Any]:
+        """
+        Zero-copy numpy views of the columns (requires numpy). The views pin
+        the underlying arrays: drop them before ingesting more events.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:  # optional dependency
+            raise ImportError("ColumnarEventStore.columns() requires numpy") from e
+        return {
+            name: np.frombuffer(col, dtype=np.dtype(col.typecode))
+            for name, col in (
+                ("match", self._match),
+                ("idx", self._idx),
+                ("tick", self._tick),
+                ("type", self._type),
+                ("actor", self._actor),
+                ("action", self._action),
+            )
+        }
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import bz2
+import gzip
+import json
+import lzma
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# S41: block-compressed logs.
+#
+# A compressed log is a sequence of independently compressed blocks. Each block
+# is a complete gzip member / xz stream / bz2 stream, so the file as a whole is
+# an ordinary multi-member .gz/.xz/.bz2 file (zcat, xzcat, gzip.open, ... read it).
+# A JSON sidecar `<name>.idx.json` lists every block's byte range, event count,
+# first match_id/idx and the match_ids it holds, so one match can be read by
+# decompressing only its blocks.
+
+CODEC_GZIP = "gzip"
+CODEC_XZ = "xz"
+CODEC_BZ2 = "bz2"
+
+CODECS_BY_SUFFIX: Dict[str, str] = {".gz": CODEC_GZIP, ".xz": CODEC_XZ, ".bz2": CODEC_BZ2}
+
+_COMPRESS: Dict[str, Callable[[bytes], bytes]] = {
+    # mtime=0 keeps output byte-identical across runs.
+    CODEC_GZIP: lambda data: gzip.compress(data, compresslevel=6, mtime=0),
+    CODEC_XZ: lzma.compress,
+    CODEC_BZ2: bz2.compress,
+}
+_DECOMPRESS: Dict[str, Callable[[bytes], bytes]] = {
+    CODEC_GZIP: gzip.decompress,
+    CODEC_XZ: lzma.decompress,
+    CODEC_BZ2: bz2.decompress,
+}
+_OPEN: Dict[str, Callable[..., BinaryIO]] = {
+    CODEC_GZIP: gzip.open,
+    CODEC_XZ: lzma.open,
+    CODEC_BZ2: bz2.open,
+}
+
+INDEX_VERSION = 1
+
+
+def codec_for(path: Path) -> Optional[str]:
+    """
+    Compression codec implied by the file suffix (None = plain).
+    """
+    return CODECS_BY_SUFFIX.get(path.suffix)
+
+
+def index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".idx.json")
+
+
+def open_decompressed(path: Path, codec: str) -> BinaryIO:
+    """
+    Stream the whole log (all blocks) without the index.
+    """
+    return _OPEN[codec](path, "rb")
+
+
+@dataclass(frozen=True, slots=True)
+class BlockEntry:
+    offset: int
+    length: int  # compressed bytes
+    events: int
+    first_match_id: str
+    first_idx: int
+    match_ids: Tuple[str, ...]  # in file order
+
+
+class BlockWriter:
+    """
+    Writes JSONL lines as compressed blocks of ~block_bytes (uncompressed).
+
+    Blocks are cut at the first match change after block_bytes, or anywhere
+    once a block reaches 4 * block_bytes (very long matches).
+    """
+
+    def __init__(self, path: Path, codec: str, block_bytes: int = 1 << 20) -> None:
+        if codec not in _COMPRESS:
+            raise ValueError(f"Unknown codec {codec!r}; expected one of {sorted(_COMPRESS)}")
+        if block_bytes <= 0:
+            raise ValueError("block_bytes must be > 0")
+        self.path = path
+        self.codec = codec
+        self._block_bytes = int(block_bytes)
+        self._f = path.open("wb")
+        self._offset = 0
+        self._entries: List[BlockEntry] = []
+
+        self._lines: List[bytes] = []
+        self._size = 0
+        self._first: Optional[Tuple[str, int]] = None
+        self._match_ids: List[str] = []
+
+    def write(self, line: bytes, match_id: str, idx: int) -> None:
+        if self._lines:
+            new_match = match_id != self._match_ids[-1]
+            if (new_match and self._size >= self._block_bytes) or self._size >= 4 * self._block_bytes:
+                self._flush_block()
+
+        if not self._lines:
+            self._first = (match_id, idx)
+        if not self._match_ids or self._match_ids[-1] != match_id:
+            self._match_ids.append(match_id)
+        self._lines.append(line)
+        self._size += len(line)
+
+    def _flush_block(self) -> None:
+        data = _COMPRESS[self.codec](b"".join(self._lines))
+        self._f.write(data)
+        first_match_id, first_idx = self._first  # type: ignore[misc]
+        self._entries.append(
+            BlockEntry(
+                offset=self._offset,
+                length=len(data),
+                events=len(self._lines),
+                first_match_id=first_match_id,
+                first_idx=first_idx,
+                match_ids=tuple(dict.fromkeys(self._match_ids)),
+            )
+        )
+        self._offset += len(data)
+        self._lines = []
+        self._size = 0
+        self._first = None
+        self._match_ids = []
+
+    def close(self) -> None:
+        if self._lines:
+            self._flush_block()
+        self._f.close()
+        index = {
+            "version": INDEX_VERSION,
+            "codec": self.codec,
+            "blocks": [
+                {
+                    "offset": e.offset,
+                    "length": e.length,
+                    "events": e.events,
+                    "first_match_id": e.first_match_id,
+                    "first_idx": e.first_idx,
+                    "match_ids": list(e.match_ids),
+                }
+                for e in self._entries
+            ],
+        }
+        index_path(self.path).write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+
+
+def read_block_index(path: Path) -> List[BlockEntry]:
+    p = index_path(path)
+    if not p.exists():
+        raise FileNotFoundError(f"No block index for {path} (expected {p.name})")
+    obj = json.loads(p.read_text(encoding="utf-8"))
+    if obj.get("version") != INDEX_VERSION:
+        raise ValueError(f"Unsupported block index version {obj.get('version')!r} in {p}")
+    return [
+        BlockEntry(
+            offset=int(b["offset"]),
+            length=int(b["length"]),
+            events=int(b["events"]),
+            first_match_id=str(b["first_match_id"]),
+            first_idx=int(b["first_idx"]),
+            match_ids=tuple(str(m) for m in b["match_ids"]),
+        )
+        for b in obj["blocks"]
+    ]
+
+
+def read_blocks(path: Path, codec: str, entries: Iterable[BlockEntry]) -> Iterator[bytes]:
+    """
+    Seek to and decompress only the given blocks (uncompressed JSONL bytes each).
+    """
+    decompress = _DECOMPRESS[codec]
+    with path.open("rb") as f:
+        for e in entries:
+            f.seek(e.offset)
+            yield decompress(f.read(e.length))
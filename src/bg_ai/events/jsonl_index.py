@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .codecs_jsonl import PathLike
+from .compression import codec_for
+from .model import Event
+
+
+# S43: per-match byte-offset index for plain JSONL logs.
+#
+# Sidecar `<name>.matches.json` holds one span per contiguous run of a match's
+# lines: (match_id, first_idx, byte_offset, length). Reading a match is one
+# seek + read; the spans also split the file for process-pool decoding.
+# The sidecar records the log's size and st_mtime_ns; either changing marks
+# it stale (a regenerated log of the same shape can have the same size).
+
+INDEX_VERSION = 2
+
+_PREFIX = b'{"match_id":"'  # event_to_json's canonical line start
+
+
+@dataclass(frozen=True, slots=True)
+class MatchSpan:
+    match_id: str
+    first_idx: int
+    offset: int
+    length: int
+
+
+def match_index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".matches.json")
+
+
+def _resolve_plain(path: PathLike) -> Path:
+    p = Path(path).expanduser().resolve()
+    if codec_for(p) is not None:
+        raise ValueError(f"{p.name} is compressed; use its block index (import_match_jsonl) instead")
+    return p
+
+
+def _line_key(line: bytes) -> Tuple[str, int]:
+    obj = json.loads(line)
+    return str(obj["match_id"]), int(obj["idx"])
+
+
+def build_match_index(path: PathLike, *, write: bool = True) -> List[MatchSpan]:
+    """
+    Scan a JSONL log once and write its `<name>.matches.json` sidecar
+    (write=False: return the spans only, e.g. for read-only log directories).
+    """
+    p = _resolve_plain(path)
+    spans: List[MatchSpan] = []
+
+    cur_id: Optional[str] = None
+    cur_raw = b""  # cur_id as it appears in canonical lines
+    cur_first = 0
+    cur_start = 0
+    offset = 0
+    with p.open("rb") as f:
+        mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+        for line in f:
+            start = offset
+            offset += len(line)
+            if not line.strip():
+                continue
+
+            # Canonical lines of the current match are skipped without parsing.
+            if cur_raw and line.startswith(cur_raw):
+                continue
+
+            match_id, idx = _line_key(line)
+            if match_id == cur_id:
+                continue
+            if cur_id is not None:
+                spans.append(MatchSpan(cur_id, cur_first, cur_start, start - cur_start))
+            cur_id, cur_first, cur_start = match_id, idx, start
+            cur_raw = _PREFIX + json.dumps(match_id, ensure_ascii=False)[1:].encode("utf-8") + b","
+
+    if cur_id is not None:
+        spans.append(MatchSpan(cur_id, cur_first, cur_start, offset - cur_start))
+
+    if not write:
+        return spans
+    index = {
+        "version": INDEX_VERSION,
+        "size": offset,
+        "mtime_ns": mtime_ns,
+        "matches": [[s.match_id, s.first_idx, s.offset, s.length] for s in spans],
+    }
+    match_index_path(p).write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    return spans
+
+
+def read_match_index(path: PathLike, *, build: bool = True, write: bool = True) -> List[MatchSpan]:
+    """
+    Load the sidecar index (building it if missing or stale and build=True;
+    write=False builds it in memory without writing the sidecar).
+    """
+    p = _resolve_plain(path)
+    ip = match_index_path(p)
+    if ip.exists():
+        obj = json.loads(ip.read_text(encoding="utf-8"))
+        st = p.stat()
+        if (
+            obj.get("version") == INDEX_VERSION
+            and obj.get("size") == st.st_size
+            and obj.get("mtime_ns") == st.st_mtime_ns
+        ):
+            return [MatchSpan(str(m), int(i), int(o), int(n)) for m, i, o, n in obj["matches"]]
+    if not build:
+        raise FileNotFoundError(f"No up-to-date match index for {p} (expected {ip.name})")
+    return build_match_index(p, write=write)
+
+
+def _decode(data: bytes) -> List[Event]:
+    return [Event.from_dict(json.loads(line)) for line in data.splitlines() if line.strip()]
+
+
+def _read_range(path: str, offset: int, length: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return f.read(length)
+
+
+def read_match(path: PathLike, match_id: str, index: Optional[List[MatchSpan]] = None) -> List[Event]:
+    """
+    Events of one match, read with one seek per span (usually exactly one).
+    """
+    p = _resolve_plain(path)
+    spans = index if index is not None else read_match_index(p)
+    events: List[Event] = []
+    for s in spans:
+        if s.match_id == match_id:
+            events.extend(_decode(_read_range(str(p), s.offset, s.length)))
+    return events
+
+
+def chunk_spans(spans: List[MatchSpan], chunk_bytes: int) -> List[List[MatchSpan]]:
+    """
+    Split spans (file order) into runs of adjacent spans of about chunk_bytes each.
+    """
+    chunks: List[List[MatchSpan]] = []
+    cur: List[MatchSpan] = []
+    size = 0
+    for s in spans:
+        cur.append(s)
+        size += s.length
+        if size >= chunk_bytes:
+            chunks.append(cur)
+            cur, size = [], 0
+    if cur:
+        chunks.append(cur)
+    return chunks
+
+
+def read_spans(path: str, spans: List[MatchSpan]) -> List[Event]:
+    """
+    Events of adjacent spans (one chunk_spans() chunk), decoded from one read.
+    """
+    start = spans[0].offset
+    end = spans[-1].offset + spans[-1].length
+    return _decode(_read_range(path, start, end - start))
+
+
+def _map_chunk(path: str, spans: List[MatchSpan], fn: Callable[[List[Event]], Any]) -> List[Tuple[str, Any]]:
+    events = read_spans(path, spans)
+    by_match: Dict[str, List[Event]] = {}
+    for e in events:
+        by_match.setdefault(e.match_id, []).append(e)
+    return [(match_id, fn(evs)) for match_id, evs in by_match.items()]
+
+
+def parallel_import_events_jsonl(path: PathLike, *, workers: int = 2, chunk_bytes: int = 8 << 20) -> List[Event]:
+    """
+    import_events_jsonl decoded by a process pool over index-aligned chunks.
+    Same events, same order.
+    """
+    p = _resolve_plain(path)
+    chunks = chunk_spans(read_match_index(p), chunk_bytes)
+    if workers <= 1 or len(chunks) <= 1:
+        return [e for c in chunks for e in read_spans(str(p), c)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(read_spans, [str(p)] * len(chunks), chunks))
+    return [e for part in parts for e in part]
+
+
+def map_matches(
+    path: PathLike,
+    fn: Callable[[List[Event]], Any],
+    *,
+    workers: int = 2,
+    chunk_bytes: int = 8 << 20,
+) -> Dict[str, Any]:
+    """
+    Apply fn(events_of_one_match) to every match inside pool workers; only the
+    (small) results travel back. fn must be picklable (module-level).
+    Returns match_id -> result in file order. Logs with interleaved matches
+    are decoded as one chunk, so fn always sees a whole match.
+    """
+    p = _resolve_plain(path)
+    spans = read_match_index(p)
+    chunks = chunk_spans(spans, chunk_bytes)
+    if len({s.match_id for s in spans}) != len(spans):
+        # Interleaved matches: decode them together so each fn call sees the whole match.
+        chunks = [spans]
+
+    if workers <= 1 or len(chunks) <= 1:
+        parts = [_map_chunk(str(p), c, fn) for c in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_map_chunk, [str(p)] * len(chunks), chunks, [fn] * len(chunks)))
+    return {match_id: result for part in parts for match_id, result in part}
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, BinaryIO, FrozenSet, Iterable, List, Optional
+
+from .codecs_jsonl import PathLike, event_to_json
+from .compression import codec_for
+from .model import Event
+
+
+# S39: when JsonlFileSink pushes its write buffer to the OS.
+FLUSH_ON_CLOSE = "close"
+FLUSH_PER_MATCH = "match"  # after every match_end (and series_end)
+FLUSH_EVERY_N = "every_n"  # every flush_every events
+FLUSH_POLICIES = (FLUSH_ON_CLOSE, FLUSH_PER_MATCH, FLUSH_EVERY_N)
+
+_BOUNDARY_TYPES = frozenset({"match_end", "series_end"})
+
+
+class JsonlFileSink:
+    """
+    S39: EventSink that streams events to JSONL files (same format as
+    export_events_jsonl), so memory stays constant however long the run.
+
+    - writes go through one large buffer (buffer_size bytes)
+    - flush policy: FLUSH_ON_CLOSE, FLUSH_PER_MATCH or FLUSH_EVERY_N
+    - max_bytes enables rotation: once a file reaches it, the next file is
+      started after the current match/series ends (a match never spans
+      files). Parts are named path, then <stem>.1<suffix>, <stem>.2<suffix>, ...
+    - use as a context manager, or call close()
+    - plain files only: compressed suffixes (.gz/.xz/.bz2) are rejected
+
+        with JsonlFileSink("runs/sim.jsonl", max_bytes=256 << 20) as sink:
+            SimRunner().run_matches(..., event_sink=sink)
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        *,
+        flush: str = FLUSH_PER_MATCH,
+        flush_every: int = 10_000,
+        buffer_size: int = 1 << 20,
+        max_bytes: Optional[int] = None,
+        interest: Optional[Iterable[str]] = None,
+    ) -> None:
+        if flush not in FLUSH_POLICIES:
+            raise ValueError(f"Unknown flush policy {flush!r}; expected one of {list(FLUSH_POLICIES)}")
+        if flush_every <= 0:
+            raise ValueError("JsonlFileSink.flush_every must be > 0")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("JsonlFileSink.max_bytes must be > 0 (or None)")
+
+        self.path = Path(path).expanduser().resolve()
+        if codec_for(self.path) is not None:
+            raise ValueError(
+                f"JsonlFileSink writes plain JSONL, not {self.path.suffix}; write a .jsonl file "
+                f"(export_events_jsonl writes block-compressed logs)"
+            )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.interest: Optional[FrozenSet[str]] = None if interest is None else frozenset(interest)
+
+        self._flush_policy = flush
+        self._flush_every = int(flush_every)
+        self._buffer_size = int(buffer_size)
+        self._max_bytes = max_bytes
+
+        self._paths: List[Path] = []
+        self._file: BinaryIO
+        self._bytes = 0  # bytes written to the current part
+        self._since_flush = 0
+        self._rotate = False  # start a new part on the next emit
+        self._closed = False
+        self.events_written = 0
+        self._open_part()
+
+    def _part_path(self, n: int) -> Path:
+        if n == 0:
+            return self.path
+        return self.path.with_name(f"{self.path.stem}.{n}{self.path.suffix}")
+
+    def _open_part(self) -> None:
+        p = self._part_path(len(self._paths))
+        self._file = p.open("wb", buffering=self._buffer_size)
+        self._paths.append(p)
+        self._bytes = 0
+
+    @property
+    def paths(self) -> List[Path]:
+        """Files written so far, in order."""
+        return list(self._paths)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def emit(self, event: Event) -> None:
+        if self._closed:
+            raise ValueError("JsonlFileSink is closed")
+        if self._rotate:
+            self._file.close()
+            self._open_part()
+            self._rotate = False
+        f = self._file
+
+        line = (event_to_json(event) + "\n").encode("utf-8")
+        f.write(line)
+        self._bytes += len(line)
+        self.events_written += 1
+
+        policy = self._flush_policy
+        if policy == FLUSH_EVERY_N:
+            self._since_flush += 1
+            if self._since_flush >= self._flush_every:
+                self.flush()
+
+        if event.type in _BOUNDARY_TYPES:
+            if policy == FLUSH_PER_MATCH:
+                self.flush()
+            if self._max_bytes is not None and self._bytes >= self._max_bytes:
+                self._rotate = True
+
+    def flush(self) -> None:
+        if not self._closed:
+            self._file.flush()
+        self._since_flush = 0
+
+    def close(self) -> None:
+        if not self._closed:
+            self._file.close()
+            self._closed = True
+
+    def __enter__(self) -> "JsonlFileSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from collections import Counter
-from typing import Dict, Iterable, List, Optional
+from itertools import islice
+from typing import Dict, Iterable, Optional, Sized
 
 from bg_ai.events.model import Event
 
@@ -15,20 +16,29 @@ def format_event(ev: Event) -> str:
 
 def summarize_event_types(events: Iterable[Event]) -> Dict[str, int]:
     """
-    Count event types.
+    Count event types (single pass; S42: works on lazy iterators such as iter_events).
     """
     c = Counter(ev.type for ev in events)
     return dict(c)
 
 
-def print_events(events: List[Event], limit: int = 50) -> None:
+def print_events(events: Iterable[Event], limit: int = 50) -> None:
     """
-    Print up to `limit` events in order.
+    Print up to `limit` events in order. Lazy iterators are read at most
+    limit + 1 events (the overflow line then has no count).
     """
-    for ev in events[:limit]:
+    if isinstance(events, Sized):
+        total = len(events)
+        for ev in islice(events, limit):
+            print(format_event(ev))
+        if total > limit:
+            print(f"... ({total - limit} more events)")
+        return
+    it = iter(events)
+    for ev in islice(it, limit):
         print(format_event(ev))
-    if len(events) > limit:
-        print(f"... ({len(events) - limit} more events)")
+    if next(it, None) is not None:
+        print("... (more events)")
 
 
 def print_event_summary(events: Iterable[Event]) -> None:
@@ -1,25 +1,57 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Protocol
+from typing import FrozenSet, Iterable, List, Optional, Protocol
 
 from .model import Event
 
 
 class EventSink(Protocol):
+    """
+    Receives events in emission order.
+
+    S30: a sink may also expose an optional attribute
+
+        interest: Optional[FrozenSet[str]]
+
+    naming the event types it consumes (None or missing = all types).
+    Runners read it once per run and never build events outside it.
+    """
     def emit(self, event: Event) -> None:
         ...
 
 
+def sink_interest(sink: object) -> Optional[FrozenSet[str]]:
+    """
+    Return the event types a sink declared interest in (None = everything).
+    """
+    interest = getattr(sink, "interest", None)
+    if interest is None:
+        return None
+    return frozenset(interest)
+
+
+def filter_types(types: FrozenSet[str], sink: object) -> FrozenSet[str]:
+    """
+    Restrict `types` to those the sink wants.
+    """
+    interest = sink_interest(sink)
+    if interest is None:
+        return types
+    return types & interest
+
+
 @dataclass
 class InMemoryEventSink:
     """
     MVP sink: stores events in-memory in insertion order.
     """
     _events: List[Event]
+    interest: Optional[FrozenSet[str]]
 
-    def __init__(self) -> None:
+    def __init__(self, interest: Optional[Iterable[str]] = None) -> None:
         self._events = []
+        self.interest = None if interest is None else frozenset(interest)
 
     def emit(self, event: Event) -> None:
         self._events.append(event)
@@ -30,3 +62,33 @@ class InMemoryEventSink:
 
     def __len__(self) -> int:
         return len(self._events)
+
+
+class NullEventSink:
+    """
+    S30: discards everything and declares no interest, so runners skip
+    building events entirely.
+    """
+    interest: FrozenSet[str] = frozenset()
+
+    def emit(self, event: Event) -> None:
+        return None
+
+
+class TeeEventSink:
+    """
+    S50: forwards each event to several sinks, each filtered by its own
+    interest; declares the union of their interests.
+    """
+    def __init__(self, *sinks: EventSink) -> None:
+        self.sinks = tuple(sinks)
+        self._interests = tuple(sink_interest(s) for s in self.sinks)
+        self.interest: Optional[FrozenSet[str]] = (
+            None if any(i is None for i in self._interests)
+            else frozenset().union(*self._interests)  # type: ignore[arg-type]
+        )
+
+    def emit(self, event: Event) -> None:
+        for sink, interest in zip(self.sinks, self._interests):
+            if interest is None or event.type in interest:
+                sink.emit(event)
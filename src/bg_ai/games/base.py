@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol, Tuple
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
 
 
 JSONValue = Any
@@ -24,6 +24,15 @@ class Game(Protocol):
     Game ruleset contract (conceptual).
     Concrete games define their own State and Action structures, but the engine
     interacts with them through this interface.
+
+    S38 (optional): checkpointing support
+
+        snapshot_state(self, state) -> JSON-safe value or bytes
+        restore_state(self, snapshot) -> state
+
+    restore_state(snapshot_state(s)) must behave exactly like s, and the
+    snapshot must not alias s (states may be mutated in place). Needed for
+    MatchConfig.snapshot_every and run_match(resume_from=...).
     """
     game_id: str
 
@@ -39,12 +48,15 @@ class Game(Protocol):
         """
         ...
 
-    def legal_actions(self, state: Any, actor_id: str) -> Optional[List[Any]]:
+    def legal_actions(self, state: Any, actor_id: str) -> Optional[Sequence[Any]]:
         """
         Return legal actions for actor_id.
 
         - If you return None: engine treats it as "game does not provide legal action list".
         - For MVP, most games should return a list.
+        - S34: games may return a shared, precomputed tuple (e.g. picked by a cheap
+          state signature); the engine passes tuples to policies without copying.
+          Lists are still copied, since they may be mutated.
         """
         ...
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from bg_ai.games.base import MatchResult
 from bg_ai.games.phases.ids import PhaseId
@@ -11,6 +11,7 @@ from .rules import CHOOSE_RULES, END_RULES, RESOLVE_RULES
 from .types import (
     BuyPlayAction,
     BuyPlayMemory,
+    BuyPlayPending,
     BuyPlayState,
     PHASE_CHOOSE,
     PHASE_END,
@@ -69,9 +70,9 @@ class BuyPlayGame:
     def current_actor_ids(self, state: BuyPlayState) -> List[str]:
         return self._rules(state.phase).current_actor_ids(state)
 
-    def legal_actions(self, state: BuyPlayState, actor_id: str) -> Optional[List[BuyPlayAction]]:
+    def legal_actions(self, state: BuyPlayState, actor_id: str) -> Optional[Sequence[BuyPlayAction]]:
         if state.phase == PHASE_END:
-            return []
+            return ()
         return self._rules(state.phase).legal_actions(state, actor_id)  # type: ignore[return-value]
 
     def apply_actions(
@@ -89,6 +90,48 @@ class BuyPlayGame:
     def is_terminal(self, state: BuyPlayState) -> bool:
         return state.phase == PHASE_END
 
+    def snapshot_state(self, state: BuyPlayState) -> Dict[str, Any]:
+        """
+        S38: compact JSON form (per-actor values in actor order, actions as wire strings).
+        """
+        mem = state.memory
+        actors = mem.actors
+        pending = state.pending
+        return {
+            "phase": state.phase,
+            "actors": list(actors),
+            "coins": [int(mem.coins_by_actor[a]) for a in actors],
+            "points": [int(mem.points_by_actor[a]) for a in actors],
+            "turn": int(mem.turn),
+            "max_turns": int(mem.max_turns),
+            "pending": (
+                None if pending is None
+                else [pending.actions_by_actor[a].to_wire() for a in actors]
+            ),
+        }
+
+    def restore_state(self, snapshot: Dict[str, Any]) -> BuyPlayState:
+        a_id, b_id = (str(a) for a in snapshot["actors"])
+        actors = (a_id, b_id)
+        mem = BuyPlayMemory(
+            actors=actors,
+            coins_by_actor=dict(zip(actors, (int(c) for c in snapshot["coins"]))),
+            points_by_actor=dict(zip(actors, (int(p) for p in snapshot["points"]))),
+            turn=int(snapshot["turn"]),
+            max_turns=int(snapshot["max_turns"]),
+        )
+        pending = snapshot.get("pending")
+        return BuyPlayState(
+            phase=snapshot["phase"],
+            memory=mem,
+            pending=(
+                None if pending is None
+                else BuyPlayPending(
+                    actions_by_actor={a: BuyPlayAction.from_wire(w) for a, w in zip(actors, pending)}
+                )
+            ),
+        )
+
     def result(self, state: BuyPlayState) -> MatchResult:
         a_id, b_id = state.memory.actors
         a_points = int(state.memory.points_by_actor.get(a_id, 0))
@@ -16,6 +16,16 @@ from .types import (
 )
 
 
+# S34: precomputed legal action tables.
+# CHOOSE only depends on one bit of state (coins >= 1), RESOLVE is fixed.
+_CHOOSE_LEGAL_BY_HAS_COINS: Dict[bool, Tuple[BuyPlayAction, ...]] = {
+    False: (BuyPlayAction.BUY, BuyPlayAction.PASS),
+    True: (BuyPlayAction.BUY, BuyPlayAction.PASS, BuyPlayAction.PLAY, BuyPlayAction.BOTH),
+}
+_RESOLVE_LEGAL: Tuple[BuyPlayAction, ...] = (BuyPlayAction.PASS,)
+_NO_ACTIONS: Tuple[Any, ...] = ()
+
+
 @dataclass(frozen=True, slots=True)
 class ChoosePhaseRules(PhaseRules):
     def current_actor_ids(self, state: BuyPlayState) -> List[str]:
@@ -24,15 +34,12 @@ class ChoosePhaseRules(PhaseRules):
         a_id, b_id = state.memory.actors
         return [a_id, b_id]
 
-    def legal_actions(self, state: BuyPlayState, actor_id: str) -> List[BuyPlayAction]:
+    def legal_actions(self, state: BuyPlayState, actor_id: str) -> Tuple[BuyPlayAction, ...]:
         if actor_id not in state.memory.actors:
             raise ValueError(f"Unknown actor_id for BuyPlay: {actor_id!r}")
 
         coins = int(state.memory.coins_by_actor.get(actor_id, 0))
-        actions: List[BuyPlayAction] = [BuyPlayAction.BUY, BuyPlayAction.PASS]
-        if coins >= 1:
-            actions.extend([BuyPlayAction.PLAY, BuyPlayAction.BOTH])
-        return actions
+        return _CHOOSE_LEGAL_BY_HAS_COINS[coins >= 1]
 
     def apply_actions(
         self,
@@ -55,6 +62,7 @@ class ChoosePhaseRules(PhaseRules):
         a_act = _coerce(actions_by_actor[a_id])
         b_act = _coerce(actions_by_actor[b_id])
 
+        # Same precomputed tables the engine hands to policies (no per-call lists).
         a_legal = self.legal_actions(state, a_id)
         b_legal = self.legal_actions(state, b_id)
         if a_act not in a_legal:
@@ -84,10 +92,10 @@ class ResolvePhaseRules(PhaseRules):
         a_id, b_id = state.memory.actors
         return [a_id, b_id]
 
-    def legal_actions(self, state: BuyPlayState, actor_id: str) -> List[BuyPlayAction]:
+    def legal_actions(self, state: BuyPlayState, actor_id: str) -> Tuple[BuyPlayAction, ...]:
         if actor_id not in state.memory.actors:
             raise ValueError(f"Unknown actor_id for BuyPlay: {actor_id!r}")
-        return [BuyPlayAction.PASS]
+        return _RESOLVE_LEGAL
 
     def apply_actions(
         self,
@@ -166,8 +174,8 @@ class EndPhaseRules(PhaseRules):
     def current_actor_ids(self, state: BuyPlayState) -> List[str]:
         return []
 
-    def legal_actions(self, state: BuyPlayState, actor_id: str) -> List[Any]:
-        return []
+    def legal_actions(self, state: BuyPlayState, actor_id: str) -> Tuple[Any, ...]:
+        return _NO_ACTIONS
 
     def apply_actions(
         self,
@@ -8,6 +8,10 @@ from bg_ai.games.base import MatchResult
 from .types import FingersAction, MatchingFingersState
 
 
+# S34: the legal action set never changes, so it is built once and shared.
+_LEGAL_ACTIONS: Tuple[FingersAction, ...] = (FingersAction.ONE, FingersAction.TWO)
+
+
 @dataclass(frozen=True, slots=True)
 class MatchingFingersGame:
     """Matching Fingers game.
@@ -51,10 +55,10 @@ class MatchingFingersGame:
             return []
         return [state.actors[0], state.actors[1]]
 
-    def legal_actions(self, state: MatchingFingersState, actor_id: str) -> Optional[List[FingersAction]]:
+    def legal_actions(self, state: MatchingFingersState, actor_id: str) -> Optional[Tuple[FingersAction, ...]]:
         if actor_id not in state.actors:
             raise ValueError(f"Unknown actor_id for MatchingFingers: {actor_id!r}")
-        return [FingersAction.ONE, FingersAction.TWO]
+        return _LEGAL_ACTIONS
 
     def apply_actions(
         self,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Protocol, Tuple
+from typing import Any, Dict, List, Protocol, Sequence, Tuple
 
 from bg_ai.engine.rng import RNG
 
@@ -22,10 +22,11 @@ class PhaseRules(Protocol):
         """
         ...
 
-    def legal_actions(self, state: Any, actor_id: str) -> List[Any]:
+    def legal_actions(self, state: Any, actor_id: str) -> Sequence[Any]:
         """
         Return the legal actions for this actor in this phase.
         For now actions can be ActionEnum or any other domain type.
+        Prefer returning a shared precomputed tuple (S34).
         """
         ...
 
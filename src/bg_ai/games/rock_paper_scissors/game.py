@@ -8,6 +8,10 @@ from bg_ai.games.base import MatchResult
 from .types import RPSAction, RPSState, beats
 
 
+# S34: the legal action set never changes, so it is built once and shared.
+_LEGAL_ACTIONS: Tuple[RPSAction, ...] = (RPSAction.ROCK, RPSAction.PAPER, RPSAction.SCISSORS)
+
+
 @dataclass(frozen=True, slots=True)
 class RPSGame:
     """
@@ -34,10 +38,10 @@ class RPSGame:
             return []
         return [state.actors[0], state.actors[1]]
 
-    def legal_actions(self, state: RPSState, actor_id: str) -> Optional[List[RPSAction]]:
+    def legal_actions(self, state: RPSState, actor_id: str) -> Optional[Tuple[RPSAction, ...]]:
         if actor_id not in state.actors:
             raise ValueError(f"Unknown actor_id for RPS: {actor_id!r}")
-        return [RPSAction.ROCK, RPSAction.PAPER, RPSAction.SCISSORS]
+        return _LEGAL_ACTIONS
 
     def apply_actions(
         self,
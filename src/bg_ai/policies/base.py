@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Sequence
 
 from bg_ai.stats.base import StatsQuery
 
@@ -18,12 +18,36 @@ class DecisionContext:
     tick: int
     actor_id: str
     state: Any
-    legal_actions: List[Any]
+    legal_actions: Sequence[Any]  # S34: may be a shared tuple; never mutate
     rng: RNG
     game_id: str
     stats: StatsQuery
 
 
 class Policy(Protocol):
+    """
+    S31: a policy may also implement the optional
+
+        decide_batch(self, contexts: Sequence[DecisionContext]) -> List[Any]
+
+    returning one action per context (same order). BatchMatchRunner calls it
+    once per agent per tick; policies without it are looped via decide().
+    """
     def decide(self, ctx: DecisionContext) -> Any:
         ...
+
+
+def decide_batch(policy: Policy, contexts: Sequence[DecisionContext]) -> List[Any]:
+    """
+    Decide for many contexts at once, using policy.decide_batch when available.
+    """
+    batch = getattr(policy, "decide_batch", None)
+    if batch is None:
+        return [policy.decide(ctx) for ctx in contexts]
+
+    actions = list(batch(contexts))
+    if len(actions) != len(contexts):
+        raise RuntimeError(
+            f"{type(policy).__name__}.decide_batch returned {len(actions)} actions for {len(contexts)} contexts"
+        )
+    return actions
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import copy
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from bg_ai.engine.checkpoint import Checkpoint, require_snapshots
+from bg_ai.engine.rng import RNG
+from bg_ai.events.model import Event
+from bg_ai.games.base import Game, MatchResult
+
+from .replayer import ReplayConfig, Replayer
+
+
+def _state_copier(game: Game) -> Tuple[Callable[[Any], Any], Callable[[Any], Any]]:
+    # (to copy, from copy): the game's compact snapshot form when it has one (S38).
+    snap = getattr(game, "snapshot_state", None)
+    restore = getattr(game, "restore_state", None)
+    if callable(snap) and callable(restore):
+        return snap, restore
+    return copy.deepcopy, copy.deepcopy
+
+
+class ReplayCursor:
+    """
+    S48: random access to the states of one replayed match.
+
+    The constructor reads the events once, keeps each tick's decisions and
+    stores a state copy after every `every`-th applied tick. state_at(tick)
+    restores the nearest stored state at or before the tick and applies at
+    most `every` ticks (same apply_actions / rng.fork(f"game:apply:{tick}")
+    semantics as Replayer).
+
+    At most max_snapshots copies are kept, least recently used dropped first
+    (the initial state is always kept); grid states rebuilt by state_at are
+    stored again. States are copied with the game's snapshot_state /
+    restore_state when available, else deepcopy.
+
+    With config.from_snapshot and no seed_set (a log part that starts at a
+    state_snapshot), the cursor starts at the first snapshot.
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        events: Iterable[Event],
+        config: ReplayConfig,
+        *,
+        every: int = 64,
+        max_snapshots: Optional[int] = 128,
+    ) -> None:
+        if every <= 0:
+            raise ValueError("every must be > 0")
+        if max_snapshots is not None and max_snapshots <= 0:
+            raise ValueError("max_snapshots must be > 0 (or None for unbounded)")
+        self.game = game
+        self.every = int(every)
+        self.max_snapshots = max_snapshots
+        self._to_copy, self._from_copy = _state_copier(game)
+
+        # Pass 1: decisions per tick and the starting point.
+        actions: Dict[int, Dict[str, Any]] = {}
+        rng: Optional[RNG] = None
+        initial: Any = None
+        self.first_tick = 0
+        for ev in events:
+            if ev.type == "decision_provided":
+                actor_id = ev.payload.get("actor_id")
+                if not isinstance(actor_id, str):
+                    raise ValueError(f"decision_provided missing/invalid actor_id: {ev.payload!r}")
+                actions.setdefault(ev.tick, {})[actor_id] = ev.payload.get("action")
+            elif ev.type == "seed_set" and rng is None:
+                rng = RNG.from_seed(Replayer._extract_seed([ev]), Replayer._extract_rng_backend([ev]))
+                initial = game.initial_state(rng.fork("game:init"), dict(config.game_config))
+            elif ev.type == "state_snapshot" and rng is None and config.from_snapshot:
+                require_snapshots(game)
+                ckpt = Checkpoint.from_event(ev)
+                rng = RNG.from_seed(ckpt.seed, ckpt.rng_backend)
+                initial = game.restore_state(ckpt.state)  # type: ignore[attr-defined]
+                self.first_tick = ckpt.tick
+        if rng is None:
+            raise ValueError("Cannot replay: missing seed_set event")
+
+        self._rng = rng
+        self._actions = actions
+        self._ticks: List[int] = sorted(t for t in actions if t >= self.first_tick)
+        self._initial = self._to_copy(initial)
+        self._snaps: "OrderedDict[int, Any]" = OrderedDict()  # position in _ticks -> state copy after it
+        self.applications = 0  # apply_actions calls made by state_at()
+
+        # Pass 2: grid copies.
+        state = initial
+        for pos, tick in enumerate(self._ticks):
+            state = self._apply(state, tick)
+            if (pos + 1) % self.every == 0:
+                self._store(pos, state)
+        self.applications = 0
+
+    @property
+    def ticks(self) -> List[int]:
+        """Ticks that had decisions (the ticks at which the state changes)."""
+        return list(self._ticks)
+
+    @property
+    def snapshot_count(self) -> int:
+        return len(self._snaps)
+
+    def _apply(self, state: Any, tick: int) -> Any:
+        self.applications += 1
+        state, _domain_payloads = self.game.apply_actions(state, self._actions[tick], self._rng.fork(f"game:apply:{tick}"))
+        return state
+
+    def _store(self, pos: int, state: Any) -> None:
+        self._snaps[pos] = self._to_copy(state)
+        self._snaps.move_to_end(pos)
+        if self.max_snapshots is not None and len(self._snaps) > self.max_snapshots:
+            self._snaps.popitem(last=False)
+
+    def state_at(self, tick: int) -> Any:
+        """
+        State after every tick <= tick has been applied (a fresh copy; the
+        initial state for ticks before the first decision).
+        """
+        if tick < self.first_tick - 1:
+            raise ValueError(f"tick {tick} is before the replay start (tick {self.first_tick})")
+        target = bisect_right(self._ticks, tick) - 1  # last position to apply
+        if target < 0:
+            return self._from_copy(self._initial)
+
+        # Copies only exist at grid positions every-1, 2*every-1, ...: nearest one at or before target.
+        pos = (target + 1) // self.every * self.every - 1
+        while pos >= 0 and pos not in self._snaps:
+            pos -= self.every
+        if pos >= 0:
+            self._snaps.move_to_end(pos)
+            state = self._from_copy(self._snaps[pos])
+        else:
+            state = self._from_copy(self._initial)
+
+        for p in range(pos + 1, target + 1):
+            state = self._apply(state, self._ticks[p])
+            if (p + 1) % self.every == 0 and p not in self._snaps:
+                self._store(p, state)
+        return state
+
+    def result_at(self, tick: int) -> MatchResult:
+        return self.game.result(self.state_at(tick))
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from bg_ai.engine.rng import RNG
+from bg_ai.events.codecs_jsonl import PathLike, iter_events
+from bg_ai.events.model import Event
+from bg_ai.games.base import Game
+
+from .replayer import ReplayConfig, Replayer
+from .verify import DEFAULT_PATTERNS, ReplayTargets, as_json, find_logs, result_diff
+
+
+# S49: first tick where a replay stops reproducing the logged domain events.
+#
+# Needs logs whose trace level keeps domain_event and tick_end (the full
+# level); other levels are rejected as not checkable rather than reported as
+# divergences. Each tick is checked when it is done (its tick_end, match_end,
+# or the first event of a later tick) and then dropped, so memory does not
+# grow with match length.
+
+
+@dataclass(frozen=True, slots=True)
+class DomainDivergence:
+    match_id: str
+    tick: int
+    phase: Optional[str]  # phase the actions were applied in (PhaseState games), else None
+    index: int  # position of the first differing domain_event within the tick
+    logged: int  # domain_event count at this tick: in the log / from the replay
+    replayed: int
+    # Differing payload keys of the first differing pair: key -> [logged, replayed].
+    diff: Dict[str, List[Any]] = field(default_factory=dict)
+    path: str = ""
+    message: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"match_id": self.match_id, "tick": self.tick, "phase": self.phase, "index": self.index,
+                             "logged": self.logged, "replayed": self.replayed}
+        if self.diff:
+            d["diff"] = self.diff
+        if self.path:
+            d["path"] = self.path
+        if self.message:
+            d["message"] = self.message
+        return d
+
+
+def _first_difference(
+    match_id: str, tick: int, phase: Optional[str], logged: List[Dict[str, Any]], replayed: List[Dict[str, Any]]
+) -> Optional[DomainDivergence]:
+    for i in range(max(len(logged), len(replayed))):
+        if i >= len(logged) or i >= len(replayed) or logged[i] != replayed[i]:
+            a = logged[i] if i < len(logged) else {}
+            b = replayed[i] if i < len(replayed) else {}
+            return DomainDivergence(match_id, tick, phase, i, len(logged), len(replayed), result_diff(a, b))
+    return None
+
+
+class DomainEventChecker:
+    """
+    S49: feed one match's events in log order; feed() returns the first
+    divergence (once), else None. Same replay semantics as Replayer.
+    Raises ValueError ("not checkable") for a log without tick_end /
+    domain_event events (trace_level other than full).
+    """
+
+    def __init__(self, game: Game, config: ReplayConfig) -> None:
+        self.game = game
+        self.config = config
+        self.match_id = ""
+        self.divergence: Optional[DomainDivergence] = None
+        self._rng: Optional[RNG] = None
+        self._state: Any = None
+        self._tick = -1
+        self._actions: Dict[str, Any] = {}
+        self._logged: List[Dict[str, Any]] = []
+        self._full = False  # saw tick_end / domain_event: the log is a full trace
+
+    def feed(self, ev: Event) -> Optional[DomainDivergence]:
+        if self.divergence is not None:
+            return None
+        self.match_id = ev.match_id
+        if (self._actions or self._logged) and ev.tick != self._tick:
+            d = self._check(self._tick)
+            if d is not None:
+                return d
+        t = ev.type
+        if t == "decision_provided":
+            actor_id = ev.payload.get("actor_id")
+            if not isinstance(actor_id, str):
+                raise ValueError(f"decision_provided missing/invalid actor_id: {ev.payload!r}")
+            self._tick = ev.tick
+            self._actions[actor_id] = ev.payload.get("action")
+        elif t == "domain_event":
+            self._full = True
+            self._tick = ev.tick
+            self._logged.append(as_json(ev.payload))
+        elif t == "tick_end":
+            self._full = True
+            return self._check(ev.tick)
+        elif t == "match_end":
+            return self._check(self._tick)
+        elif t == "seed_set" and self._rng is None:
+            self._rng = RNG.from_seed(Replayer._extract_seed([ev]), Replayer._extract_rng_backend([ev]))
+            self._state = self.game.initial_state(self._rng.fork("game:init"), dict(self.config.game_config))
+        return None
+
+    def _check(self, tick: int) -> Optional[DomainDivergence]:
+        if not self._actions and not self._logged:
+            return None
+        if self._rng is None:
+            raise ValueError("Cannot replay: missing seed_set event")
+        if not self._full:
+            raise ValueError(
+                f"Match {self.match_id} is not checkable: no tick_end/domain_event events (needs trace_level 'full')"
+            )
+        phase = getattr(self._state, "phase", None)
+        replayed: List[Dict[str, Any]] = []
+        if self._actions:
+            self._state, payloads = self.game.apply_actions(
+                self._state, self._actions, self._rng.fork(f"game:apply:{tick}")
+            )
+            replayed = [as_json(dict(p)) for p in payloads]
+        logged, self._logged, self._actions = self._logged, [], {}
+        self.divergence = _first_difference(
+            self.match_id, tick, None if phase is None else str(phase), logged, replayed
+        )
+        return self.divergence
+
+    def finish(self) -> Optional[DomainDivergence]:
+        """
+        Check a last tick cut off before its tick_end (truncated log).
+        """
+        if self.divergence is None and (self._actions or self._logged):
+            return self._check(self._tick)
+        return self.divergence
+
+
+def find_divergence(game: Game, events: Iterable[Event], config: ReplayConfig) -> Optional[DomainDivergence]:
+    """
+    First tick of one match whose regenerated domain events differ from the
+    logged ones (None = the replay matches). Stops reading at that tick.
+    """
+    checker = DomainEventChecker(game, config)
+    for ev in events:
+        d = checker.feed(ev)
+        if d is not None:
+            return d
+    return checker.finish()
+
+
+def find_divergences_in_file(path: str, targets: ReplayTargets) -> List[DomainDivergence]:
+    """
+    First divergence of every match in one log (matches that replay cleanly are omitted).
+    """
+    checkers: Dict[str, DomainEventChecker] = {}
+    waiting: Dict[str, List[Event]] = {}  # events before match_start told us the game
+    finished: Set[str] = set()
+    found: List[DomainDivergence] = []
+
+    def _start(match_id: str, game_id: Optional[str]) -> Optional[DomainEventChecker]:
+        if game_id is None and len(targets) == 1:
+            game_id = next(iter(targets))
+        target = targets.get(game_id) if game_id is not None else None
+        if target is None:
+            found.append(DomainDivergence(match_id, -1, None, -1, 0, 0, path=path, message=f"unknown game_id={game_id!r}"))
+            finished.add(match_id)
+            return None
+        factory, game_config = target
+        checker = checkers[match_id] = DomainEventChecker(factory(), ReplayConfig(game_config=game_config))
+        return checker
+
+    def _feed(checker: DomainEventChecker, ev: Event) -> None:
+        try:
+            d = checker.feed(ev)
+        except Exception as e:  # reported, not raised: one bad match must not stop the run
+            d = DomainDivergence(ev.match_id, ev.tick, None, -1, 0, 0, message=f"{type(e).__name__}: {e}")
+        if d is not None:
+            found.append(replace(d, path=path))
+            finished.add(ev.match_id)
+            checkers.pop(ev.match_id, None)
+
+    for ev in iter_events(path):
+        mid = ev.match_id
+        if mid in finished or ev.type.startswith("series_"):
+            continue
+        checker = checkers.get(mid)
+        if checker is None:
+            if ev.type == "seed_set":
+                waiting.setdefault(mid, []).append(ev)
+                continue
+            checker = _start(mid, str(ev.payload.get("game_id")) if ev.type == "match_start" else None)
+            if checker is None:
+                continue
+            for early in waiting.pop(mid, ()):
+                _feed(checker, early)
+        _feed(checker, ev)
+        if ev.type == "match_end" and mid in checkers:
+            d = checkers.pop(mid).finish()
+            finished.add(mid)
+            if d is not None:
+                found.append(replace(d, path=path))
+
+    for mid, checker in checkers.items():
+        d = checker.finish()
+        if d is not None:
+            found.append(replace(d, path=path))
+    return found
+
+
+def find_divergences(
+    root: PathLike,
+    targets: ReplayTargets,
+    *,
+    patterns: Sequence[str] = DEFAULT_PATTERNS,
+    workers: int = 2,
+) -> List[DomainDivergence]:
+    """
+    find_divergence for every match of every log under root, one file per
+    pool task (see verify_logs for targets). Results are in file order.
+    """
+    paths = [str(p) for p in find_logs(root, patterns)]
+    if workers <= 1 or len(paths) <= 1:
+        parts = [find_divergences_in_file(p, targets) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(find_divergences_in_file, paths, [targets] * len(paths)))
+    return [d for part in parts for d in part]
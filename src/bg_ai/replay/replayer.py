@@ -1,19 +1,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from bg_ai.engine.rng import RNG
+from bg_ai.engine.checkpoint import Checkpoint, require_snapshots
+from bg_ai.engine.rng import DEFAULT_RNG_BACKEND, RNG
 from bg_ai.events.model import Event
 from bg_ai.games.base import Game, MatchResult
 
 
+# S46: events that close a tick's decisions in a streamed log.
+_TICK_DONE = frozenset({"actions_applied", "tick_end", "match_end"})
+
+
 @dataclass(frozen=True, slots=True)
 class ReplayConfig:
     """
     MVP replay config.
+
+    S38: from_snapshot=True starts from the last state_snapshot in the log
+    (only later ticks are re-applied); earlier ticks are then not re-verified.
     """
     game_config: Dict[str, Any]
+    from_snapshot: bool = False
 
 
 class Replayer:
@@ -21,25 +30,38 @@ class Replayer:
     Rebuild match outcome from events WITHOUT calling policies.
 
     MVP replay uses:
-    - seed_set for RNG seed
+    - seed_set for RNG seed (and rng_backend, S32; missing = default backend)
     - decision_provided events for actions per tick per actor
     - game.apply_actions to advance state
+    - S38: optionally the last state_snapshot instead of initial_state
+
+    S46: replay_stream / iter_states consume the events in one pass and keep
+    only the current tick's actions (memory independent of match length).
     """
 
-    def replay(self, game: Game, events: List[Event], config: ReplayConfig) -> MatchResult:
+    def replay(self, game: Game, events: Iterable[Event], config: ReplayConfig) -> MatchResult:
+        # S42: any iterable of one match's events (e.g. iter_events(path, match_ids=[...])).
+        events = events if isinstance(events, list) else list(events)
         if not events:
             raise ValueError("Cannot replay: empty event list")
 
         # All events should share the same match_id, but we don't strictly enforce in MVP.
-        seed = self._extract_seed(events)
-        rng = RNG.from_seed(seed)
-
-        state = game.initial_state(rng.fork("game:init"), dict(config.game_config))
+        start_tick = 0
+        if config.from_snapshot and any(ev.type == "state_snapshot" for ev in events):
+            require_snapshots(game)
+            checkpoint = Checkpoint.latest(events)
+            rng = RNG.from_seed(checkpoint.seed, checkpoint.rng_backend)
+            state = game.restore_state(checkpoint.state)
+            start_tick = checkpoint.tick
+        else:
+            seed = self._extract_seed(events)
+            rng = RNG.from_seed(seed, self._extract_rng_backend(events))
+            state = game.initial_state(rng.fork("game:init"), dict(config.game_config))
 
         # Group actions by tick
         actions_by_tick: Dict[int, Dict[str, Any]] = {}
         for ev in events:
-            if ev.type == "decision_provided":
+            if ev.type == "decision_provided" and ev.tick >= start_tick:
                 actor_id = ev.payload.get("actor_id")
                 action = ev.payload.get("action")
                 if not isinstance(actor_id, str):
@@ -53,6 +75,92 @@ class Replayer:
 
         return game.result(state)
 
+    def iter_states(
+        self,
+        game: Game,
+        events: Iterable[Event],
+        config: ReplayConfig,
+        *,
+        until_tick: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        S46: one-pass replay; yields (tick, state after that tick) as soon as a
+        tick's decisions are complete (tick_end / actions_applied / match_end,
+        or the first event of a later tick).
+
+        Events must be in log order. With config.from_snapshot, a state_snapshot
+        met in the stream replaces the state (so a log part that starts after
+        seed_set, e.g. a resumed match, can still be replayed).
+
+        With until_tick, stops at the first event of a later tick: nothing after
+        until_tick is applied, even when until_tick itself had no decisions.
+        """
+        rng: Optional[RNG] = None
+        state: Any = None
+        tick = -1
+        pending: Dict[str, Any] = {}
+        last_applied = -1
+
+        for ev in events:
+            if pending and (ev.tick != tick or ev.type in _TICK_DONE):
+                state, _domain_payloads = game.apply_actions(state, pending, rng.fork(f"game:apply:{tick}"))  # type: ignore[union-attr]
+                last_applied = tick
+                pending = {}
+                yield tick, state
+
+            if until_tick is not None and ev.tick > until_tick and rng is not None:
+                if last_applied < 0:
+                    yield -1, state  # no decisions up to until_tick: initial state
+                return
+
+            if ev.type == "decision_provided":
+                if rng is None:
+                    raise ValueError("Cannot replay: decision_provided before seed_set")
+                if ev.tick <= last_applied:
+                    raise ValueError(f"Cannot stream-replay: tick {ev.tick} arrives after tick {last_applied}")
+                actor_id = ev.payload.get("actor_id")
+                if not isinstance(actor_id, str):
+                    raise ValueError(f"decision_provided missing/invalid actor_id: {ev.payload!r}")
+                tick = ev.tick
+                pending[actor_id] = ev.payload.get("action")
+            elif ev.type == "seed_set" and rng is None:
+                rng = RNG.from_seed(self._extract_seed([ev]), self._extract_rng_backend([ev]))
+                state = game.initial_state(rng.fork("game:init"), dict(config.game_config))
+            elif ev.type == "state_snapshot" and config.from_snapshot:
+                require_snapshots(game)
+                checkpoint = Checkpoint.from_event(ev)
+                rng = RNG.from_seed(checkpoint.seed, checkpoint.rng_backend)
+                state = game.restore_state(checkpoint.state)
+
+        if rng is None:
+            raise ValueError("Cannot replay: missing seed_set event")
+        if pending:
+            state, _domain_payloads = game.apply_actions(state, pending, rng.fork(f"game:apply:{tick}"))
+            yield tick, state
+        elif last_applied < 0:
+            yield -1, state  # no decisions: initial state
+
+    def replay_stream(
+        self,
+        game: Game,
+        events: Iterable[Event],
+        config: ReplayConfig,
+        *,
+        until_tick: Optional[int] = None,
+    ) -> MatchResult:
+        """
+        S46: replay() in one pass over any event iterator (e.g. iter_events on a
+        compressed log). With until_tick, returns the result of the state after
+        every tick <= until_tick; reading stops at the first later tick.
+        """
+        state: Any = None
+        seen = False
+        for _tick, state in self.iter_states(game, iter(events), config, until_tick=until_tick):
+            seen = True
+        if not seen:
+            raise ValueError("Cannot replay: empty event list")
+        return game.result(state)
+
     @staticmethod
     def _extract_seed(events: List[Event]) -> int:
         for ev in events:
@@ -65,3 +173,10 @@ class Replayer:
                     return int(seed)
                 raise ValueError(f"seed_set has invalid seed: {ev.payload!r}")
         raise ValueError("Cannot replay: missing seed_set event")
+
+    @staticmethod
+    def _extract_rng_backend(events: List[Event]) -> str:
+        for ev in events:
+            if ev.type == "seed_set":
+                return str(ev.payload.get("rng_backend", DEFAULT_RNG_BACKEND))
+        return DEFAULT_RNG_BACKEND
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from bg_ai.events.codecs_jsonl import PathLike, iter_events
+from bg_ai.events.compression import codec_for
+from bg_ai.events.jsonl_index import MatchSpan, chunk_spans, read_match_index, read_spans
+from bg_ai.events.model import Event
+from bg_ai.games.base import Game
+
+from .replayer import ReplayConfig, Replayer
+
+
+# S47: bulk replay verification of a log directory.
+#
+# Every match in every log is replayed (split by match across a process pool,
+# see verify_logs) and its result details are compared with the logged
+# match_end payload. Matches are grouped by match_id while a file (or chunk)
+# streams through, and each is verified and dropped at its match_end, so
+# memory is bounded by the matches in flight.
+
+STATUS_MISMATCH = "mismatch"  # replayed details differ from match_end
+STATUS_ERROR = "error"  # replay raised
+STATUS_INCOMPLETE = "incomplete"  # no match_end in the log
+STATUS_UNKNOWN_GAME = "unknown_game"  # no target for the match's game_id
+STATUS_NO_DECISIONS = "no_decisions"  # match_end but no decision_provided (e.g. results_only trace): not replayable
+
+DEFAULT_PATTERNS = ("*.jsonl", "*.jsonl.gz", "*.jsonl.xz", "*.jsonl.bz2")
+
+# game_id -> (picklable zero-arg Game factory, game_config used for the matches)
+ReplayTargets = Mapping[str, Tuple[Callable[[], Game], Dict[str, Any]]]
+
+
+@dataclass(frozen=True, slots=True)
+class Divergence:
+    path: str
+    match_id: str
+    status: str
+    # Differing result keys: key -> [logged, replayed] (mismatch only).
+    diff: Dict[str, List[Any]] = field(default_factory=dict)
+    message: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"path": self.path, "match_id": self.match_id, "status": self.status}
+        if self.diff:
+            d["diff"] = self.diff
+        if self.message:
+            d["message"] = self.message
+        return d
+
+
+@dataclass(frozen=True, slots=True)
+class VerifyReport:
+    files: int
+    matches: int
+    divergences: List[Divergence]
+
+    @property
+    def ok(self) -> bool:
+        return not self.divergences
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "files": self.files,
+            "matches": self.matches,
+            "diverged": len(self.divergences),
+            "divergences": [d.to_dict() for d in self.divergences],
+        }
+
+    def write(self, path: PathLike) -> Path:
+        """
+        Write the report as one compact JSON document.
+        """
+        p = Path(path).expanduser().resolve()
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":")) + "\n", encoding="utf-8")
+        return p
+
+
+def find_logs(root: PathLike, patterns: Sequence[str] = DEFAULT_PATTERNS) -> List[Path]:
+    """
+    Log files under root (recursive), sorted; index sidecars never match the default patterns.
+    """
+    base = Path(root).expanduser().resolve()
+    return sorted({p for pattern in patterns for p in base.rglob(pattern) if p.is_file()})
+
+
+def as_json(v: Any) -> Any:
+    """
+    v as it reads back from a log (tuples -> lists, ...), to compare replayed values with logged ones.
+    """
+    return json.loads(json.dumps(v))
+
+
+def result_diff(logged: Dict[str, Any], replayed: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """
+    Differing keys of two dicts: key -> [logged, replayed], sorted by key.
+    """
+    return {
+        k: [logged.get(k), replayed.get(k)]
+        for k in sorted(set(logged) | set(replayed))
+        if logged.get(k) != replayed.get(k)
+    }
+
+
+def _verify_match(
+    path: str,
+    match_id: str,
+    events: List[Event],
+    game_id: Optional[str],
+    targets: ReplayTargets,
+    from_snapshot: bool,
+) -> Optional[Divergence]:
+    if game_id is None and len(targets) == 1:
+        game_id = next(iter(targets))  # e.g. a resumed log part without match_start
+    target = targets.get(game_id) if game_id is not None else None
+    if target is None:
+        return Divergence(path, match_id, STATUS_UNKNOWN_GAME, message=f"game_id={game_id!r}")
+
+    end = events[-1]
+    factory, game_config = target
+    try:
+        replayed = Replayer().replay_stream(
+            factory(), events, ReplayConfig(game_config=game_config, from_snapshot=from_snapshot)
+        )
+    except Exception as e:  # reported, not raised: one bad match must not stop the run
+        return Divergence(path, match_id, STATUS_ERROR, message=f"{type(e).__name__}: {e}")
+
+    diff = result_diff(dict(end.payload.get("result") or {}), as_json(replayed.details))
+    if diff and not any(e.type == "decision_provided" for e in events):
+        # Only the initial (or snapshot) state was replayed: not a rule regression.
+        return Divergence(path, match_id, STATUS_NO_DECISIONS, message="no decision_provided events to replay")
+    if diff:
+        return Divergence(path, match_id, STATUS_MISMATCH, diff=diff)
+    return None
+
+
+def _verify_events(
+    path: str, events: Iterable[Event], targets: ReplayTargets, from_snapshot: bool
+) -> Tuple[int, List[Divergence]]:
+    open_matches: Dict[str, List[Event]] = {}
+    game_ids: Dict[str, str] = {}
+    seen = 0
+    divergences: List[Divergence] = []
+
+    for ev in events:
+        if ev.type.startswith("series_"):
+            continue
+        buf = open_matches.get(ev.match_id)
+        if buf is None:
+            buf = open_matches[ev.match_id] = []
+            seen += 1
+        buf.append(ev)
+        if ev.type == "match_start":
+            game_ids[ev.match_id] = str(ev.payload.get("game_id"))
+        elif ev.type == "match_end":
+            d = _verify_match(path, ev.match_id, open_matches.pop(ev.match_id), game_ids.pop(ev.match_id, None),
+                              targets, from_snapshot)
+            if d is not None:
+                divergences.append(d)
+
+    for match_id in open_matches:
+        divergences.append(Divergence(path, match_id, STATUS_INCOMPLETE, message="no match_end"))
+    return seen, divergences
+
+
+def verify_file(path: str, targets: ReplayTargets, from_snapshot: bool = False) -> Tuple[int, List[Divergence]]:
+    """
+    Verify every match of one log; returns (matches seen, divergences).
+    """
+    return _verify_events(path, iter_events(path), targets, from_snapshot)
+
+
+def _verify_task(
+    task: Tuple[str, Optional[List[MatchSpan]]], targets: ReplayTargets, from_snapshot: bool
+) -> Tuple[int, List[Divergence]]:
+    path, spans = task
+    if spans is None:
+        return verify_file(path, targets, from_snapshot)
+    return _verify_events(path, read_spans(path, spans), targets, from_snapshot)
+
+
+def _tasks(path: str, chunk_bytes: int) -> List[Tuple[str, Optional[List[MatchSpan]]]]:
+    # Runs in the pool. Plain logs whose matches are contiguous are split into
+    # S43 span chunks (an up-to-date sidecar is used, a missing one is built in
+    # memory: verification never writes next to the logs); compressed and
+    # interleaved logs stay one task.
+    if codec_for(Path(path)) is not None:
+        return [(path, None)]
+    spans = read_match_index(path, write=False)
+    if len({s.match_id for s in spans}) != len(spans):
+        return [(path, None)]
+    return [(path, chunk) for chunk in chunk_spans(spans, chunk_bytes)]
+
+
+def verify_logs(
+    root: PathLike,
+    targets: ReplayTargets,
+    *,
+    patterns: Sequence[str] = DEFAULT_PATTERNS,
+    workers: int = 2,
+    from_snapshot: bool = False,
+    chunk_bytes: int = 1 << 20,
+) -> VerifyReport:
+    """
+    Replay every match of every log under root and compare with its match_end.
+
+    targets maps game_id (from match_start) to a module-level Game factory and
+    the game_config the matches were played with. With workers > 1, plain
+    JSONL logs are split by match into ~chunk_bytes pool tasks through their
+    .matches.json spans (indexed in the pool, in memory if no sidecar
+    exists), so one large log spreads across workers; compressed logs are one
+    task each. Nothing is written under root. The report lists divergences in
+    file order.
+    """
+    paths = [str(p) for p in find_logs(root, patterns)]
+    tasks: List[Tuple[str, Optional[List[MatchSpan]]]]
+    if workers <= 1 or not paths:
+        tasks = [(p, None) for p in paths]
+        parts: Iterable[Tuple[int, List[Divergence]]] = [_verify_task(t, targets, from_snapshot) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            planned = pool.map(_tasks, paths, [chunk_bytes] * len(paths))
+            tasks = [t for file_tasks in planned for t in file_tasks]
+            parts = list(pool.map(_verify_task, tasks, [targets] * len(tasks), [from_snapshot] * len(tasks)))
+
+    # Same order as one task per file: a file's incomplete matches come after its other divergences.
+    matches = 0
+    divergences: List[Divergence] = []
+    incomplete: List[Divergence] = []
+    for i, (n, divs) in enumerate(parts):
+        matches += n
+        for d in divs:
+            (incomplete if d.status == STATUS_INCOMPLETE else divergences).append(d)
+        if i + 1 == len(tasks) or tasks[i + 1][0] != tasks[i][0]:
+            divergences.extend(incomplete)
+            incomplete = []
+    return VerifyReport(files=len(paths), matches=matches, divergences=divergences)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from .formats import BestOfN, FirstToN
-from .series_runner import SeriesConfig, SeriesResult, SeriesRunner
+from .series_runner import AsyncSeriesRunner, SeriesConfig, SeriesResult, SeriesRunner
 
 __all__ = [
+    "AsyncSeriesRunner",
     "BestOfN",
     "FirstToN",
     "SeriesConfig",
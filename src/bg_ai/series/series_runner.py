@@ -1,23 +1,34 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from bg_ai.agents.agent import Agent
-from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+from bg_ai.engine.async_runner import AsyncMatchRunner
+from bg_ai.engine.match_runner import TIMEOUT_FALLBACK_FIRST_LEGAL, MatchConfig, MatchRunner
+from bg_ai.engine.rng import DEFAULT_RNG_BACKEND
+from bg_ai.engine.timing import TimingCollector
 from bg_ai.events.model import Event
-from bg_ai.events.sink import EventSink, InMemoryEventSink
+from bg_ai.events.sink import EventSink, NullEventSink, filter_types
 from bg_ai.games.base import Game, MatchResult
 
 from .formats import MatchFormat, SeriesScore
 from .ids import new_series_id
 
 
+SERIES_EVENT_TYPES = frozenset({"series_start", "series_match_completed", "series_end"})
+
+
 @dataclass(frozen=True, slots=True)
 class SeriesConfig:
     game_config: Dict[str, Any]
     seed: Optional[int] = None
     max_matches: int = 1_000  # safety guard
+    rng_backend: str = DEFAULT_RNG_BACKEND  # S32
+    collect_timings: bool = False  # S36: fill SeriesResult.timings
+    # S37: per-decision budget + fallback (see MatchConfig)
+    decision_timeout_s: Optional[float] = None
+    timeout_fallback: str = TIMEOUT_FALLBACK_FIRST_LEGAL
 
 
 @dataclass(frozen=True, slots=True)
@@ -28,148 +39,245 @@ class SeriesResult:
     wins_by_actor: Dict[str, int]
     draws: int
     match_results: List[MatchResult]
+    timings: Optional[TimingCollector] = None  # S36
+    decision_timeouts: Dict[str, int] = field(default_factory=dict)  # S37: actor_id -> overrun decisions
 
 
-class SeriesRunner:
+class _SeriesTracker:
     """
-    Runs multiple *single-match* games sequentially and aggregates results.
-
-    S15:
-      - supports BestOfN / FirstToN stopping conditions
-      - returns SeriesResult (wins/draws + per-match results)
+    Score keeping + series-level events for one series.
 
-    S15.1 (Option A):
-      - optional series-level EventSink
-      - emits: series_start, series_match_completed, series_end
-
-    Event envelope rule for series-level events:
-      - Event.match_id == series_id
-      - Event.tick == -1
-      - Event.idx monotonic within the series
+    S35: shared by SeriesRunner and AsyncSeriesRunner, which only differ in
+    how they run each match.
     """
 
-    def __init__(self) -> None:
-        self._match_runner = MatchRunner()
-
-    def run_series(
+    def __init__(
         self,
         *,
         game: Game,
         match_format: MatchFormat,
         config: SeriesConfig,
-        agents_by_id: Dict[str, Agent],
-        series_sink: Optional[EventSink] = None,
-    ) -> SeriesResult:
-        series_id = new_series_id()
+        series_sink: Optional[EventSink],
+    ) -> None:
+        self.series_id = new_series_id()
+        self.match_format = match_format
+        self.config = config
+        self.series_sink = series_sink
 
         actors = config.game_config.get("actors")
         if not isinstance(actors, list) or len(actors) != 2:
             raise ValueError("Series requires config.game_config['actors'] to be a list of exactly 2 actor ids")
 
-        a_id = str(actors[0])
-        b_id = str(actors[1])
+        self.a_id = str(actors[0])
+        self.b_id = str(actors[1])
 
-        wins_by_actor: Dict[str, int] = {a_id: 0, b_id: 0}
-        draws = 0
-        match_results: List[MatchResult] = []
+        self.wins_by_actor: Dict[str, int] = {self.a_id: 0, self.b_id: 0}
+        self.draws = 0
+        self.match_results: List[MatchResult] = []
+        self.timings = TimingCollector() if config.collect_timings else None
+        self.decision_timeouts: Dict[str, int] = {}
 
         # Series-level events
-        sidx = 0
-        if series_sink is not None:
+        traced = frozenset() if series_sink is None else filter_types(SERIES_EVENT_TYPES, series_sink)
+        self._t_completed = "series_match_completed" in traced
+        self._t_end = "series_end" in traced
+
+        self.sidx = 0
+        if "series_start" in traced:
             series_sink.emit(
                 Event(
-                    match_id=series_id,
-                    idx=sidx,
+                    match_id=self.series_id,
+                    idx=self.sidx,
                     tick=-1,
                     type="series_start",
                     payload={
-                        "series_id": series_id,
+                        "series_id": self.series_id,
                         "game_id": game.game_id,
                         "format": match_format.__class__.__name__,
                         "game_config": dict(config.game_config),
                     },
                 )
             )
-            sidx += 1
+        self.sidx += 1
 
-        for match_index in range(config.max_matches):
-            score = SeriesScore(wins_by_actor=dict(wins_by_actor), draws=draws)
-            if match_format.is_done(score=score, game_config=config.game_config):
-                break
+    def is_done(self) -> bool:
+        score = SeriesScore(wins_by_actor=dict(self.wins_by_actor), draws=self.draws)
+        return self.match_format.is_done(score=score, game_config=self.config.game_config)
 
-            match_sink = InMemoryEventSink()
-            match_cfg = MatchConfig(
-                game_config=dict(config.game_config),
-                seed=(None if config.seed is None else int(config.seed) + match_index),
-                max_ticks=10_000,
-            )
+    def match_config(self, match_index: int) -> MatchConfig:
+        config = self.config
+        return MatchConfig(
+            game_config=dict(config.game_config),
+            seed=(None if config.seed is None else int(config.seed) + match_index),
+            max_ticks=10_000,
+            rng_backend=config.rng_backend,
+            decision_timeout_s=config.decision_timeout_s,
+            timeout_fallback=config.timeout_fallback,
+        )
 
-            match_id, result = self._match_runner.run_match(
-                game,
-                match_sink,
-                match_cfg,
-                agents_by_id=agents_by_id,
-            )
+    def record(self, match_index: int, match_id: str, result: MatchResult) -> None:
+        a_id, b_id = self.a_id, self.b_id
+        self.match_results.append(result)
 
-            match_results.append(result)
-
-            winner = result.details.get("winner")
-            if winner is None:
-                draws += 1
-            elif winner == a_id:
-                wins_by_actor[a_id] += 1
-            elif winner == b_id:
-                wins_by_actor[b_id] += 1
-            else:
-                raise RuntimeError(
-                    f"Unexpected winner id {winner!r} (expected {a_id!r} or {b_id!r} or None)"
-                )
+        winner = result.details.get("winner")
+        if winner is None:
+            self.draws += 1
+        elif winner == a_id:
+            self.wins_by_actor[a_id] += 1
+        elif winner == b_id:
+            self.wins_by_actor[b_id] += 1
+        else:
+            raise RuntimeError(
+                f"Unexpected winner id {winner!r} (expected {a_id!r} or {b_id!r} or None)"
+            )
 
-            if series_sink is not None:
-                series_sink.emit(
-                    Event(
-                        match_id=series_id,
-                        idx=sidx,
-                        tick=-1,
-                        type="series_match_completed",
-                        payload={
-                            "series_id": series_id,
-                            "match_index": match_index,
-                            "match_id": match_id,
-                            "winner": winner,
-                            "wins_by_actor": dict(wins_by_actor),
-                            "draws": int(draws),
-                            "match_result": dict(result.details),
-                        },
-                    )
+        if self._t_completed:
+            self.series_sink.emit(
+                Event(
+                    match_id=self.series_id,
+                    idx=self.sidx,
+                    tick=-1,
+                    type="series_match_completed",
+                    payload={
+                        "series_id": self.series_id,
+                        "match_index": match_index,
+                        "match_id": match_id,
+                        "winner": winner,
+                        "wins_by_actor": dict(self.wins_by_actor),
+                        "draws": int(self.draws),
+                        "match_result": dict(result.details),
+                    },
                 )
-                sidx += 1
+            )
+        self.sidx += 1
 
-        final_score = SeriesScore(wins_by_actor=dict(wins_by_actor), draws=draws)
-        series_winner = match_format.winner(score=final_score, game_config=config.game_config)
+    def finish(self) -> SeriesResult:
+        final_score = SeriesScore(wins_by_actor=dict(self.wins_by_actor), draws=self.draws)
+        series_winner = self.match_format.winner(score=final_score, game_config=self.config.game_config)
 
-        if series_sink is not None:
-            series_sink.emit(
+        if self._t_end:
+            self.series_sink.emit(
                 Event(
-                    match_id=series_id,
-                    idx=sidx,
+                    match_id=self.series_id,
+                    idx=self.sidx,
                     tick=-1,
                     type="series_end",
                     payload={
-                        "series_id": series_id,
+                        "series_id": self.series_id,
                         "winner": series_winner,
-                        "wins_by_actor": dict(wins_by_actor),
-                        "draws": int(draws),
-                        "matches_played": len(match_results),
+                        "wins_by_actor": dict(self.wins_by_actor),
+                        "draws": int(self.draws),
+                        "matches_played": len(self.match_results),
                     },
                 )
             )
 
         return SeriesResult(
             outcome="done",
-            series_id=series_id,
+            series_id=self.series_id,
             winner=series_winner,
-            wins_by_actor=dict(wins_by_actor),
-            draws=int(draws),
-            match_results=list(match_results),
+            wins_by_actor=dict(self.wins_by_actor),
+            draws=int(self.draws),
+            match_results=list(self.match_results),
+            timings=self.timings,
+            decision_timeouts=dict(self.decision_timeouts),
         )
+
+
+class SeriesRunner:
+    """
+    Runs multiple *single-match* games sequentially and aggregates results.
+
+    S15:
+      - supports BestOfN / FirstToN stopping conditions
+      - returns SeriesResult (wins/draws + per-match results)
+
+    S15.1 (Option A):
+      - optional series-level EventSink
+      - emits: series_start, series_match_completed, series_end
+
+    Event envelope rule for series-level events:
+      - Event.match_id == series_id
+      - Event.tick == -1
+      - Event.idx monotonic within the series
+
+    S30:
+      - series_sink may declare `interest`; unwanted series events are not built
+        (sidx still advances, so idx matches an unfiltered series log)
+      - per-match events are never kept, so matches run against a NullEventSink
+
+    S39:
+      - optional match_sink (e.g. JsonlFileSink) receives every match's events
+    """
+
+    def __init__(self) -> None:
+        self._match_runner = MatchRunner()
+
+    def run_series(
+        self,
+        *,
+        game: Game,
+        match_format: MatchFormat,
+        config: SeriesConfig,
+        agents_by_id: Dict[str, Agent],
+        series_sink: Optional[EventSink] = None,
+        match_sink: Optional[EventSink] = None,
+    ) -> SeriesResult:
+        tracker = _SeriesTracker(game=game, match_format=match_format, config=config, series_sink=series_sink)
+
+        for match_index in range(config.max_matches):
+            if tracker.is_done():
+                break
+
+            match_id, result = self._match_runner.run_match(
+                game,
+                match_sink if match_sink is not None else NullEventSink(),
+                tracker.match_config(match_index),
+                agents_by_id=agents_by_id,
+                timings=tracker.timings,
+                decision_timeouts=tracker.decision_timeouts,
+            )
+            tracker.record(match_index, match_id, result)
+
+        return tracker.finish()
+
+
+class AsyncSeriesRunner:
+    """
+    S35: SeriesRunner on top of AsyncMatchRunner (policies may be async).
+
+    Matches of a series stay sequential (the stop condition depends on each
+    result); concurrency comes from decisions within a tick and from running
+    several series on one event loop.
+    """
+
+    def __init__(self) -> None:
+        self._match_runner = AsyncMatchRunner()
+
+    async def run_series(
+        self,
+        *,
+        game: Game,
+        match_format: MatchFormat,
+        config: SeriesConfig,
+        agents_by_id: Dict[str, Agent],
+        series_sink: Optional[EventSink] = None,
+        match_sink: Optional[EventSink] = None,
+    ) -> SeriesResult:
+        tracker = _SeriesTracker(game=game, match_format=match_format, config=config, series_sink=series_sink)
+
+        for match_index in range(config.max_matches):
+            if tracker.is_done():
+                break
+
+            match_id, result = await self._match_runner.run_match(
+                game,
+                match_sink if match_sink is not None else NullEventSink(),
+                tracker.match_config(match_index),
+                agents_by_id=agents_by_id,
+                timings=tracker.timings,
+                decision_timeouts=tracker.decision_timeouts,
+            )
+            tracker.record(match_index, match_id, result)
+
+        return tracker.finish()
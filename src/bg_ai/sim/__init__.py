@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from .sim_runner import SimConfig, SimRunner, SimResult
+from .sim_runner import AsyncSimRunner, SimConfig, SimRunner, SimResult
 
 __all__ = [
+    "AsyncSimRunner",
     "SimConfig",
     "SimResult",
     "SimRunner",
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple
 
 from bg_ai.agents.agent import Agent
-from bg_ai.engine.match_runner import MatchConfig, MatchRunner
-from bg_ai.events.sink import InMemoryEventSink
+from bg_ai.engine.async_runner import AsyncMatchRunner
+from bg_ai.engine.match_runner import TIMEOUT_FALLBACK_FIRST_LEGAL, TRACE_FULL, MatchConfig, MatchRunner
+from bg_ai.engine.rng import DEFAULT_RNG_BACKEND
+from bg_ai.engine.timing import TimingCollector
+from bg_ai.events.model import Event
+from bg_ai.events.sink import EventSink, InMemoryEventSink, TeeEventSink, sink_interest
 from bg_ai.games.base import Game, MatchResult
 from bg_ai.stats.base import StatsQuery
+from bg_ai.stats.memory_store import InMemoryStatsStore
+from bg_ai.stats.sink import StatsEventSink, supports_streaming
 
 
 class StatsStore(Protocol):
-    def ingest_match(self, *, result: MatchResult, events: List[Any]) -> None:
+    def ingest_match(self, *, result: MatchResult, events: Iterable[Any]) -> None:
         ...
 
 
@@ -21,11 +28,124 @@ class SimConfig:
     num_matches: int
     seed: Optional[int] = None
     max_ticks: int = 10_000
+    # S28: parallel mode (workers > 1 shards matches across a process pool)
+    workers: int = 1
+    chunk_size: Optional[int] = None  # default: ~4 chunks per worker
+    # S29: events handed to stats_store.ingest_match (InMemoryStatsStore only needs "decisions")
+    trace_level: str = TRACE_FULL
+    rng_backend: str = DEFAULT_RNG_BACKEND  # S32
+    # S35: AsyncSimRunner only; matches in flight at once (one wave)
+    concurrency: int = 1
+    # S36: collect per-section match-loop latencies into SimResult.timings
+    collect_timings: bool = False
+    # S37: per-decision budget + fallback (see MatchConfig); overruns land in SimResult.decision_timeouts
+    decision_timeout_s: Optional[float] = None
+    timeout_fallback: str = TIMEOUT_FALLBACK_FIRST_LEGAL
+    # S50: feed stats_store through a StatsEventSink (applied at each match_end) instead of buffering events
+    stream_stats: bool = False
+    # S51: each match decides against stats_query.snapshot() taken at its start (see MatchConfig)
+    pin_stats: bool = False
 
 
 @dataclass(frozen=True, slots=True)
 class SimResult:
     match_results: List[MatchResult]
+    timings: Optional[TimingCollector] = None  # S36: set when SimConfig.collect_timings
+    decision_timeouts: Dict[str, int] = field(default_factory=dict)  # S37: actor_id -> overrun decisions
+
+
+@dataclass(frozen=True, slots=True)
+class _WorkerContext:
+    """
+    Everything a pool worker needs to run matches, shipped once per process.
+    """
+    game: Game
+    config: SimConfig
+    agents_by_id: Dict[str, Agent]
+    stats_query: StatsQuery
+
+
+_WORKER_CTX: Optional[_WorkerContext] = None
+
+
+def _init_worker(ctx: _WorkerContext) -> None:
+    global _WORKER_CTX
+    _WORKER_CTX = ctx
+
+
+def _match_config(config: SimConfig, i: int) -> MatchConfig:
+    return MatchConfig(
+        game_config=dict(config.game_config),
+        seed=(None if config.seed is None else int(config.seed) + i),
+        max_ticks=int(config.max_ticks),
+        trace_level=config.trace_level,
+        rng_backend=config.rng_backend,
+        decision_timeout_s=config.decision_timeout_s,
+        timeout_fallback=config.timeout_fallback,
+        pin_stats=config.pin_stats,
+    )
+
+
+def _add_counts(into: Dict[str, int], counts: Dict[str, int]) -> None:
+    for actor_id, n in counts.items():
+        into[actor_id] = into.get(actor_id, 0) + n
+
+
+def _forward(events: List[Event], sink: EventSink) -> None:
+    """
+    S39: hand one finished match's events to the run-level event_sink (respecting its interest).
+    """
+    interest = sink_interest(sink)
+    for e in events:
+        if interest is None or e.type in interest:
+            sink.emit(e)
+
+
+def _stats_sink(stats_store: StatsStore, *, defer: bool = False) -> StatsEventSink:
+    if not supports_streaming(stats_store):
+        raise TypeError(
+            f"SimConfig.stream_stats requires a stats_store with add_decision()/add_result(); "
+            f"got {type(stats_store).__name__}"
+        )
+    return StatsEventSink(stats_store, defer=defer)  # type: ignore[arg-type]
+
+
+def _run_chunk(
+    start: int, stop: int
+) -> Tuple[List[MatchResult], InMemoryStatsStore, Optional[TimingCollector], Dict[str, int]]:
+    """
+    Run matches [start, stop) inside a pool worker.
+
+    Returns the results in match order plus a stats delta holding only this
+    chunk's matches; the parent merges the delta into the caller's store
+    (and the chunk's timings and decision timeouts into the run's totals).
+    """
+    ctx = _WORKER_CTX
+    if ctx is None:
+        raise RuntimeError("SimRunner worker was not initialised")
+
+    runner = MatchRunner()
+    delta = InMemoryStatsStore()
+    timings = TimingCollector() if ctx.config.collect_timings else None
+    decision_timeouts: Dict[str, int] = {}
+    results: List[MatchResult] = []
+
+    # S50: the delta is private to this chunk, so streaming into it is always
+    # equivalent to ingest_match; only decision_provided/match_end get built.
+    sink = StatsEventSink(delta)
+    for i in range(start, stop):
+        _match_id, result = runner.run_match(
+            ctx.game,
+            sink,
+            _match_config(ctx.config, i),
+            agents_by_id=ctx.agents_by_id,
+            stats_query=ctx.stats_query,
+            timings=timings,
+            decision_timeouts=decision_timeouts,
+        )
+        results.append(result)
+
+    return results, delta, timings, decision_timeouts
 
 
 class SimRunner:
@@ -34,6 +154,35 @@ class SimRunner:
     - Runs N matches sequentially
     - Updates stats store after each match
     - Passes stats_query into MatchRunner (S19)
+
+    S28 (parallel mode, config.workers > 1):
+    - matches are sharded into contiguous chunks run by a ProcessPoolExecutor
+    - match i still uses seed + i, so results are identical to the sequential run
+    - each chunk returns a stats delta that is merged into stats_store (needs merge())
+
+    Stats contract in parallel mode:
+    - every match sees a frozen snapshot of stats_query taken when run_matches is
+      called (each worker receives its own pickled copy); stats_store is only
+      updated once all chunks are done
+    - results are therefore independent of workers/chunk_size, but policies that
+      read ctx.stats only match the sequential run if they ignore updates made
+      during the run
+
+    S36: config.collect_timings fills SimResult.timings (worker timings are merged).
+
+    S37: config.decision_timeout_s bounds each decision (see MatchRunner);
+    overruns are counted per actor in SimResult.decision_timeouts.
+
+    S39: event_sink (e.g. JsonlFileSink) receives every match's events, one
+    match after another; only the current match is held in memory.
+    Sequential mode only.
+
+    S50: config.stream_stats feeds events straight into stats_store through a
+    StatsEventSink (and to event_sink as they happen): no per-match event
+    buffer. The sink applies a match's counts and W/L/D at its match_end, so
+    policies reading stats_query see the same stats as without streaming.
+    stats_store must implement add_decision/add_result. Parallel workers
+    always stream into their private deltas.
     """
 
     def __init__(self) -> None:
@@ -47,30 +196,178 @@ class SimRunner:
         agents_by_id: Dict[str, Agent],
         stats_store: StatsStore,
         stats_query: StatsQuery,
+        event_sink: Optional[EventSink] = None,
     ) -> SimResult:
         if config.num_matches <= 0:
             raise ValueError("SimConfig.num_matches must be > 0")
+        if config.workers <= 0:
+            raise ValueError("SimConfig.workers must be > 0")
+
+        if config.workers > 1:
+            if event_sink is not None:
+                raise ValueError("SimRunner event_sink is not supported with workers > 1")
+            return self._run_parallel(
+                game=game,
+                config=config,
+                agents_by_id=agents_by_id,
+                stats_store=stats_store,
+                stats_query=stats_query,
+            )
 
         results: List[MatchResult] = []
+        timings = TimingCollector() if config.collect_timings else None
+        decision_timeouts: Dict[str, int] = {}
 
-        for i in range(config.num_matches):
-            sink = InMemoryEventSink()
+        streaming: Optional[EventSink] = None
+        if config.stream_stats:
+            stats_sink = _stats_sink(stats_store)
+            streaming = stats_sink if event_sink is None else TeeEventSink(stats_sink, event_sink)
 
-            match_cfg = MatchConfig(
-                game_config=dict(config.game_config),
-                seed=(None if config.seed is None else int(config.seed) + i),
-                max_ticks=int(config.max_ticks),
-            )
+        for i in range(config.num_matches):
+            sink = InMemoryEventSink() if streaming is None else streaming
 
             _match_id, result = self._match_runner.run_match(
                 game,
                 sink,
-                match_cfg,
+                _match_config(config, i),
                 agents_by_id=agents_by_id,
                 stats_query=stats_query,
+                timings=timings,
+                decision_timeouts=decision_timeouts,
             )
 
-            stats_store.ingest_match(result=result, events=sink.events())
+            if streaming is None:
+                events = sink.events()  # type: ignore[union-attr]
+                stats_store.ingest_match(result=result, events=events)
+                if event_sink is not None:
+                    _forward(events, event_sink)
             results.append(result)
 
-        return SimResult(match_results=results)
+        return SimResult(match_results=results, timings=timings, decision_timeouts=decision_timeouts)
+
+    @staticmethod
+    def _chunks(config: SimConfig) -> List[Tuple[int, int]]:
+        n = int(config.num_matches)
+        if config.chunk_size is not None:
+            size = int(config.chunk_size)
+            if size <= 0:
+                raise ValueError("SimConfig.chunk_size must be > 0")
+        else:
+            size = max(1, -(-n // (int(config.workers) * 4)))
+        return [(start, min(start + size, n)) for start in range(0, n, size)]
+
+    def _run_parallel(
+        self,
+        *,
+        game: Game,
+        config: SimConfig,
+        agents_by_id: Dict[str, Agent],
+        stats_store: StatsStore,
+        stats_query: StatsQuery,
+    ) -> SimResult:
+        merge = getattr(stats_store, "merge", None)
+        if merge is None:
+            raise TypeError(
+                f"Parallel SimRunner requires a stats_store with merge(); got {type(stats_store).__name__}"
+            )
+
+        ctx = _WorkerContext(game=game, config=config, agents_by_id=agents_by_id, stats_query=stats_query)
+        chunks = self._chunks(config)
+
+        with ProcessPoolExecutor(
+            max_workers=int(config.workers),
+            initializer=_init_worker,
+            initargs=(ctx,),
+        ) as pool:
+            futures = [pool.submit(_run_chunk, start, stop) for start, stop in chunks]
+            # Collect in submission order so results stay in match order.
+            outputs = [f.result() for f in futures]
+
+        results: List[MatchResult] = []
+        timings = TimingCollector() if config.collect_timings else None
+        decision_timeouts: Dict[str, int] = {}
+        for chunk_results, delta, chunk_timings, chunk_timeouts in outputs:
+            merge(delta)
+            results.extend(chunk_results)
+            if timings is not None and chunk_timings is not None:
+                timings.merge(chunk_timings)
+            _add_counts(decision_timeouts, chunk_timeouts)
+
+        return SimResult(match_results=results, timings=timings, decision_timeouts=decision_timeouts)
+
+
+class AsyncSimRunner:
+    """
+    S35: SimRunner on top of AsyncMatchRunner (policies may be async).
+
+    Matches run in waves of config.concurrency on one event loop:
+    - every match of a wave sees stats_query as of the start of the wave
+    - after the wave, results are ingested into stats_store in match order
+    With concurrency=1 this is exactly the sequential SimRunner.
+    S39: event_sink receives each wave's matches in match order (never interleaved).
+    S50: config.stream_stats gives each match a StatsEventSink(defer=True),
+    flushed into stats_store in match order after the wave (same stats_query
+    view as without it); only event_sink's events are buffered, if any.
+    """
+
+    def __init__(self) -> None:
+        self._match_runner = AsyncMatchRunner()
+
+    async def run_matches(
+        self,
+        *,
+        game: Game,
+        config: SimConfig,
+        agents_by_id: Dict[str, Agent],
+        stats_store: StatsStore,
+        stats_query: StatsQuery,
+        event_sink: Optional[EventSink] = None,
+    ) -> SimResult:
+        if config.num_matches <= 0:
+            raise ValueError("SimConfig.num_matches must be > 0")
+        if config.concurrency <= 0:
+            raise ValueError("SimConfig.concurrency must be > 0")
+
+        results: List[MatchResult] = []
+        timings = TimingCollector() if config.collect_timings else None
+        decision_timeouts: Dict[str, int] = {}
+        n = int(config.num_matches)
+        wave = int(config.concurrency)
+
+        for start in range(0, n, wave):
+            indices = range(start, min(start + wave, n))
+            sinks: List[EventSink]
+            stats_sinks: List[StatsEventSink] = []
+            forwarded: List[Optional[InMemoryEventSink]] = []
+            if not config.stream_stats:
+                sinks = [InMemoryEventSink() for _ in indices]
+            else:
+                stats_sinks = [_stats_sink(stats_store, defer=True) for _ in indices]
+                forwarded = [
+                    None if event_sink is None else InMemoryEventSink(sink_interest(event_sink)) for _ in indices
+                ]
+                sinks = [s if f is None else TeeEventSink(s, f) for s, f in zip(stats_sinks, forwarded)]
+
+            outputs = await self._match_runner.run_matches(
+                game,
+                sinks,
+                [_match_config(config, i) for i in indices],
+                agents_by_id=agents_by_id,
+                stats_query=stats_query,
+                timings=timings,
+                decision_timeouts=decision_timeouts,
+            )
+
+            for k, (_match_id, result) in enumerate(outputs):
+                if not config.stream_stats:
+                    events = sinks[k].events()  # type: ignore[union-attr]
+                    stats_store.ingest_match(result=result, events=events)
+                    if event_sink is not None:
+                        _forward(events, event_sink)
+                else:
+                    stats_sinks[k].flush()
+                    if event_sink is not None:
+                        _forward(forwarded[k].events(), event_sink)  # type: ignore[union-attr]
+                results.append(result)
+
+        return SimResult(match_results=results, timings=timings, decision_timeouts=decision_timeouts)
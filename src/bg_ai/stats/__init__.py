@@ -2,9 +2,15 @@ from __future__ import annotations
 
 from .base import NullStatsQuery, StatsQuery
 from .memory_store import InMemoryStatsStore
+from .sink import StatsEventSink
+from .snapshot import StatsSnapshot
+from .sqlite_store import SqliteStatsStore
 
 __all__ = [
     "InMemoryStatsStore",
     "NullStatsQuery",
+    "SqliteStatsStore",
+    "StatsEventSink",
     "StatsQuery",
+    "StatsSnapshot",
 ]
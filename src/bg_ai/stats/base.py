@@ -4,6 +4,10 @@ from typing import Dict, Protocol
 
 
 class StatsQuery(Protocol):
+    """
+    S51: a query may also expose an optional `snapshot()` returning an
+    immutable StatsQuery (see StatsSnapshot); MatchConfig.pin_stats uses it.
+    """
     def action_counts(self, actor_id: str) -> Dict[str, int]:
         ...
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Any, Dict, Iterable, Optional
 
 from bg_ai.events.model import Event
 from bg_ai.games.base import MatchResult
 
 from .base import StatsQuery
+from .snapshot import StatsSnapshot
 
 
 @dataclass
@@ -24,28 +25,63 @@ class InMemoryStatsStore(StatsQuery):
     - W/L/D from result.details:
         - actors: list[str]
         - winner: actor_id or None
+
+    S51: every update bumps `version`; snapshot() returns an immutable,
+    allocation-free StatsSnapshot, cached until the next update.
     """
     _action_counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
     _records: Dict[str, _PlayerRecord] = field(default_factory=dict)
-
-    def ingest_match(self, *, result: MatchResult, events: List[Event]) -> None:
-        # 1) Action counts
+    _version: int = field(default=0, compare=False)
+    _snapshot: Optional[StatsSnapshot] = field(default=None, repr=False, compare=False)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def snapshot(self) -> StatsSnapshot:
+        snap = self._snapshot
+        if snap is None or snap.version != self._version:
+            snap = self._snapshot = StatsSnapshot.build(
+                self._version,
+                self._action_counts,
+                {a: self.record(a) for a in self._records},
+            )
+        return snap
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_snapshot"] = None  # rebuilt on demand
+        return state
+
+    def ingest_match(self, *, result: MatchResult, events: Iterable[Event]) -> None:
+        # 1) Action counts (single pass; S42: events may be a lazy iterator)
         for e in events:
             if e.type != "decision_provided":
                 continue
-            actor_id = str(e.payload.get("actor_id"))
-            action = e.payload.get("action")
-            if action is None:
-                continue
-            action_wire = str(action)
+            self.add_decision(str(e.payload.get("actor_id")), e.payload.get("action"))
 
-            per_actor = self._action_counts.setdefault(actor_id, {})
-            per_actor[action_wire] = int(per_actor.get(action_wire, 0)) + 1
+        # 2) W/L/D
+        self.add_result(result.details)
 
-            self._records.setdefault(actor_id, _PlayerRecord())
+    def add_decision(self, actor_id: str, action: Any, n: int = 1) -> None:
+        """
+        S50: count n decision_provided events of one action (action = wire value; None is ignored).
+        """
+        if action is None:
+            return
+        action_wire = str(action)
 
-        # 2) W/L/D
-        details = result.details or {}
+        per_actor = self._action_counts.setdefault(actor_id, {})
+        per_actor[action_wire] = int(per_actor.get(action_wire, 0)) + n
+
+        self._records.setdefault(actor_id, _PlayerRecord())
+        self._version += 1
+
+    def add_result(self, details: Optional[Dict[str, Any]]) -> None:
+        """
+        S50: apply W/L/D for one finished match (MatchResult.details / match_end payload["result"]).
+        """
+        details = details or {}
         actors = details.get("actors")
         winner = details.get("winner", None)
 
@@ -55,6 +91,7 @@ class InMemoryStatsStore(StatsQuery):
         actor_ids = [str(a) for a in actors]
         for a in actor_ids:
             self._records.setdefault(a, _PlayerRecord())
+        self._version += 1
 
         if winner is None:
             for a in actor_ids:
@@ -68,6 +105,23 @@ class InMemoryStatsStore(StatsQuery):
             else:
                 self._records[a].losses += 1
 
+    def merge(self, other: "InMemoryStatsStore") -> None:
+        """
+        S28: add another store's counts into this one.
+        Used by parallel SimRunner to fold per-worker deltas back in.
+        """
+        for actor_id, counts in other._action_counts.items():
+            per_actor = self._action_counts.setdefault(actor_id, {})
+            for action_wire, n in counts.items():
+                per_actor[action_wire] = int(per_actor.get(action_wire, 0)) + int(n)
+
+        for actor_id, r in other._records.items():
+            mine = self._records.setdefault(actor_id, _PlayerRecord())
+            mine.wins += r.wins
+            mine.losses += r.losses
+            mine.draws += r.draws
+        self._version += 1
+
     # StatsQuery
     def action_counts(self, actor_id: str) -> Dict[str, int]:
         return dict(self._action_counts.get(actor_id, {}))
@@ -83,8 +137,10 @@ class InMemoryStatsStore(StatsQuery):
         }
 
     def win_rate(self, actor_id: str) -> float:
-        rec = self.record(actor_id)
-        total = rec["total"]
+        r = self._records.get(actor_id)
+        if r is None:
+            return 0.0
+        total = r.wins + r.losses + r.draws
         if total <= 0:
             return 0.0
-        return float(rec["wins"]) / float(total)
+        return float(r.wins) / float(total)
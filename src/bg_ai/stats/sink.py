@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, List, Optional, Protocol, Tuple
+
+from bg_ai.events.model import Event
+
+
+class StreamingStatsStore(Protocol):
+    """
+    S50: a stats store that can be updated one match at a time without its
+    events (InMemoryStatsStore and SqliteStatsStore implement it).
+    """
+    def add_decision(self, actor_id: str, action: Any, n: int = 1) -> None:
+        ...
+
+    def add_result(self, details: Optional[Dict[str, Any]]) -> None:
+        ...
+
+
+def supports_streaming(store: object) -> bool:
+    return callable(getattr(store, "add_decision", None)) and callable(getattr(store, "add_result", None))
+
+
+# match_id -> actor_id -> action wire value -> count
+_Counts = Dict[str, Dict[str, int]]
+
+
+class StatsEventSink:
+    """
+    S50: EventSink that feeds a stats store without holding any events.
+
+    Each match's action counts are kept per match_id (one entry per distinct
+    action) and applied together with its W/L/D at match_end, so readers of
+    the store never see a match in progress: same stats, at the same points,
+    as ingest_match(result, events) after the match.
+
+    defer=True also holds finished matches until flush() (AsyncSimRunner
+    applies a wave's matches in match order after the wave).
+
+    Declares interest in just decision_provided and match_end, so runners
+    skip building the rest (see EventSink).
+    """
+    interest: FrozenSet[str] = frozenset({"decision_provided", "match_end"})
+
+    def __init__(self, store: StreamingStatsStore, *, defer: bool = False) -> None:
+        if not supports_streaming(store):
+            raise TypeError(f"{type(store).__name__} does not implement add_decision/add_result")
+        self.store = store
+        self.defer = defer
+        self._counts: Dict[str, _Counts] = {}
+        self._finished: List[Tuple[_Counts, Optional[Dict[str, Any]]]] = []
+
+    def emit(self, event: Event) -> None:
+        if event.type == "decision_provided":
+            action = event.payload.get("action")
+            if action is None:
+                return
+            per_match = self._counts.get(event.match_id)
+            if per_match is None:
+                per_match = self._counts[event.match_id] = {}
+            per_actor = per_match.setdefault(str(event.payload.get("actor_id")), {})
+            wire = str(action)
+            per_actor[wire] = per_actor.get(wire, 0) + 1
+        elif event.type == "match_end":
+            finished = (self._counts.pop(event.match_id, {}), event.payload.get("result"))
+            if self.defer:
+                self._finished.append(finished)
+            else:
+                self._apply(*finished)
+
+    def flush(self) -> None:
+        """
+        Apply finished matches held by defer=True, in match_end order.
+        """
+        finished, self._finished = self._finished, []
+        for counts, details in finished:
+            self._apply(counts, details)
+
+    def _apply(self, counts: _Counts, details: Optional[Dict[str, Any]]) -> None:
+        store = self.store
+        for actor_id, per_actor in counts.items():
+            for action, n in per_actor.items():
+                store.add_decision(actor_id, action, n)
+        store.add_result(details)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+_EMPTY_COUNTS: Mapping[str, int] = MappingProxyType({})
+_EMPTY_RECORD: Mapping[str, int] = MappingProxyType({"wins": 0, "losses": 0, "draws": 0, "total": 0})
+
+
+@dataclass(frozen=True, slots=True)
+class StatsSnapshot:
+    """
+    S51: immutable StatsQuery view of a store at one version.
+
+    Every answer is precomputed: action_counts/record return shared read-only
+    mappings and win_rate a stored float, so policies can call them on every
+    decision without allocating. Returned mappings must not be modified
+    (they are MappingProxyType; copy with dict() if needed).
+    """
+    version: int
+    counts: Mapping[str, Mapping[str, int]]
+    records: Mapping[str, Mapping[str, int]]
+    win_rates: Mapping[str, float]
+
+    @classmethod
+    def build(
+        cls,
+        version: int,
+        action_counts: Mapping[str, Mapping[str, int]],
+        records: Mapping[str, Mapping[str, int]],
+    ) -> "StatsSnapshot":
+        win_rates: Dict[str, float] = {}
+        for actor_id, r in records.items():
+            total = r["total"]
+            win_rates[actor_id] = float(r["wins"]) / float(total) if total > 0 else 0.0
+        return cls(
+            version=version,
+            counts=MappingProxyType({a: MappingProxyType(dict(c)) for a, c in action_counts.items()}),
+            records=MappingProxyType({a: MappingProxyType(dict(r)) for a, r in records.items()}),
+            win_rates=MappingProxyType(win_rates),
+        )
+
+    # StatsQuery
+    def action_counts(self, actor_id: str) -> Mapping[str, int]:
+        return self.counts.get(actor_id, _EMPTY_COUNTS)
+
+    def record(self, actor_id: str) -> Mapping[str, int]:
+        return self.records.get(actor_id, _EMPTY_RECORD)
+
+    def win_rate(self, actor_id: str) -> float:
+        return self.win_rates.get(actor_id, 0.0)
+
+    def snapshot(self) -> "StatsSnapshot":
+        return self
+
+    def __reduce__(self) -> Any:
+        # MappingProxyType does not pickle (process-pool workers); rebuild from plain dicts.
+        return (
+            StatsSnapshot.build,
+            (self.version, {a: dict(c) for a, c in self.counts.items()}, {a: dict(r) for a, r in self.records.items()}),
+        )
+
+
+def pinned(stats_query: Any) -> Optional[StatsSnapshot]:
+    """
+    S51: the query's current snapshot, or None when it cannot snapshot.
+    """
+    snapshot = getattr(stats_query, "snapshot", None)
+    return snapshot() if callable(snapshot) else None
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from bg_ai.events.model import Event
+from bg_ai.games.base import MatchResult
+
+from .snapshot import StatsSnapshot
+
+
+# S52: persistent stats shared by several processes.
+#
+# action_counts(actor_id, action, n) and records(actor_id, wins, losses, draws),
+# both keyed by their primary key (WITHOUT ROWID, so lookups by actor_id are
+# one index range scan). Writes are upserts that add to the stored totals, so
+# any number of processes can ingest into the same file.
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS action_counts (
+    actor_id TEXT NOT NULL,
+    action TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (actor_id, action)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS records (
+    actor_id TEXT NOT NULL PRIMARY KEY,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+"""
+
+_UPSERT_COUNT = (
+    "INSERT INTO action_counts (actor_id, action, n) VALUES (?, ?, ?) "
+    "ON CONFLICT (actor_id, action) DO UPDATE SET n = n + excluded.n"
+)
+_UPSERT_RECORD = (
+    "INSERT INTO records (actor_id, wins, losses, draws) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (actor_id) DO UPDATE SET "
+    "wins = wins + excluded.wins, losses = losses + excluded.losses, draws = draws + excluded.draws"
+)
+
+_NO_RECORD = (0, 0, 0)
+
+
+class SqliteStatsStore:
+    """
+    S52: StatsStore + StatsQuery backed by a SQLite file (WAL mode).
+
+    Writes:
+    - ingest_match / add_decision / add_result / merge aggregate into an
+      in-process pending batch; every `batch_matches` finished matches (and on
+      flush()/close()) the batch is written with executemany upserts in one
+      transaction
+    - queries include the pending batch, so readers in this process always
+      see their own writes
+
+    Reads go through a per-actor cache that is dropped when this process
+    flushes or another connection commits (PRAGMA data_version, checked at
+    most every max_staleness_s seconds; 0 = on every query).
+
+    Also implements add_decision/add_result (S50 streaming), merge (S28
+    parallel SimRunner) and version/snapshot() (S51). Pickles as its path and
+    options after flushing (workers reopen the file).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        batch_matches: int = 1,
+        max_staleness_s: float = 0.0,
+        timeout_s: float = 30.0,
+    ) -> None:
+        if batch_matches <= 0:
+            raise ValueError("batch_matches must be > 0")
+        if max_staleness_s < 0:
+            raise ValueError("max_staleness_s must be >= 0")
+        self.path = Path(path).expanduser().resolve()
+        self.batch_matches = int(batch_matches)
+        self.max_staleness_s = float(max_staleness_s)
+        self.timeout_s = float(timeout_s)
+        self._open()
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Policies may run on timeout threads (S37): one connection, guarded by a lock.
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=self.timeout_s, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.RLock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+        self._pending_counts: Dict[str, Dict[str, int]] = {}  # actor_id -> action -> n
+        self._pending_records: Dict[str, List[int]] = {}
+        self._pending_matches = 0
+
+        self._counts_cache: Dict[str, Dict[str, int]] = {}
+        self._record_cache: Dict[str, Tuple[int, int, int]] = {}
+        self._data_version = self._read_data_version()
+        self._checked_at = time.monotonic()
+        self._version = 0
+        self._snapshot: Optional[StatsSnapshot] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self.flush()  # the unpickled copy reads the file: make this process's writes visible
+        return {
+            "path": self.path,
+            "batch_matches": self.batch_matches,
+            "max_staleness_s": self.max_staleness_s,
+            "timeout_s": self.timeout_s,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._open()
+
+    # --- writes ------------------------------------------------------------
+
+    def add_decision(self, actor_id: str, action: Any, n: int = 1) -> None:
+        if action is None:
+            return
+        action_wire = str(action)
+        with self._lock:
+            per_actor = self._pending_counts.setdefault(actor_id, {})
+            per_actor[action_wire] = per_actor.get(action_wire, 0) + n
+            self._pending_records.setdefault(actor_id, [0, 0, 0])
+            self._changed()
+
+    def add_result(self, details: Optional[Dict[str, Any]]) -> None:
+        details = details or {}
+        actors = details.get("actors")
+        winner = details.get("winner", None)
+        with self._lock:
+            if isinstance(actors, list) and actors:
+                for a in (str(a) for a in actors):
+                    rec = self._pending_records.setdefault(a, [0, 0, 0])
+                    if winner is None:
+                        rec[2] += 1
+                    elif a == str(winner):
+                        rec[0] += 1
+                    else:
+                        rec[1] += 1
+                self._changed()
+            self._pending_matches += 1
+            if self._pending_matches >= self.batch_matches:
+                self.flush()
+
+    def ingest_match(self, *, result: MatchResult, events: Iterable[Event]) -> None:
+        for e in events:
+            if e.type == "decision_provided":
+                self.add_decision(str(e.payload.get("actor_id")), e.payload.get("action"))
+        self.add_result(result.details)
+
+    def merge(self, other: Any) -> None:
+        """
+        Add another store's totals (anything with snapshot(), e.g. a parallel worker's InMemoryStatsStore).
+        """
+        snap: StatsSnapshot = other.snapshot()
+        with self._lock:
+            for actor_id, counts in snap.counts.items():
+                per_actor = self._pending_counts.setdefault(actor_id, {})
+                for action, n in counts.items():
+                    per_actor[action] = per_actor.get(action, 0) + int(n)
+            for actor_id, r in snap.records.items():
+                rec = self._pending_records.setdefault(actor_id, [0, 0, 0])
+                rec[0] += int(r["wins"])
+                rec[1] += int(r["losses"])
+                rec[2] += int(r["draws"])
+            self._changed()
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the pending batch in one transaction.
+        """
+        with self._lock:
+            if not self._pending_counts and not self._pending_records:
+                self._pending_matches = 0
+                return
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    _UPSERT_COUNT,
+                    [(a, action, n) for a, counts in self._pending_counts.items() for action, n in counts.items()],
+                )
+                conn.executemany(_UPSERT_RECORD, [(a, w, l, d) for a, (w, l, d) in self._pending_records.items()])
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            self._pending_counts = {}
+            self._pending_records = {}
+            self._pending_matches = 0
+            self._invalidate()
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+    def __enter__(self) -> "SqliteStatsStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # --- cache -------------------------------------------------------------
+
+    def _read_data_version(self) -> int:
+        return int(self._conn.execute("PRAGMA data_version").fetchone()[0])
+
+    def _changed(self) -> None:
+        self._version += 1
+
+    def _invalidate(self) -> None:
+        self._counts_cache.clear()
+        self._record_cache.clear()
+        self._changed()
+
+    def _revalidate(self) -> None:
+        # Caller holds the lock. data_version moves when another connection commits.
+        if self.max_staleness_s > 0:
+            now = time.monotonic()
+            if now - self._checked_at < self.max_staleness_s:
+                return
+            self._checked_at = now
+        dv = self._read_data_version()
+        if dv != self._data_version:
+            self._data_version = dv
+            self._invalidate()
+
+    def _stored_counts(self, actor_id: str) -> Dict[str, int]:
+        counts = self._counts_cache.get(actor_id)
+        if counts is None:
+            rows = self._conn.execute("SELECT action, n FROM action_counts WHERE actor_id = ?", (actor_id,))
+            counts = self._counts_cache[actor_id] = {action: int(n) for action, n in rows}
+        return counts
+
+    def _stored_record(self, actor_id: str) -> Tuple[int, int, int]:
+        rec = self._record_cache.get(actor_id)
+        if rec is None:
+            row = self._conn.execute(
+                "SELECT wins, losses, draws FROM records WHERE actor_id = ?", (actor_id,)
+            ).fetchone()
+            rec = self._record_cache[actor_id] = _NO_RECORD if row is None else (int(row[0]), int(row[1]), int(row[2]))
+        return rec
+
+    def _record_tuple(self, actor_id: str) -> Tuple[int, int, int]:
+        w, l, d = self._stored_record(actor_id)
+        pending = self._pending_records.get(actor_id)
+        if pending is not None:
+            w, l, d = w + pending[0], l + pending[1], d + pending[2]
+        return w, l, d
+
+    # --- StatsQuery --------------------------------------------------------
+
+    def action_counts(self, actor_id: str) -> Dict[str, int]:
+        with self._lock:
+            self._revalidate()
+            counts = dict(self._stored_counts(actor_id))
+            pending = self._pending_counts.get(actor_id)
+            if pending:
+                for action, n in pending.items():
+                    counts[action] = counts.get(action, 0) + n
+            return counts
+
+    def record(self, actor_id: str) -> Dict[str, int]:
+        with self._lock:
+            self._revalidate()
+            w, l, d = self._record_tuple(actor_id)
+        return {"wins": w, "losses": l, "draws": d, "total": w + l + d}
+
+    def win_rate(self, actor_id: str) -> float:
+        with self._lock:
+            self._revalidate()
+            w, l, d = self._record_tuple(actor_id)
+        total = w + l + d
+        if total <= 0:
+            return 0.0
+        return float(w) / float(total)
+
+    # --- S51 snapshots -----------------------------------------------------
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            self._revalidate()
+            return self._version
+
+    def snapshot(self) -> StatsSnapshot:
+        """
+        Immutable view of all stored + pending stats, cached per version.
+        """
+        with self._lock:
+            self._revalidate()
+            snap = self._snapshot
+            if snap is not None and snap.version == self._version:
+                return snap
+            actors = [a for (a,) in self._conn.execute("SELECT actor_id FROM records")]
+            known = set(actors)
+            actors.extend(a for a in self._pending_records if a not in known)
+            counts = {a: self.action_counts(a) for a in actors}
+            records = {a: self.record(a) for a in actors}
+            snap = self._snapshot = StatsSnapshot.build(self._version, counts, records)
+            return snap
@@ -0,0 +1,1699 @@
+from __future__ import annotations
+
+from typing import Callable, Dict
+
+from test_ADR._adr_common import AdrMeta, run_slices
+
+ADR = "0006"
+STARTING_SLICE = 28
+LAST_SLICE = 52
+STATUS = "active"
+
+
+# -------------------------
+# Slice tests (GLOBAL slice numbers)
+# -------------------------
+
+def test_s28() -> None:
+    # S28: parallel SimRunner gives the same results + stats as the sequential run.
+    from bg_ai.agents.agent import Agent
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.sim.sim_runner import SimConfig, SimRunner
+    from bg_ai.stats.memory_store import InMemoryStatsStore
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+
+    def _sim(workers: int, chunk_size=None):
+        store = InMemoryStatsStore()
+        res = SimRunner().run_matches(
+            game=BuyPlayGame(),
+            config=SimConfig(
+                game_config={"actors": ["A", "B"], "max_turns": 3},
+                num_matches=7,
+                seed=100,
+                max_ticks=100,
+                workers=workers,
+                chunk_size=chunk_size,
+            ),
+            agents_by_id=agents,
+            stats_store=store,
+            stats_query=store,
+        )
+        return res, store
+
+    seq_res, seq_store = _sim(1)
+    par_res, par_store = _sim(2, chunk_size=3)
+
+    assert [r.details for r in par_res.match_results] == [r.details for r in seq_res.match_results]
+    for actor in ("A", "B"):
+        assert par_store.action_counts(actor) == seq_store.action_counts(actor)
+        assert par_store.record(actor) == seq_store.record(actor)
+    assert par_store.record("A")["total"] == 7
+
+
+def test_s29() -> None:
+    # S29: trace levels skip event types but keep idx aligned with the full trace.
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.replay.replayer import ReplayConfig, Replayer
+
+    game_config = {"actors": ["A", "B"], "max_turns": 3}
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+
+    def _run(level: str):
+        sink = InMemoryEventSink()
+        cfg = MatchConfig(game_config=game_config, seed=7, max_ticks=100, trace_level=level)
+        _mid, res = MatchRunner().run_match(BuyPlayGame(), sink, cfg, agents_by_id=agents)
+        return res, sink.events()
+
+    full_res, full = _run("full")
+    dec_res, dec = _run("decisions")
+    res_res, res_only = _run("results_only")
+
+    assert full_res.details == dec_res.details == res_res.details
+    assert {e.type for e in dec} == {"seed_set", "match_start", "decision_provided", "match_end"}
+    assert [e.type for e in res_only] == ["seed_set", "match_start", "match_end"]
+
+    # Same (idx, type, payload) as the matching events of the full trace.
+    full_by_idx = {e.idx: (e.type, e.tick, e.payload) for e in full}
+    for e in dec + res_only:
+        assert full_by_idx[e.idx] == (e.type, e.tick, e.payload)
+
+    replayed = Replayer().replay(BuyPlayGame(), dec, ReplayConfig(game_config=game_config))
+    assert replayed.details == full_res.details
+
+    try:
+        MatchConfig(game_config={}, trace_level="verbose")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown trace_level should be rejected")
+
+
+def test_s30() -> None:
+    # S30: sinks declare `interest`; runners only build those types, idx stays aligned.
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.rock_paper_scissors.game import RPSGame
+    from bg_ai.games.rock_paper_scissors.types import RPSAction
+    from bg_ai.policies.fixed_policy import FixedPolicy
+    from bg_ai.series import BestOfN, SeriesConfig, SeriesRunner
+
+    agents = {
+        "A": Agent("A", FixedPolicy(RPSAction.ROCK)),
+        "B": Agent("B", FixedPolicy(RPSAction.SCISSORS)),
+    }
+    cfg = MatchConfig(game_config={"actors": ["A", "B"]}, seed=5, max_ticks=10)
+
+    full = InMemoryEventSink()
+    MatchRunner().run_match(RPSGame(), full, cfg, agents_by_id=agents)
+
+    only = InMemoryEventSink(interest={"decision_provided", "match_end"})
+    MatchRunner().run_match(RPSGame(), only, cfg, agents_by_id=agents)
+
+    assert [e.type for e in only.events()] == ["decision_provided", "decision_provided", "match_end"]
+    full_by_idx = {e.idx: (e.type, e.payload) for e in full.events()}
+    for e in only.events():
+        assert full_by_idx[e.idx] == (e.type, e.payload)
+
+    series_full = InMemoryEventSink()
+    series_end_only = InMemoryEventSink(interest={"series_end"})
+    for sink in (series_full, series_end_only):
+        SeriesRunner().run_series(
+            game=RPSGame(),
+            match_format=BestOfN(3),
+            config=SeriesConfig(game_config={"actors": ["A", "B"]}, seed=1),
+            agents_by_id=agents,
+            series_sink=sink,
+        )
+    assert [e.type for e in series_end_only.events()] == ["series_end"]
+    assert series_end_only.events()[0].idx == series_full.events()[-1].idx
+
+
+def test_s31() -> None:
+    # S31: BatchMatchRunner matches MatchRunner and calls decide_batch once per agent per round.
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.batch_runner import BatchMatchRunner
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, GreedyBuyPlayPolicy
+    from bg_ai.policies.random_policy import RandomPolicy
+
+    class _BatchRandom:
+        def __init__(self) -> None:
+            self.batch_sizes = []
+
+        def decide(self, ctx):
+            raise AssertionError("decide_batch should be used")
+
+        def decide_batch(self, contexts):
+            self.batch_sizes.append(len(contexts))
+            return [ctx.rng.choice(ctx.legal_actions) for ctx in contexts]
+
+    batch_policy = _BatchRandom()
+    batch_agents = {"A": Agent("A", batch_policy), "B": Agent("B", GreedyBuyPlayPolicy())}
+    seq_agents = {"A": Agent("A", RandomPolicy()), "B": Agent("B", GreedyBuyPlayPolicy())}
+
+    # Different max_turns so matches finish at different ticks.
+    configs = [
+        MatchConfig(game_config={"actors": ["A", "B"], "max_turns": 2 + k}, seed=40 + k, max_ticks=100)
+        for k in range(4)
+    ]
+
+    batch_sinks = [InMemoryEventSink() for _ in configs]
+    batch_out = BatchMatchRunner().run_matches(BuyPlayGame(), batch_sinks, configs, agents_by_id=batch_agents)
+
+    for cfg, sink, (_mid, res) in zip(configs, batch_sinks, batch_out):
+        seq_sink = InMemoryEventSink()
+        _m, seq_res = MatchRunner().run_match(BuyPlayGame(), seq_sink, cfg, agents_by_id=seq_agents)
+        assert res.details == seq_res.details
+        assert [(e.idx, e.tick, e.type, e.payload) for e in sink.events()] == [
+            (e.idx, e.tick, e.type, e.payload) for e in seq_sink.events()
+        ]
+
+    # 2 ticks per turn, all 4 matches live for the first 4 ticks.
+    assert batch_policy.batch_sizes[:4] == [4, 4, 4, 4]
+    assert sum(batch_policy.batch_sizes) == sum(2 * (2 + k) for k in range(4))
+
+
+def test_s32() -> None:
+    # S32: splitmix64 RNG backend is deterministic, recorded in seed_set and replayable.
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.engine.rng import RNG
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.rock_paper_scissors.game import RPSGame
+    from bg_ai.policies.random_policy import RandomPolicy
+    from bg_ai.replay.replayer import ReplayConfig, Replayer
+
+    r = RNG.from_seed(123, "splitmix64")
+    a1 = r.fork("policy:A").randint(1, 999)
+    a2 = r.fork("policy:A").randint(1, 999)
+    assert a1 == a2
+    assert r.fork("policy:A").backend == "splitmix64"
+    assert [r.fork("x").random() for _ in range(2)] == [r.fork("x").random()] * 2
+
+    agents = {"A": Agent("A", RandomPolicy()), "B": Agent("B", RandomPolicy())}
+    game_config = {"actors": ["A", "B"]}
+    for seed in range(5):
+        sink = InMemoryEventSink()
+        cfg = MatchConfig(game_config=game_config, seed=seed, rng_backend="splitmix64")
+        _mid, live = MatchRunner().run_match(RPSGame(), sink, cfg, agents_by_id=agents)
+
+        seed_ev = sink.events()[0]
+        assert seed_ev.payload == {"seed": seed, "rng_backend": "splitmix64"}
+
+        replayed = Replayer().replay(RPSGame(), sink.events(), ReplayConfig(game_config=game_config))
+        assert replayed.details == live.details
+
+    # Default backend keeps the original seed_set payload.
+    sink = InMemoryEventSink()
+    MatchRunner().run_match(RPSGame(), sink, MatchConfig(game_config=game_config, seed=1), agents_by_id=agents)
+    assert sink.events()[0].payload == {"seed": 1}
+
+
+def test_s33() -> None:
+    # S33: lazy forks derive the same seeds/draws as eager forking, only on demand.
+    import hashlib
+    import random
+
+    from bg_ai.engine.rng import RNG
+
+    root = RNG.from_seed(123)
+    child = root.fork("policy:A:0")
+    assert child._r is None  # nothing built yet
+
+    digest = hashlib.sha256(b"123:policy:A:0").digest()
+    expected_seed = int.from_bytes(digest[:8], "big", signed=False)
+    assert child.seed == expected_seed
+    assert child._r is None  # seed derived, generator still not built
+
+    expected = random.Random(expected_seed)
+    assert [child.randint(1, 999) for _ in range(5)] == [expected.randint(1, 999) for _ in range(5)]
+
+    # Nested forks chain through the derived seeds.
+    grandchild = root.fork("a").fork("b")
+    assert grandchild.seed == RNG.from_seed(RNG.from_seed(123).fork("a").seed).fork("b").seed
+
+
+def test_s34() -> None:
+    # S34: games return shared legal-action tuples and the runner passes them through.
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.events.sink import NullEventSink
+    from bg_ai.games.buy_play import BuyPlayAction, BuyPlayGame, GreedyBuyPlayPolicy
+    from bg_ai.games.matching_fingers import MatchingFingersGame
+    from bg_ai.games.rock_paper_scissors.game import RPSGame
+
+    rps = RPSGame()
+    st = rps.initial_state(None, {"actors": ["A", "B"]})
+    assert isinstance(rps.legal_actions(st, "A"), tuple)
+    assert rps.legal_actions(st, "A") is rps.legal_actions(st, "B")
+
+    mf = MatchingFingersGame()
+    st = mf.initial_state(None, {"actors": ["A", "B"]})
+    assert mf.legal_actions(st, "A") is mf.legal_actions(st, "B")
+
+    bp = BuyPlayGame()
+    st = bp.initial_state(None, {"actors": ["A", "B"], "max_turns": 2})
+    assert bp.legal_actions(st, "A") == (BuyPlayAction.BUY, BuyPlayAction.PASS)
+    st.memory.coins_by_actor["A"] = 3
+    assert bp.legal_actions(st, "A") == (
+        BuyPlayAction.BUY, BuyPlayAction.PASS, BuyPlayAction.PLAY, BuyPlayAction.BOTH,
+    )
+
+    seen = []
+
+    class _Spy:
+        def decide(self, ctx):
+            seen.append(ctx.legal_actions)
+            return GreedyBuyPlayPolicy().decide(ctx)
+
+    agents = {"A": Agent("A", _Spy()), "B": Agent("B", GreedyBuyPlayPolicy())}
+    cfg = MatchConfig(game_config={"actors": ["A", "B"], "max_turns": 2}, seed=1)
+    MatchRunner().run_match(bp, NullEventSink(), cfg, agents_by_id=agents)
+
+    st = bp.initial_state(None, {"actors": ["A", "B"], "max_turns": 2})
+    assert seen[0] is bp.legal_actions(st, "A")  # no copy
+
+
+def test_s35() -> None:
+    # S35: async runners decide concurrently but emit the sync runner's traces.
+    import asyncio
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.async_runner import AsyncMatchRunner
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.series import AsyncSeriesRunner, BestOfN, SeriesConfig, SeriesRunner
+    from bg_ai.sim import AsyncSimRunner, SimConfig, SimRunner
+    from bg_ai.stats.memory_store import InMemoryStatsStore
+
+    in_flight = {"now": 0, "max": 0}
+
+    class _AsyncWrap:
+        """Async policy that yields to the loop before answering."""
+
+        def __init__(self, inner) -> None:
+            self.inner = inner
+
+        async def decide(self, ctx):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0)
+            in_flight["now"] -= 1
+            return self.inner.decide(ctx)
+
+    sync_agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    async_agents = {k: Agent(k, _AsyncWrap(a.policy)) for k, a in sync_agents.items()}
+    game_config = {"actors": ["A", "B"], "max_turns": 3}
+
+    def _trace(sink):
+        return [(e.idx, e.tick, e.type, e.payload) for e in sink.events()]
+
+    configs = [MatchConfig(game_config=game_config, seed=s, max_ticks=100) for s in range(3)]
+    async_sinks = [InMemoryEventSink() for _ in configs]
+    outs = asyncio.run(
+        AsyncMatchRunner().run_matches(BuyPlayGame(), async_sinks, configs, agents_by_id=async_agents)
+    )
+    # 3 matches x 2 actors deciding at the same time.
+    assert in_flight["max"] == 6
+
+    for cfg, sink, (_mid, res) in zip(configs, async_sinks, outs):
+        seq_sink = InMemoryEventSink()
+        _m, seq_res = MatchRunner().run_match(BuyPlayGame(), seq_sink, cfg, agents_by_id=sync_agents)
+        assert res.details == seq_res.details
+        assert _trace(sink) == _trace(seq_sink)
+
+    series_cfg = SeriesConfig(game_config=game_config, seed=9)
+    seq_series = SeriesRunner().run_series(
+        game=BuyPlayGame(), match_format=BestOfN(3), config=series_cfg, agents_by_id=sync_agents
+    )
+    async_series = asyncio.run(
+        AsyncSeriesRunner().run_series(
+            game=BuyPlayGame(), match_format=BestOfN(3), config=series_cfg, agents_by_id=async_agents
+        )
+    )
+    assert async_series.wins_by_actor == seq_series.wins_by_actor
+    assert [r.details for r in async_series.match_results] == [r.details for r in seq_series.match_results]
+
+    sim_cfg = SimConfig(game_config=game_config, num_matches=5, seed=3, concurrency=2)
+    seq_store, async_store = InMemoryStatsStore(), InMemoryStatsStore()
+    seq_sim = SimRunner().run_matches(
+        game=BuyPlayGame(), config=sim_cfg, agents_by_id=sync_agents, stats_store=seq_store, stats_query=seq_store
+    )
+    async_sim = asyncio.run(
+        AsyncSimRunner().run_matches(
+            game=BuyPlayGame(), config=sim_cfg, agents_by_id=async_agents, stats_store=async_store,
+            stats_query=async_store,
+        )
+    )
+    assert [r.details for r in async_sim.match_results] == [r.details for r in seq_sim.match_results]
+    assert async_store.record("A") == seq_store.record("A")
+    assert async_store.action_counts("B") == seq_store.action_counts("B")
+
+
+def test_s36() -> None:
+    # S36: opt-in per-section timings reported from SimRunner and SeriesRunner.
+    from bg_ai.agents.agent import Agent
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.series import BestOfN, SeriesConfig, SeriesRunner
+    from bg_ai.sim import SimConfig, SimRunner
+    from bg_ai.stats.memory_store import InMemoryStatsStore
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    game_config = {"actors": ["A", "B"], "max_turns": 3}
+
+    store = InMemoryStatsStore()
+    off = SimRunner().run_matches(
+        game=BuyPlayGame(),
+        config=SimConfig(game_config=game_config, num_matches=2, seed=1),
+        agents_by_id=agents,
+        stats_store=store,
+        stats_query=store,
+    )
+    assert off.timings is None
+
+    on = SimRunner().run_matches(
+        game=BuyPlayGame(),
+        config=SimConfig(game_config=game_config, num_matches=2, seed=1, collect_timings=True),
+        agents_by_id=agents,
+        stats_store=store,
+        stats_query=store,
+    )
+    report = on.timings.report()["buy_play_v1"]
+    # 2 matches x 3 turns x 2 phases = 12 ticks with both actors deciding.
+    assert report["decide"]["A"]["count"] == 12
+    assert report["legal_actions"]["B"]["count"] == 12
+    assert report["apply_actions"]["*"]["count"] == 12
+    # Forks are lazy and buy_play never draws: no derivation/build to time.
+    assert "rng_fork" not in report
+    # seed_set, match_start, match_end + per tick: start, 2x(requested, provided), applied, domain, end
+    assert report["sink_emit"]["*"]["count"] == 2 * (3 + 6 * 8)
+    assert sum(report["decide"]["A"]["buckets"].values()) == 12
+    assert on.timings.format_report()
+
+    # rng_fork times the deferred work: one sample per built generator, none for the handle.
+    from bg_ai.engine.rng import RNG
+    from bg_ai.engine.timing import TimingCollector, instrument
+
+    timings = TimingCollector()
+    _, _, root = instrument(BuyPlayGame(), None, RNG.from_seed(5), timings)
+    child = root.fork("x")
+    assert timings.histogram("buy_play_v1", "rng_fork").count == 0
+    draws = [child.random(), child.random()]
+    assert timings.histogram("buy_play_v1", "rng_fork").count == 1
+    plain = RNG.from_seed(5).fork("x")
+    assert draws == [plain.random(), plain.random()]
+
+    series = SeriesRunner().run_series(
+        game=BuyPlayGame(),
+        match_format=BestOfN(3),
+        config=SeriesConfig(game_config=game_config, seed=2, collect_timings=True),
+        agents_by_id=agents,
+    )
+    assert series.timings.histogram("buy_play_v1", "decide", "B").count == 6 * len(series.match_results)
+
+
+def test_s37() -> None:
+    # S37: per-decision budgets with a deterministic fallback, sync and async.
+    import asyncio
+    import threading
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.async_runner import AsyncMatchRunner
+    from bg_ai.engine.match_runner import TIMEOUT_FALLBACK_RANDOM, MatchConfig, MatchRunner
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.replay.replayer import ReplayConfig, Replayer
+    from bg_ai.sim import SimConfig, SimRunner
+    from bg_ai.stats.memory_store import InMemoryStatsStore
+
+    release = threading.Event()
+
+    class _Stuck:
+        """Blocks until released (far beyond any budget)."""
+
+        def decide(self, ctx):
+            release.wait(5.0)
+            return ctx.legal_actions[-1]
+
+    class _AsyncStuck:
+        async def decide(self, ctx):
+            await asyncio.sleep(5.0)
+            return ctx.legal_actions[-1]
+
+    game_config = {"actors": ["A", "B"], "max_turns": 2}
+    fast_b = Agent("B", ConservativeBuyPlayPolicy(target_coins=2))
+
+    try:
+        # Agent-level budget; B has none and is never timed out.
+        agents = {"A": Agent("A", _Stuck(), decision_timeout_s=0.01), "B": fast_b}
+        sink = InMemoryEventSink()
+        counts = {}
+        _mid, res = MatchRunner().run_match(
+            BuyPlayGame(), sink, MatchConfig(game_config=game_config, seed=4), agents_by_id=agents,
+            decision_timeouts=counts,
+        )
+        events = sink.events()
+        timeouts = [e for e in events if e.type == "decision_timeout"]
+        assert counts == {"A": len(timeouts)} and len(timeouts) == 4  # 2 turns x 2 phases
+        assert all(e.payload == {"actor_id": "A", "timeout_s": 0.01, "fallback": "first_legal"} for e in timeouts)
+        for e in timeouts:
+            nxt = events[e.idx + 1]
+            assert nxt.type == "decision_provided" and nxt.payload["actor_id"] == "A"
+        assert [e.idx for e in events] == list(range(len(events)))
+        assert Replayer().replay(BuyPlayGame(), events, ReplayConfig(game_config=game_config)).details == res.details
+
+        # Config-level budget + random fallback is seed-deterministic, sync and async.
+        cfg = MatchConfig(game_config=game_config, seed=8, decision_timeout_s=0.01, timeout_fallback=TIMEOUT_FALLBACK_RANDOM)
+
+        def _provided(sink):
+            return [(e.tick, e.payload) for e in sink.events() if e.type == "decision_provided"]
+
+        s1, s2 = InMemoryEventSink(), InMemoryEventSink()
+        MatchRunner().run_match(BuyPlayGame(), s1, cfg, agents_by_id={"A": Agent("A", _Stuck()), "B": fast_b})
+        asyncio.run(
+            AsyncMatchRunner().run_match(BuyPlayGame(), s2, cfg, agents_by_id={"A": Agent("A", _AsyncStuck()), "B": fast_b})
+        )
+        assert _provided(s1) == _provided(s2)
+        assert sum(e.type == "decision_timeout" for e in s2.events()) == 4
+
+        # Fast policies under a generous budget: same trace as no budget at all.
+        plain = {"A": Agent("A", GreedyBuyPlayPolicy()), "B": fast_b}
+        s3, s4 = InMemoryEventSink(), InMemoryEventSink()
+        MatchRunner().run_match(BuyPlayGame(), s3, MatchConfig(game_config=game_config, seed=1), agents_by_id=plain)
+        MatchRunner().run_match(
+            BuyPlayGame(), s4, MatchConfig(game_config=game_config, seed=1, decision_timeout_s=30.0), agents_by_id=plain
+        )
+        assert [(e.type, e.payload) for e in s3.events()] == [(e.type, e.payload) for e in s4.events()]
+
+        # Sync decide returning a coroutine (wrapped async policy): awaited under a budget, not played as the action.
+        class _Wrapped:
+            def __init__(self, inner) -> None:
+                self.inner = inner
+
+            def decide(self, ctx):
+                return self.inner.decide(ctx)
+
+        class _AsyncGreedy:
+            async def decide(self, ctx):
+                return GreedyBuyPlayPolicy().decide(ctx)
+
+        budgeted = MatchConfig(game_config=game_config, seed=1, decision_timeout_s=30.0)
+        s5, s6 = InMemoryEventSink(), InMemoryEventSink()
+        asyncio.run(
+            AsyncMatchRunner().run_match(BuyPlayGame(), s5, budgeted, agents_by_id={"A": Agent("A", _Wrapped(_AsyncGreedy())), "B": fast_b})
+        )
+        assert _provided(s5) == _provided(s3)
+        asyncio.run(
+            AsyncMatchRunner().run_match(BuyPlayGame(), s6, cfg, agents_by_id={"A": Agent("A", _Wrapped(_AsyncStuck())), "B": fast_b})
+        )
+        assert _provided(s6) == _provided(s2)
+
+        # Run-level metrics.
+        store = InMemoryStatsStore()
+        sim = SimRunner().run_matches(
+            game=BuyPlayGame(),
+            config=SimConfig(game_config=game_config, num_matches=2, seed=1, decision_timeout_s=0.01, collect_timings=True),
+            agents_by_id={"A": Agent("A", _Stuck()), "B": fast_b},
+            stats_store=store,
+            stats_query=store,
+        )
+        assert sim.decision_timeouts == {"A": 8}
+        assert sim.timings.histogram("buy_play_v1", "decision_timeout", "A").count == 8
+        assert sim.timings.histogram("buy_play_v1", "decide", "B").count == 8
+
+        # Abandoned stuck calls (more than a default executor holds) must not starve other agents' budgets.
+        stuck_agents = {
+            "A": Agent("A", _Stuck(), decision_timeout_s=0.01),
+            "B": Agent("B", fast_b.policy, decision_timeout_s=2.0),
+        }
+        wave_sinks = [InMemoryEventSink() for _ in range(8)]
+        asyncio.run(
+            AsyncMatchRunner().run_matches(
+                BuyPlayGame(), wave_sinks, [MatchConfig(game_config=game_config, seed=s) for s in range(8)],
+                agents_by_id=stuck_agents,
+            )
+        )
+        wave_timeouts = [e.payload["actor_id"] for ws in wave_sinks for e in ws.events() if e.type == "decision_timeout"]
+        assert wave_timeouts == ["A"] * 32
+    finally:
+        release.set()
+
+
+def test_s38() -> None:
+    # S38: state_snapshot events + resume from the latest checkpoint.
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.checkpoint import Checkpoint
+    from bg_ai.engine.match_runner import TRACE_RESULTS_ONLY, MatchConfig, MatchRunner
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.games.rock_paper_scissors import RPSGame
+    from bg_ai.replay.replayer import ReplayConfig, Replayer
+
+    class _Counting:
+        def __init__(self, inner) -> None:
+            self.inner = inner
+            self.calls = 0
+
+        def decide(self, ctx):
+            self.calls += 1
+            return self.inner.decide(ctx)
+
+    game = BuyPlayGame()
+    game_config = {"actors": ["A", "B"], "max_turns": 10}
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+
+    def _trace(events):
+        return [(e.idx, e.tick, e.type, e.payload) for e in events]
+
+    # Snapshots off: unchanged trace.
+    plain, snap = InMemoryEventSink(), InMemoryEventSink()
+    MatchRunner().run_match(game, plain, MatchConfig(game_config=game_config, seed=5), agents_by_id=agents)
+    _mid, full_res = MatchRunner().run_match(
+        game, snap, MatchConfig(game_config=game_config, seed=5, snapshot_every=4), agents_by_id=agents
+    )
+    full = snap.events()
+    snaps = [e for e in full if e.type == "state_snapshot"]
+    assert [e.tick for e in snaps] == [4, 8, 12, 16]
+    assert [(t, p) for _i, t, ty, p in _trace(full) if ty != "state_snapshot"] == [
+        (t, p) for _i, t, _ty, p in _trace(plain.events())
+    ]
+    assert [e.idx for e in full] == list(range(len(full)))
+
+    # Crash mid-tick 13: resume from the tick-12 snapshot, only remaining ticks run.
+    crashed = [e for e in full if e.tick <= 13][:-2]
+    checkpoint = Checkpoint.latest(crashed)
+    assert (checkpoint.tick, checkpoint.seed) == (12, 5)
+    kept = [e for e in crashed if e.idx <= checkpoint.idx]
+
+    counting = {k: Agent(k, _Counting(a.policy)) for k, a in agents.items()}
+    resumed = InMemoryEventSink()
+    _m, res = MatchRunner().run_match(
+        game, resumed, MatchConfig(game_config=game_config, snapshot_every=4), agents_by_id=counting,
+        resume_from=checkpoint,
+    )
+    assert res.details == full_res.details
+    assert _trace(kept + resumed.events()) == _trace(full)
+    assert counting["A"].policy.calls == 20 - 12  # 10 turns x 2 phases, resumed at tick 12
+
+    # Multi-match logs: pick the match explicitly; mixing matches without match_id is an error.
+    other = InMemoryEventSink()
+    MatchRunner().run_match(
+        game, other, MatchConfig(game_config=game_config, seed=6, snapshot_every=4), agents_by_id=agents
+    )
+    mixed = crashed + other.events()
+    assert Checkpoint.latest(mixed, match_id=checkpoint.match_id) == checkpoint
+    assert Checkpoint.latest(mixed, match_id=other.events()[0].match_id).seed == 6
+    try:
+        Checkpoint.latest(mixed)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for snapshots of several matches")
+
+    # Replay can start from the last snapshot as well.
+    from_snap = Replayer().replay(game, full, ReplayConfig(game_config=game_config, from_snapshot=True))
+    assert from_snap.details == full_res.details
+
+    # Snapshots are still emitted at results_only; games without the protocol are rejected.
+    lean = InMemoryEventSink()
+    MatchRunner().run_match(
+        game, lean, MatchConfig(game_config=game_config, seed=5, snapshot_every=4, trace_level=TRACE_RESULTS_ONLY),
+        agents_by_id=agents,
+    )
+    assert [e.payload for e in lean.events() if e.type == "state_snapshot"] == [e.payload for e in snaps]
+    try:
+        MatchRunner().run_match(
+            RPSGame(), InMemoryEventSink(), MatchConfig(game_config={"actors": ["A", "B"]}, snapshot_every=1)
+        )
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("expected TypeError for a game without snapshot_state")
+
+
+def test_s39() -> None:
+    # S39: streaming JSONL file sink (flush policies, rotation, context manager).
+    import tempfile
+    from pathlib import Path
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.events.codecs_jsonl import import_events_jsonl
+    from bg_ai.events.jsonl_sink import FLUSH_EVERY_N, JsonlFileSink
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.series import BestOfN, SeriesConfig, SeriesRunner
+    from bg_ai.sim import SimConfig, SimRunner
+    from bg_ai.stats.memory_store import InMemoryStatsStore
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    game_config = {"actors": ["A", "B"], "max_turns": 3}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Same bytes as the in-memory trace, written incrementally.
+        mem = InMemoryEventSink()
+        with JsonlFileSink(Path(tmp) / "one.jsonl", flush=FLUSH_EVERY_N, flush_every=7) as fsink:
+            MatchRunner().run_match(BuyPlayGame(), fsink, MatchConfig(game_config=game_config, seed=1), agents_by_id=agents)
+            # 51 events: the 7 full flush_every batches reach the file before close
+            assert len((Path(tmp) / "one.jsonl").read_text(encoding="utf-8").splitlines()) == 49
+        assert fsink.closed
+        MatchRunner().run_match(BuyPlayGame(), mem, MatchConfig(game_config=game_config, seed=1), agents_by_id=agents)
+        loaded = import_events_jsonl(Path(tmp) / "one.jsonl")
+        assert [(e.idx, e.type, e.payload) for e in loaded] == [(e.idx, e.type, e.payload) for e in mem.events()]
+
+        # SimRunner: rotation splits only between matches.
+        store = InMemoryStatsStore()
+        with JsonlFileSink(Path(tmp) / "sim.jsonl", max_bytes=4096) as fsink:
+            SimRunner().run_matches(
+                game=BuyPlayGame(),
+                config=SimConfig(game_config=game_config, num_matches=6, seed=10),
+                agents_by_id=agents,
+                stats_store=store,
+                stats_query=store,
+                event_sink=fsink,
+            )
+        assert fsink.events_written == 6 * 51
+        assert len(fsink.paths) > 1 and fsink.paths[1].name == "sim.1.jsonl"
+        parts = [import_events_jsonl(p) for p in fsink.paths]
+        for part in parts:
+            assert part[0].type == "seed_set" and part[-1].type == "match_end"
+        all_events = [e for part in parts for e in part]
+        assert len({e.match_id for e in all_events}) == 6
+        provided_a = [e for e in all_events if e.type == "decision_provided" and e.payload["actor_id"] == "A"]
+        assert len(provided_a) == sum(store.action_counts("A").values())
+
+        # SeriesRunner: per-match events go to match_sink.
+        with JsonlFileSink(Path(tmp) / "series.jsonl", interest={"match_end"}) as fsink:
+            series = SeriesRunner().run_series(
+                game=BuyPlayGame(), match_format=BestOfN(3), config=SeriesConfig(game_config=game_config, seed=2),
+                agents_by_id=agents, match_sink=fsink,
+            )
+        ends = import_events_jsonl(Path(tmp) / "series.jsonl")
+        assert [e.payload["result"] for e in ends] == [r.details for r in series.match_results]
+
+        try:
+            fsink.emit(ends[0])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError after close")
+
+        # Compressed names would get plain bytes that readers cannot decode: rejected up front.
+        try:
+            JsonlFileSink(Path(tmp) / "sim.jsonl.gz")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError for a compressed suffix")
+        assert not (Path(tmp) / "sim.jsonl.gz").exists()
+
+
+def test_s40() -> None:
+    # S40: binary event codec (interned strings, varints) with a JSONL round trip.
+    import tempfile
+    from pathlib import Path
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.events.codecs_binary import binary_to_jsonl, export_events_binary, import_events_binary, jsonl_to_binary
+    from bg_ai.events.codecs_jsonl import export_events_jsonl
+    from bg_ai.events.model import Event
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.rock_paper_scissors import RPSGame
+    from bg_ai.policies.random_policy import RandomPolicy
+
+    sink = InMemoryEventSink()
+    agents = {"A": Agent("A", RandomPolicy()), "B": Agent("B", RandomPolicy())}
+    for seed in range(20):
+        MatchRunner().run_match(RPSGame(), sink, MatchConfig(game_config={"actors": ["A", "B"]}, seed=seed), agents_by_id=agents)
+    events = sink.events() + [
+        Event(match_id="series-1", idx=0, tick=-1, type="series_start", payload={"nested": {"l": [1, -2, 2.5, None, True]}}),
+        Event(match_id="series-1", idx=1, tick=-1, type="odd", payload={"s": "é✓", "big": 2**64 + 1}, schema_version=2,
+              timestamp_ms=1_700_000_000_000),
+    ]
+
+    def _key(evs):
+        return [(e.match_id, e.idx, e.tick, e.type, e.payload, e.schema_version, e.timestamp_ms) for e in evs]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bin_path = export_events_binary(Path(tmp) / "log.bin", events)
+        assert _key(import_events_binary(bin_path)) == _key(events)
+
+        jsonl_path = export_events_jsonl(Path(tmp) / "log.jsonl", events)
+        jsonl_to_binary(jsonl_path, Path(tmp) / "conv.bin")
+        back = binary_to_jsonl(Path(tmp) / "conv.bin", Path(tmp) / "back.jsonl")
+        assert back.read_bytes() == jsonl_path.read_bytes()
+
+        # Decision-dominated logs shrink a lot.
+        assert jsonl_path.stat().st_size > 5 * bin_path.stat().st_size
+
+        # Decoded payloads are independent objects (decode cache is never shared).
+        decoded = import_events_binary(bin_path)
+        provided = [e for e in decoded if e.type == "decision_provided"]
+        provided[0].payload["action"] = "X"
+        assert all(e.payload["action"] != "X" for e in provided[1:])
+
+        empty = Path(tmp) / "empty.bin"
+        empty.write_bytes(b"")
+        assert import_events_binary(empty) == []
+        try:
+            import_events_binary(jsonl_path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError for a non-binary file")
+
+
+def test_s41() -> None:
+    # S41: block-compressed JSONL logs with a block index for per-match reads.
+    import gzip
+    import tempfile
+    from pathlib import Path
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.events.codecs_jsonl import export_events_jsonl, import_events_jsonl, import_match_jsonl
+    from bg_ai.events.compression import read_block_index
+    from bg_ai.events.model import Event
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    sink = InMemoryEventSink()
+    match_ids = []
+    for seed in range(12):
+        mid, _res = MatchRunner().run_match(
+            BuyPlayGame(), sink, MatchConfig(game_config={"actors": ["A", "B"], "max_turns": 4}, seed=seed),
+            agents_by_id=agents,
+        )
+        match_ids.append(mid)
+    events = sink.events()
+
+    def _key(evs):
+        return [(e.match_id, e.idx, e.tick, e.type, e.payload) for e in evs]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = export_events_jsonl(Path(tmp) / "log.jsonl", events)
+        for suffix in (".gz", ".xz", ".bz2"):
+            path = export_events_jsonl(Path(tmp) / f"log.jsonl{suffix}", events, block_bytes=16 * 1024)
+            assert _key(import_events_jsonl(path)) == _key(events)
+            assert path.stat().st_size * 4 < plain.stat().st_size
+
+            index = read_block_index(path)
+            assert len(index) > 2 and sum(b.events for b in index) == len(events)
+            # Blocks start at match boundaries (matches here are far below 4 x block_bytes).
+            assert all(b.first_idx == 0 and b.first_match_id == b.match_ids[0] for b in index)
+
+            target = match_ids[7]
+            assert sum(target in b.match_ids for b in index) == 1
+            assert _key(import_match_jsonl(path, target)) == _key(e for e in events if e.match_id == target)
+
+        # The file is a regular multi-member gzip file.
+        with gzip.open(Path(tmp) / "log.jsonl.gz", "rb") as f:
+            assert f.read() == plain.read_bytes()
+        assert _key(import_match_jsonl(plain, match_ids[0])) == _key(e for e in events if e.match_id == match_ids[0])
+
+        # Unicode line separators inside strings are not line breaks.
+        odd = [Event("m", 0, 0, "domain_event", {"s": "a\u2028b\u2029c\x85d"})]
+        for name in ("odd.jsonl", "odd.jsonl.gz"):
+            path = export_events_jsonl(Path(tmp) / name, odd)
+            assert _key(import_match_jsonl(path, "m")) == _key(import_events_jsonl(path)) == _key(odd)
+
+
+def test_s42() -> None:
+    # S42: lazy iter_events with type / match_id / tick filters; consumers accept iterators.
+    import contextlib
+    import io
+    import tempfile
+    from pathlib import Path
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.events.codecs_jsonl import export_events_jsonl, iter_events
+    from bg_ai.events.pretty import print_events, summarize_event_types
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.replay.replayer import ReplayConfig, Replayer
+    from bg_ai.stats.memory_store import InMemoryStatsStore
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    game_config = {"actors": ["A", "B"], "max_turns": 3}
+    sink = InMemoryEventSink()
+    runs = [
+        MatchRunner().run_match(BuyPlayGame(), sink, MatchConfig(game_config=game_config, seed=s), agents_by_id=agents)
+        for s in range(5)
+    ]
+    events = sink.events()
+
+    def _key(evs):
+        return [(e.match_id, e.idx, e.tick, e.type, e.payload) for e in evs]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("log.jsonl", "log.jsonl.gz"):
+            path = export_events_jsonl(Path(tmp) / name, events)
+
+            it = iter_events(path)
+            assert not isinstance(it, list)
+            assert _key(it) == _key(events)
+
+            ends = list(iter_events(path, types=["match_end"]))
+            assert [e.payload["result"] for e in ends] == [res.details for _mid, res in runs]
+
+            mid, res = runs[3]
+            picked = iter_events(path, match_ids={mid}, types={"decision_provided", "tick_end"}, tick_range=(2, 4))
+            assert _key(picked) == _key(
+                e for e in events
+                if e.match_id == mid and e.type in ("decision_provided", "tick_end") and 2 <= e.tick < 4
+            )
+
+            # Consumers take the iterator directly.
+            assert Replayer().replay(
+                BuyPlayGame(), iter_events(path, match_ids=[mid]), ReplayConfig(game_config=game_config)
+            ).details == res.details
+            store = InMemoryStatsStore()
+            store.ingest_match(result=res, events=iter_events(path, match_ids=[mid], types=["decision_provided"]))
+            assert sum(store.action_counts("A").values()) == 6
+            assert summarize_event_types(iter_events(path)) == summarize_event_types(events)
+
+        # A type string inside another event's payload is only a pre-check hit, not a match.
+        odd = Path(tmp) / "odd.jsonl"
+        odd.write_text(
+            '{"match_id":"m","idx":0,"tick":0,"type":"domain_event","payload":{"note":"match_end"}}\n'
+            '{"match_id": "m", "idx": 1, "tick": 0, "type": "match_end", "payload": {}}\n',
+            encoding="utf-8",
+        )
+        assert [e.idx for e in iter_events(odd, types=["match_end"])] == [1]
+
+    # print_events reads at most limit + 1 events from an iterator.
+    consumed = []
+
+    def _counted():
+        for e in events:
+            consumed.append(e)
+            yield e
+
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        print_events(_counted(), limit=3)
+        print_events(events, limit=3)
+    lines = out.getvalue().splitlines()
+    assert len(consumed) == 4
+    assert lines[3] == "... (more events)" and lines[7] == f"... ({len(events) - 3} more events)"
+
+
+def test_s43() -> None:
+    # S43: per-match byte-offset index + process-pool decoding.
+    import os
+    import tempfile
+    from pathlib import Path
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.events.codecs_jsonl import export_events_jsonl, import_events_jsonl
+    from bg_ai.events.jsonl_index import (
+        build_match_index,
+        map_matches,
+        match_index_path,
+        parallel_import_events_jsonl,
+        read_match,
+        read_match_index,
+    )
+    from bg_ai.events.pretty import summarize_event_types
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    sink = InMemoryEventSink()
+    match_ids = [
+        MatchRunner().run_match(
+            BuyPlayGame(), sink, MatchConfig(game_config={"actors": ["A", "B"], "max_turns": 3}, seed=s),
+            agents_by_id=agents,
+        )[0]
+        for s in range(8)
+    ]
+    events = sink.events()
+
+    def _key(evs):
+        return [(e.match_id, e.idx, e.tick, e.type, e.payload) for e in evs]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = export_events_jsonl(Path(tmp) / "log.jsonl", events)
+        spans = build_match_index(path)
+        assert match_index_path(path).exists()
+        assert [sp.match_id for sp in spans] == match_ids and all(sp.first_idx == 0 for sp in spans)
+        assert sum(sp.length for sp in spans) == path.stat().st_size
+        assert read_match_index(path) == spans
+
+        assert _key(read_match(path, match_ids[5])) == _key(e for e in events if e.match_id == match_ids[5])
+
+        small = 4 * 1024  # several chunks
+        assert _key(parallel_import_events_jsonl(path, workers=2, chunk_bytes=small)) == _key(import_events_jsonl(path))
+        counts = map_matches(path, summarize_event_types, workers=2, chunk_bytes=small)
+        assert list(counts) == match_ids
+        assert counts[match_ids[0]] == summarize_event_types(e for e in events if e.match_id == match_ids[0])
+
+        # Appending invalidates the index (size check) and it is rebuilt.
+        export_events_jsonl(path, events + events[:3])
+        assert read_match_index(path)[-1].length < spans[-1].length
+
+        # A regenerated log of the same size (matches reordered) is caught by its mtime.
+        export_events_jsonl(path, events)
+        st = path.stat()
+        assert read_match_index(path) == spans
+        export_events_jsonl(path, [e for mid in reversed(match_ids) for e in events if e.match_id == mid])
+        assert path.stat().st_size == st.st_size
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert [sp.match_id for sp in read_match_index(path)] == match_ids[::-1]
+
+
+def test_s44() -> None:
+    # S44: columnar event store (typed arrays + side table), group-by counts, rows back to Events.
+    from collections import Counter
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.events.columnar import ColumnarEventStore
+    from bg_ai.events.pretty import summarize_event_types
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.stats.memory_store import InMemoryStatsStore
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    sink = InMemoryEventSink()
+    stats = InMemoryStatsStore()
+    for seed in range(6):
+        match_sink = InMemoryEventSink()
+        _mid, res = MatchRunner().run_match(
+            BuyPlayGame(), match_sink, MatchConfig(game_config={"actors": ["A", "B"], "max_turns": 4}, seed=seed),
+            agents_by_id=agents,
+        )
+        stats.ingest_match(result=res, events=match_sink.events())
+        for e in match_sink.events():
+            sink.emit(e)
+    events = sink.events()
+
+    store = ColumnarEventStore()
+    assert store.ingest(sink.events()) == len(events)
+    assert len(store.match_ids) == 6
+
+    # Only seed_set, match_start, actions_applied, domain_event and match_end need the side table.
+    side_types = {"seed_set", "match_start", "actions_applied", "domain_event", "match_end"}
+    assert store.side_table_size == sum(e.type in side_types for e in events)
+
+    assert store.count_by_type() == summarize_event_types(events)
+    assert store.action_counts("A") == stats.action_counts("A")
+    per_tick = store.group_count(("actor", "tick", "action"), type="decision_provided")
+    assert per_tick == dict(
+        Counter(
+            (e.payload["actor_id"], e.tick, e.payload["action"]) for e in events if e.type == "decision_provided"
+        )
+    )
+    mid = store.match_ids[2]
+    assert store.group_count(("type",), match_id=mid)[("tick_end",)] == 8
+
+    def _key(evs):
+        return [(e.match_id, e.idx, e.tick, e.type, e.payload, e.schema_version, e.timestamp_ms) for e in evs]
+
+    assert _key(store.iter_events()) == _key(events)
+    assert _key(store.iter_events(mid)) == _key(e for e in events if e.match_id == mid)
+
+
+def test_s45() -> None:
+    # S45: append-only mmap archive indexed by match_id / series_id.
+    import tempfile
+    from pathlib import Path
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.events.archive import (
+        KIND_MATCH,
+        KIND_SERIES,
+        EventArchiveReader,
+        EventArchiveWriter,
+        archive_index_path,
+    )
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.replay.replayer import ReplayConfig, Replayer
+    from bg_ai.series import BestOfN, SeriesConfig, SeriesRunner
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    game_config = {"actors": ["A", "B"], "max_turns": 3}
+
+    def _key(evs):
+        return [(e.match_id, e.idx, e.tick, e.type, e.payload) for e in evs]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "events.bga"
+        mem = InMemoryEventSink()
+        with EventArchiveWriter(path) as writer:
+            series = SeriesRunner().run_series(
+                game=BuyPlayGame(), match_format=BestOfN(3), config=SeriesConfig(game_config=game_config, seed=4),
+                agents_by_id=agents, series_sink=writer, match_sink=writer,
+            )
+            SeriesRunner().run_series(
+                game=BuyPlayGame(), match_format=BestOfN(3), config=SeriesConfig(game_config=game_config, seed=4),
+                agents_by_id=agents, series_sink=mem, match_sink=mem,
+            )
+
+        with EventArchiveReader(path) as reader:
+            assert reader.ids(KIND_SERIES) == [series.series_id]
+            match_ids = reader.ids(KIND_MATCH)
+            assert reader.series_match_ids(series.series_id) == match_ids
+            assert len(match_ids) == len(series.match_results)
+
+            # One match: only its bytes are decoded; replay straight from the archive.
+            mid = match_ids[-1]
+            assert sum(len(v) for v in reader.raw(mid)) < path.stat().st_size // 2
+            events = reader.events(mid)
+            assert [e.type for e in events][0] == "seed_set" and events[-1].type == "match_end"
+            assert events[-1].payload["result"] == series.match_results[-1].details
+            replayed = Replayer().replay(BuyPlayGame(), reader.iter_events(mid), ReplayConfig(game_config=game_config))
+            assert replayed.details == series.match_results[-1].details
+
+            series_events = reader.events(series.series_id)
+            assert [e.type for e in series_events][0] == "series_start" and series_events[-1].type == "series_end"
+            assert [e.idx for e in series_events] == list(range(len(series_events)))
+            mem_series = [e for e in mem.events() if e.type.startswith("series_")]
+            assert [(e.idx, e.type) for e in series_events] == [(e.idx, e.type) for e in mem_series]
+            size = path.stat().st_size
+
+        # Torn write: a half-written segment and index line are dropped on the next append.
+        with path.open("ab") as f:
+            f.write(b"\x00" * 10)
+        with archive_index_path(path).open("a", encoding="utf-8") as f:
+            f.write('{"id":"x","kind":"match","offset":')
+        with EventArchiveWriter(path) as writer:
+            writer.append(events)
+        with EventArchiveReader(path) as reader:
+            assert path.stat().st_size == size + sum(len(v) for v in reader.raw(mid)) // 2
+            assert _key(reader.events(mid)) == _key(events + events)
+            assert "x" not in reader
+
+        # A raw() view held across close(): close succeeds and the view stays readable.
+        reader = EventArchiveReader(path)
+        held = reader.raw(mid)
+        reader.close()
+        assert all(bytes(v[:4]) == b"BGEV" for v in held)
+        for v in held:
+            v.release()
+
+
+def test_s46() -> None:
+    # S46: one-pass streaming replay (any iterator, early stop at a tick, resumed logs via snapshots).
+    import tempfile
+    from dataclasses import replace
+    from pathlib import Path
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import TRACE_DECISIONS, MatchConfig, MatchRunner
+    from bg_ai.events.codecs_jsonl import export_events_jsonl, iter_events
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.replay.replayer import ReplayConfig, Replayer
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    game_config = {"actors": ["A", "B"], "max_turns": 40}
+    cfg = ReplayConfig(game_config=game_config)
+    replayer = Replayer()
+
+    sink = InMemoryEventSink()
+    _mid, result = MatchRunner().run_match(
+        BuyPlayGame(), sink, MatchConfig(game_config=game_config, seed=9, snapshot_every=10), agents_by_id=agents
+    )
+    events = sink.events()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = export_events_jsonl(Path(tmp) / "long.jsonl.gz", events, block_bytes=2048)
+        assert replayer.replay_stream(BuyPlayGame(), iter_events(path), cfg).details == result.details
+
+    lean = InMemoryEventSink()
+    MatchRunner().run_match(
+        BuyPlayGame(), lean, MatchConfig(game_config=game_config, seed=9, trace_level=TRACE_DECISIONS),
+        agents_by_id=agents,
+    )
+    assert replayer.replay_stream(BuyPlayGame(), iter(lean.events()), cfg).details == result.details
+
+    # Early stop: same as a full replay of the first ticks, and the iterator is not drained.
+    it = iter(events)
+    early = replayer.replay_stream(BuyPlayGame(), it, cfg, until_tick=5)
+    assert early.details == replayer.replay(BuyPlayGame(), [e for e in events if e.tick <= 5], cfg).details
+    assert early.details["turn"] < result.details["turn"]
+    assert sum(1 for _ in it) > len(events) // 2
+
+    # Decision-free gap ticks (ticks renumbered 0, 2, 4, ...): stopping at a gap applies nothing after it.
+    gapped = [replace(e, tick=2 * e.tick) for e in lean.events()]
+    at_gap = replayer.replay_stream(BuyPlayGame(), iter(gapped), cfg, until_tick=9)
+    assert at_gap.details == replayer.replay_stream(BuyPlayGame(), iter(gapped), cfg, until_tick=8).details
+    assert at_gap.details != replayer.replay_stream(BuyPlayGame(), iter(gapped), cfg, until_tick=10).details
+
+    ticks = [t for t, _state in replayer.iter_states(BuyPlayGame(), events, cfg)]
+    assert ticks == sorted({e.tick for e in events if e.type == "decision_provided"})
+
+    # A log part that starts at a snapshot (no seed_set) streams from that snapshot.
+    snaps = [i for i, e in enumerate(events) if e.type == "state_snapshot"]
+    tail = events[snaps[1]:]
+    snap_cfg = ReplayConfig(game_config=game_config, from_snapshot=True)
+    assert replayer.replay_stream(BuyPlayGame(), iter(tail), snap_cfg).details == result.details
+    try:
+        replayer.replay_stream(BuyPlayGame(), iter(tail), cfg)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError without seed_set or from_snapshot")
+
+
+def test_s47() -> None:
+    # S47: bulk replay verification over a log directory, with a divergence report.
+    import json
+    import tempfile
+    from pathlib import Path
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import TRACE_RESULTS_ONLY, MatchConfig, MatchRunner
+    from bg_ai.events.codecs_jsonl import export_events_jsonl
+    from bg_ai.events.jsonl_index import build_match_index
+    from bg_ai.events.model import Event
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.replay.verify import STATUS_INCOMPLETE, STATUS_MISMATCH, STATUS_NO_DECISIONS, find_logs, verify_logs
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    game_config = {"actors": ["A", "B"], "max_turns": 5}
+    targets = {BuyPlayGame().game_id: (BuyPlayGame, game_config)}
+
+    def _matches(seeds):
+        sink = InMemoryEventSink()
+        for seed in seeds:
+            MatchRunner().run_match(BuyPlayGame(), sink, MatchConfig(game_config=game_config, seed=seed), agents_by_id=agents)
+        return sink.events()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        good = export_events_jsonl(root / "a.jsonl", _matches(range(4)))
+        build_match_index(good)
+        export_events_jsonl(root / "nightly" / "b.jsonl.gz", _matches(range(4, 8)), block_bytes=4096)
+        assert len(find_logs(root)) == 2  # sidecar indexes are not logs
+
+        report = verify_logs(root, targets, workers=2)
+        assert report.ok and report.files == 2 and report.matches == 8
+
+        # Tamper with one logged result and cut another match short.
+        bad = _matches(range(8, 11))
+        ends = [i for i, e in enumerate(bad) if e.type == "match_end"]
+        e = bad[ends[0]]
+        result = dict(e.payload["result"], winner="nobody")
+        bad[ends[0]] = Event(e.match_id, e.idx, e.tick, e.type, dict(e.payload, result=result))
+        cut = bad[:ends[2]]
+        export_events_jsonl(root / "c.jsonl", cut)
+
+        report = verify_logs(root, targets, workers=2)
+        assert report.files == 3 and report.matches == 11
+        assert [(Path(d.path).name, d.match_id, d.status) for d in report.divergences] == [
+            ("c.jsonl", bad[ends[0]].match_id, STATUS_MISMATCH),
+            ("c.jsonl", bad[-1].match_id, STATUS_INCOMPLETE),
+        ]
+        assert report.divergences[0].diff["winner"][0] == "nobody"
+        assert verify_logs(root, targets, workers=1).to_dict() == report.to_dict()
+        # Split by match: small chunks spread each plain log over several pool tasks; same report.
+        assert verify_logs(root, targets, workers=2, chunk_bytes=2048).to_dict() == report.to_dict()
+        assert not (root / "c.jsonl.matches.json").exists()  # spans built in memory, nothing written under root
+
+        out = json.loads(report.write(root / "report" / "verify.json").read_text(encoding="utf-8"))
+        assert out["diverged"] == 2 and out["divergences"][0]["diff"] == report.divergences[0].diff
+
+        # A results_only log has nothing to replay: its own status, not a mismatch.
+        sink = InMemoryEventSink()
+        cfg = MatchConfig(game_config=game_config, seed=11, trace_level=TRACE_RESULTS_ONLY)
+        mid, _result = MatchRunner().run_match(BuyPlayGame(), sink, cfg, agents_by_id=agents)
+        export_events_jsonl(root / "lean" / "d.jsonl", sink.events())
+        lean = verify_logs(root / "lean", targets, workers=2)
+        assert [(d.match_id, d.status) for d in lean.divergences] == [(mid, STATUS_NO_DECISIONS)]
+
+
+def test_s48() -> None:
+    # S48: ReplayCursor, sparse state copies every K ticks with an LRU bound.
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import MatchConfig, MatchRunner
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.games.rock_paper_scissors.game import RPSGame
+    from bg_ai.policies.random_policy import RandomPolicy
+    from bg_ai.replay.cursor import ReplayCursor
+    from bg_ai.replay.replayer import ReplayConfig, Replayer
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    game_config = {"actors": ["A", "B"], "max_turns": 60}
+    cfg = ReplayConfig(game_config=game_config)
+    game = BuyPlayGame()
+
+    sink = InMemoryEventSink()
+    _mid, result = MatchRunner().run_match(
+        game, sink, MatchConfig(game_config=game_config, seed=3, snapshot_every=25), agents_by_id=agents
+    )
+    events = sink.events()
+
+    cursor = ReplayCursor(game, iter(events), cfg, every=10, max_snapshots=4)
+    assert cursor.snapshot_count == 4  # bounded; oldest grid copies dropped
+    assert cursor.result_at(cursor.ticks[-1]).details == result.details
+
+    states = {t: game.snapshot_state(s) for t, s in Replayer().iter_states(game, events, cfg)}
+
+    def _check(tick):
+        cursor.applications = 0
+        assert game.snapshot_state(cursor.state_at(tick)) == states[tick]
+        return cursor.applications
+
+    assert _check(cursor.ticks[-3]) <= 10  # grid copy still cached
+    _check(cursor.ticks[57])  # its grid copy was evicted: rebuilt (and re-cached) from further back
+    assert _check(cursor.ticks[57]) <= 10
+    assert _check(cursor.ticks[5]) <= 10
+    assert cursor.snapshot_count == 4
+
+    # Before the first decision, and past the last one.
+    assert game.snapshot_state(cursor.state_at(-1)) == game.snapshot_state(game.initial_state(None, dict(game_config)))
+    assert game.snapshot_state(cursor.state_at(cursor.ticks[-1] + 5)) == states[cursor.ticks[-1]]
+
+    # Log part starting at a state_snapshot.
+    snap_at = next(i for i, e in enumerate(events) if e.type == "state_snapshot")
+    part = ReplayCursor(game, events[snap_at:], ReplayConfig(game_config=game_config, from_snapshot=True), every=10)
+    assert part.first_tick == events[snap_at].tick
+    assert game.snapshot_state(part.state_at(part.ticks[30])) == states[part.ticks[30]]
+
+    # Games without snapshot_state are copied with deepcopy.
+    rps = InMemoryEventSink()
+    rps_agents = {"A": Agent("A", RandomPolicy()), "B": Agent("B", RandomPolicy())}
+    MatchRunner().run_match(RPSGame(), rps, MatchConfig(game_config={"actors": ["A", "B"]}, seed=1), agents_by_id=rps_agents)
+    rps_cursor = ReplayCursor(RPSGame(), rps.events(), ReplayConfig(game_config={"actors": ["A", "B"]}), every=1)
+    assert rps_cursor.result_at(10**6).details == Replayer().replay(
+        RPSGame(), rps.events(), ReplayConfig(game_config={"actors": ["A", "B"]})
+    ).details
+
+
+def test_s49() -> None:
+    # S49: first tick where regenerated domain events diverge from the log (single match and bulk).
+    import tempfile
+    from pathlib import Path
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.engine.match_runner import TRACE_DECISIONS, MatchConfig, MatchRunner
+    from bg_ai.events.codecs_jsonl import export_events_jsonl
+    from bg_ai.events.model import Event
+    from bg_ai.events.sink import InMemoryEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.replay.divergence import find_divergence, find_divergences
+    from bg_ai.replay.replayer import ReplayConfig
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    game_config = {"actors": ["A", "B"], "max_turns": 8}
+    cfg = ReplayConfig(game_config=game_config)
+
+    def _matches(seeds, trace_level="full"):
+        sink = InMemoryEventSink()
+        for seed in seeds:
+            mc = MatchConfig(game_config=game_config, seed=seed, trace_level=trace_level)
+            MatchRunner().run_match(BuyPlayGame(), sink, mc, agents_by_id=agents)
+        return sink.events()
+
+    events = _matches([1])
+    assert find_divergence(BuyPlayGame(), events, cfg) is None
+
+    # Without tick_end / domain_event (decisions trace) there is nothing to compare: not checkable, not a divergence.
+    try:
+        find_divergence(BuyPlayGame(), _matches([1], TRACE_DECISIONS), cfg)
+    except ValueError as e:
+        assert "not checkable" in str(e)
+    else:
+        raise AssertionError("expected ValueError for a decisions-level trace")
+
+    class _ChangedRules(BuyPlayGame):
+        # A "rules change": resolving turn 4 and later scores one extra point for A.
+        def apply_actions(self, state, actions_by_actor, rng):
+            state, payloads = super().apply_actions(state, actions_by_actor, rng)
+            for p in payloads:
+                if p.get("type") == "turn_resolved" and p["turn"] >= 4:
+                    p["points_by_actor"] = dict(p["points_by_actor"], A=p["points_by_actor"]["A"] + 1)
+            return state, payloads
+
+    consumed = []
+
+    def _tracked(evs):
+        for e in evs:
+            consumed.append(e)
+            yield e
+
+    d = find_divergence(_ChangedRules(), _tracked(events), cfg)
+    resolved = [e for e in events if e.type == "domain_event" and e.payload["type"] == "turn_resolved"]
+    assert d is not None and d.tick == resolved[3].tick and d.phase == "RESOLVE" and d.index == 0
+    assert list(d.diff) == ["points_by_actor"]
+    assert d.diff["points_by_actor"][1]["A"] == d.diff["points_by_actor"][0]["A"] + 1
+    assert consumed[-1].type == "tick_end" and len(consumed) < len(events)  # stopped at the divergent tick
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        export_events_jsonl(root / "a.jsonl.gz", _matches(range(2, 6)))
+        bad = _matches(range(6, 9))
+        domain = [i for i, e in enumerate(bad) if e.type == "domain_event" and e.match_id == bad[-1].match_id]
+        e = bad[domain[5]]
+        bad[domain[5]] = Event(e.match_id, e.idx, e.tick, e.type, dict(e.payload, turn=99))
+        export_events_jsonl(root / "b.jsonl", bad)
+
+        targets = {BuyPlayGame().game_id: (BuyPlayGame, game_config)}
+        found = find_divergences(root, targets, workers=2)
+        assert [(Path(x.path).name, x.match_id, x.tick, x.diff) for x in found] == [
+            ("b.jsonl", e.match_id, e.tick, {"turn": [99, e.payload["turn"]]})
+        ]
+        assert found[0].to_dict()["phase"] == e.payload["phase"]
+        assert [x.to_dict() for x in find_divergences(root, targets, workers=1)] == [x.to_dict() for x in found]
+
+        lean = _matches(range(2, 4), TRACE_DECISIONS)
+        export_events_jsonl(root / "lean" / "c.jsonl", lean)
+        found = find_divergences(root / "lean", targets, workers=1)
+        assert [x.match_id for x in found] == list(dict.fromkeys(e.match_id for e in lean))
+        assert all("not checkable" in x.message and not x.diff for x in found)
+
+
+def test_s50() -> None:
+    # S50: StatsEventSink / SimConfig.stream_stats (no per-match event buffer).
+    import asyncio
+    from dataclasses import replace
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.events.sink import InMemoryEventSink, TeeEventSink
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.sim import AsyncSimRunner, SimConfig, SimRunner
+    from bg_ai.stats import InMemoryStatsStore, StatsEventSink
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    config = SimConfig(game_config={"actors": ["A", "B"], "max_turns": 5}, num_matches=8, seed=21)
+
+    def _snapshot(store):
+        return {a: (store.action_counts(a), store.record(a)) for a in ("A", "B")}
+
+    def _key(evs):
+        return [(e.idx, e.tick, e.type, e.payload) for e in evs]
+
+    buffered = InMemoryStatsStore()
+    buffered_log = InMemoryEventSink()
+    base = SimRunner().run_matches(
+        game=BuyPlayGame(), config=config, agents_by_id=agents, stats_store=buffered, stats_query=buffered,
+        event_sink=buffered_log,
+    )
+
+    streamed = InMemoryStatsStore()
+    streamed_log = InMemoryEventSink()
+    res = SimRunner().run_matches(
+        game=BuyPlayGame(), config=replace(config, stream_stats=True), agents_by_id=agents,
+        stats_store=streamed, stats_query=streamed, event_sink=streamed_log,
+    )
+    assert [r.details for r in res.match_results] == [r.details for r in base.match_results]
+    assert _snapshot(streamed) == _snapshot(buffered)
+    assert _key(streamed_log.events()) == _key(buffered_log.events())
+
+    parallel = InMemoryStatsStore()
+    SimRunner().run_matches(
+        game=BuyPlayGame(), config=replace(config, workers=2), agents_by_id=agents,
+        stats_store=parallel, stats_query=parallel,
+    )
+    assert _snapshot(parallel) == _snapshot(buffered)
+
+    async_store = InMemoryStatsStore()
+    ends = InMemoryEventSink(interest={"match_end"})
+    asyncio.run(
+        AsyncSimRunner().run_matches(
+            game=BuyPlayGame(), config=replace(config, stream_stats=True, concurrency=3), agents_by_id=agents,
+            stats_store=async_store, stats_query=async_store, event_sink=ends,
+        )
+    )
+    assert _snapshot(async_store) == _snapshot(buffered)
+    assert [e.payload["result"] for e in ends.events()] == [r.details for r in base.match_results]
+
+    # A policy reading ctx.stats decides the same with and without streaming (ADR0006 determinism):
+    # the sink applies a match's decisions only at its match_end.
+    class _LeastUsed:
+        def decide(self, ctx):
+            counts = ctx.stats.action_counts(ctx.actor_id)
+            return min(ctx.legal_actions, key=lambda a: counts.get(a.to_wire(), 0))
+
+    reading = {"A": Agent("A", _LeastUsed()), "B": agents["B"]}
+
+    def _sim(stream, concurrency=None):
+        store = InMemoryStatsStore()
+        cfg = replace(config, stream_stats=stream)
+        kwargs = dict(game=BuyPlayGame(), agents_by_id=reading, stats_store=store, stats_query=store)
+        if concurrency is None:
+            res = SimRunner().run_matches(config=cfg, **kwargs)
+        else:
+            res = asyncio.run(AsyncSimRunner().run_matches(config=replace(cfg, concurrency=concurrency), **kwargs))
+        return [r.details for r in res.match_results], _snapshot(store)
+
+    assert _sim(True) == _sim(False)
+    assert _sim(True, concurrency=3) == _sim(False, concurrency=3)
+
+    # The stats sink alone narrows what the runner builds.
+    tee = TeeEventSink(StatsEventSink(InMemoryStatsStore()), InMemoryEventSink(interest={"match_end"}))
+    assert tee.interest == frozenset({"decision_provided", "match_end"})
+
+    class _IngestOnly:
+        def ingest_match(self, *, result, events):
+            pass
+
+    try:
+        SimRunner().run_matches(
+            game=BuyPlayGame(), config=replace(config, stream_stats=True), agents_by_id=agents,
+            stats_store=_IngestOnly(), stats_query=buffered,
+        )
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("expected TypeError for a store without add_decision/add_result")
+
+
+def test_s51() -> None:
+    # S51: versioned, cached, immutable stats snapshots; MatchConfig.pin_stats.
+    import pickle
+    from dataclasses import replace
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.sim import SimConfig, SimRunner
+    from bg_ai.stats import InMemoryStatsStore, StatsSnapshot
+
+    store = InMemoryStatsStore()
+    store.add_decision("A", "BUY")
+    store.add_result({"actors": ["A", "B"], "winner": "A"})
+    v = store.version
+    snap = store.snapshot()
+    assert isinstance(snap, StatsSnapshot) and snap.version == v
+    assert store.snapshot() is snap  # cached per version
+    assert snap.action_counts("A") is snap.action_counts("A")  # no allocation per call
+    assert dict(snap.action_counts("A")) == store.action_counts("A")
+    assert dict(snap.record("B")) == store.record("B") and snap.win_rate("A") == store.win_rate("A") == 1.0
+    assert dict(snap.record("nobody")) == store.record("nobody") and snap.win_rate("nobody") == 0.0
+    try:
+        snap.action_counts("A")["BUY"] = 99  # type: ignore[index]
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("snapshot mappings must be read-only")
+
+    store.add_result({"actors": ["A", "B"], "winner": "B"})
+    assert store.version > v and store.snapshot() is not snap
+    assert snap.record("A")["total"] == 1 and store.snapshot().record("A")["total"] == 2  # old view unchanged
+
+    clone = pickle.loads(pickle.dumps(store))
+    assert clone.snapshot().records == store.snapshot().records
+    assert pickle.loads(pickle.dumps(snap)) == snap
+
+    class _Watcher:
+        # Greedy play, but remembers which stats version each decision saw.
+        def __init__(self):
+            self.inner = GreedyBuyPlayPolicy()
+            self.seen = []
+
+        def decide(self, ctx):
+            self.seen.append((ctx.match_id, ctx.stats.action_counts("B").get("BUY", 0)))
+            return self.inner.decide(ctx)
+
+    class _Writer:
+        # Conservative play that also writes to the shared store mid-match (like another process would).
+        def __init__(self, store):
+            self.inner = ConservativeBuyPlayPolicy(target_coins=2)
+            self.store = store
+
+        def decide(self, ctx):
+            self.store.add_decision("B", "BUY")
+            return self.inner.decide(ctx)
+
+    def _run(pin):
+        watcher = _Watcher()
+        s = InMemoryStatsStore()
+        agents = {"A": Agent("A", watcher), "B": Agent("B", _Writer(s))}
+        config = SimConfig(game_config={"actors": ["A", "B"], "max_turns": 5}, num_matches=3, seed=2, stream_stats=True)
+        SimRunner().run_matches(
+            game=BuyPlayGame(), config=replace(config, pin_stats=pin), agents_by_id=agents, stats_store=s, stats_query=s,
+        )
+        per_match = {}
+        for match_id, n in watcher.seen:
+            per_match.setdefault(match_id, set()).add(n)
+        return per_match
+
+    assert all(len(seen) == 1 for seen in _run(True).values())  # one view per match
+    assert any(len(seen) > 1 for seen in _run(False).values())  # live store moves mid-match
+
+
+def test_s52() -> None:
+    # S52: SQLite-backed StatsStore + StatsQuery (WAL, batched upserts, read-through cache).
+    import pickle
+    import sqlite3
+    import tempfile
+    from dataclasses import replace
+    from pathlib import Path
+
+    from bg_ai.agents.agent import Agent
+    from bg_ai.games.buy_play import BuyPlayGame, ConservativeBuyPlayPolicy, GreedyBuyPlayPolicy
+    from bg_ai.sim import SimConfig, SimRunner
+    from bg_ai.stats import InMemoryStatsStore, SqliteStatsStore
+
+    agents = {
+        "A": Agent("A", GreedyBuyPlayPolicy()),
+        "B": Agent("B", ConservativeBuyPlayPolicy(target_coins=2)),
+    }
+    config = SimConfig(game_config={"actors": ["A", "B"], "max_turns": 5}, num_matches=6, seed=30)
+
+    def _view(store):
+        return {a: (store.action_counts(a), store.record(a), store.win_rate(a)) for a in ("A", "B", "nobody")}
+
+    def _sim(store, cfg):
+        SimRunner().run_matches(game=BuyPlayGame(), config=cfg, agents_by_id=agents, stats_store=store, stats_query=store)
+
+    mem = InMemoryStatsStore()
+    _sim(mem, config)
+    expected = _view(mem)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "stats.sqlite"
+        with SqliteStatsStore(db) as store:
+            _sim(store, config)
+            assert _view(store) == expected
+        with sqlite3.connect(db) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        # Persistent: a new process/connection sees the totals; writes add up.
+        store = SqliteStatsStore(db, batch_matches=4)
+        assert _view(store) == expected
+        _sim(store, replace(config, stream_stats=True))
+        doubled = {a: ({k: 2 * n for k, n in c.items()}, {k: 2 * n for k, n in r.items()}, w)
+                   for a, (c, r, w) in expected.items()}
+        assert _view(store) == doubled  # includes the unflushed batch (6 % 4 matches)
+
+        other = SqliteStatsStore(db)
+        assert other.record("A")["total"] == 10  # only flushed batches are visible elsewhere
+        store.flush()
+        assert other.record("A")["total"] == 12  # other connection's cache is invalidated on commit
+
+        # Parallel SimRunner: workers get a reopened copy; their deltas are merged back.
+        _sim(store, replace(config, workers=2))
+        assert store.record("B")["total"] == 18 and other.record("B")["total"] == 18
+        copy = pickle.loads(pickle.dumps(store))
+        assert _view(copy) == _view(store)
+
+        snap = store.snapshot()
+        assert store.snapshot() is snap and dict(snap.action_counts("A")) == store.action_counts("A")
+        store.add_result({"actors": ["A", "B"], "winner": None})
+        assert store.snapshot() is not snap and store.snapshot().record("A")["draws"] == snap.record("A")["draws"] + 1
+
+        for s in (store, other, copy):
+            s.close()
+
+
+SLICE_TESTS: Dict[int, Callable[[], None]] = {
+    28: test_s28,
+    29: test_s29,
+    30: test_s30,
+    31: test_s31,
+    32: test_s32,
+    33: test_s33,
+    34: test_s34,
+    35: test_s35,
+    36: test_s36,
+    37: test_s37,
+    38: test_s38,
+    39: test_s39,
+    40: test_s40,
+    41: test_s41,
+    42: test_s42,
+    43: test_s43,
+    44: test_s44,
+    45: test_s45,
+    46: test_s46,
+    47: test_s47,
+    48: test_s48,
+    49: test_s49,
+    50: test_s50,
+    51: test_s51,
+    52: test_s52,
+}
+
+
+def main() -> None:
+    meta = AdrMeta(adr=ADR, starting_slice=STARTING_SLICE, last_slice=LAST_SLICE, status=STATUS)
+    run_slices(meta=meta, slice_tests=SLICE_TESTS, fail_fast=True)
+
+
+if __name__ == "__main__":
+    main()